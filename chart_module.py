@@ -1,4 +1,4 @@
-﻿import talib
+﻿from modules.ta_backend import talib
 import pandas as pd
 import plotly.graph_objects as go
 
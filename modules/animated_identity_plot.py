@@ -1,17 +1,14 @@
-from datetime import datetime
-import json, os
 import plotly.graph_objs as go
+from myth_legacy_store import load_legacy
 
 def plot_identity_evolution():
-    log_path = os.path.expandvars("$HOME\\CamboStation_QuantumOS\\modules\\myth_legacy.json")
-    if not os.path.exists(log_path):
+    logs = load_legacy()
+    if not logs:
         return go.Figure()
 
-    with open(log_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    dates = list(data.keys())
-    moods = [entry.split("'")[-2] for entry in data.values()]
+    has_quote = logs.columns["has_quote"]
+    dates = logs.columns["date"][has_quote]
+    moods = logs.columns["quoted"][has_quote]
 
     fig = go.Figure(go.Scatter(x=dates, y=moods, mode="lines+markers"))
     fig.update_layout(
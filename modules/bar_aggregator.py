@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+# Bucket width in nanoseconds for every timeframe the chart panel offers (all fixed-width,
+# so a bucket key is just floor(timestamp / width) and no calendar logic is needed)
+TIMEFRAMES = {
+    "15min": 15 * 60 * 10**9,
+    "30min": 30 * 60 * 10**9,
+    "1H": 60 * 60 * 10**9,
+    "1D": 24 * 60 * 60 * 10**9,
+}
+BASE_TIMEFRAME = "15min"
+COLUMNS = ("Date", "Open", "High", "Low", "Close", "Volume")
+
+
+def bucket_keys(dates, timeframe):
+    width = TIMEFRAMES[timeframe]
+    ns = pd.to_datetime(dates).to_numpy(dtype="datetime64[ns]").view("<i8")
+    return ns // width * width
+
+
+# 🧮 One vectorized pass: bucket boundaries from the sorted keys, then first/max/min/last/sum per segment
+# (Date stays as int64 bucket keys here; frame() turns it back into timestamps)
+def resample_bars(df, timeframe):
+    if len(df) == 0:
+        return {col: [] for col in COLUMNS}
+    keys = bucket_keys(df["Date"], timeframe)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    return {
+        "Date": keys[starts].tolist(),
+        "Open": df["Open"].to_numpy(dtype=np.float64)[starts].tolist(),
+        "High": np.maximum.reduceat(df["High"].to_numpy(dtype=np.float64), starts).tolist(),
+        "Low": np.minimum.reduceat(df["Low"].to_numpy(dtype=np.float64), starts).tolist(),
+        "Close": df["Close"].to_numpy(dtype=np.float64)[ends].tolist(),
+        "Volume": np.add.reduceat(df["Volume"].to_numpy(dtype=np.float64), starts).tolist(),
+    }
+
+
+# ──────────────────────────────────────────────────────
+# Aggregator: every timeframe built once from the base bars, then each new
+# base bar only touches the last bucket of each timeframe
+# ──────────────────────────────────────────────────────
+class BarAggregator:
+    def __init__(self, timeframes=tuple(TIMEFRAMES)):
+        self.timeframes = [tf for tf in timeframes if tf in TIMEFRAMES]
+        self.bars = {}
+        self.frames = {}
+        self.length = 0
+        self.last_date = None
+
+    def batch(self, df):
+        self.bars = {tf: resample_bars(df, tf) for tf in self.timeframes}
+        self.frames = {}
+        self.length = len(df)
+        self.last_date = df["Date"].iat[-1] if len(df) else None
+        return self
+
+    # O(1) per timeframe: extend the open bucket or start a new one
+    def append(self, bar):
+        ns = pd.Timestamp(bar["Date"]).value
+        high, low = float(bar["High"]), float(bar["Low"])
+        close, volume = float(bar["Close"]), float(bar["Volume"])
+        for tf in self.timeframes:
+            width = TIMEFRAMES[tf]
+            key = ns // width * width
+            cols = self.bars[tf]
+            if cols["Date"] and cols["Date"][-1] == key:
+                cols["High"][-1] = max(cols["High"][-1], high)
+                cols["Low"][-1] = min(cols["Low"][-1], low)
+                cols["Close"][-1] = close
+                cols["Volume"][-1] += volume
+            else:
+                for col, value in zip(COLUMNS, (key, float(bar["Open"]), high, low, close, volume)):
+                    cols[col].append(value)
+        self.frames = {}
+        self.length += 1
+        self.last_date = bar["Date"]
+
+    # Bring every timeframe level with the base bars: append unseen bars, full batch if history changed
+    def sync(self, df):
+        n = self.length
+        if n == 0 or len(df) < n or df["Date"].iat[n - 1] != self.last_date:
+            return self.batch(df)
+        for bar in df.iloc[n:].to_dict("records"):
+            self.append(bar)
+        return self
+
+    # Cached per timeframe, so flipping the selector is a dict lookup until a new bar lands
+    def frame(self, timeframe):
+        if timeframe not in self.frames:
+            cols = self.bars[timeframe]
+            df = pd.DataFrame({col: cols[col] for col in COLUMNS})
+            df["Date"] = pd.to_datetime(df["Date"], unit="ns")
+            self.frames[timeframe] = df
+        return self.frames[timeframe].copy()
+
+
+if __name__ == "__main__":
+    import time
+    from modules.market_data_store import simulate_ohlcv
+
+    base = simulate_ohlcv("BENCH", bars=96 * 500, timeframe=BASE_TIMEFRAME)
+    t0 = time.perf_counter()
+    agg = BarAggregator().batch(base.iloc[:-96])
+    t1 = time.perf_counter()
+    agg.sync(base)
+    t2 = time.perf_counter()
+    for tf in agg.timeframes:
+        ref = base.resample(pd.Timedelta(TIMEFRAMES[tf]), on="Date").agg(
+            {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}).dropna()
+        got = agg.frame(tf).set_index("Date")
+        print(f"{tf:>6}: {len(got):>6} bars  matches pandas resample: {np.allclose(ref.to_numpy(), got.to_numpy())}")
+    print(f"batch {len(base) - 96} base bars: {(t1 - t0) * 1000:.1f} ms  |  "
+          f"append 96 bars: {(t2 - t1) / 96 * 1e6:.1f} µs/bar")
@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+
+# 📋 Pattern + rating codes (pattern order = priority of the original if/elif chain)
+PATTERN_NAMES = ["Bullish Engulfing", "Bearish Engulfing", "Doji", "Hammer", "Shooting Star"]
+RATING_NAMES = ["Weak", "Moderate", "Strong", "Neutral"]
+
+BULL_ENGULF, BEAR_ENGULF, DOJI, HAMMER, SHOOTING_STAR = range(len(PATTERN_NAMES))
+WEAK, MODERATE, STRONG, NEUTRAL = range(len(RATING_NAMES))
+
+
+# 🧮 Pull OHLC columns out of a frame as contiguous float64 arrays
+def ohlc_arrays(df, columns=("Open", "High", "Low", "Close")):
+    return tuple(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in columns)
+
+
+# ⏪ Previous-bar view of an array (first slot has no predecessor → NaN)
+def shift(arr, periods=1):
+    out = np.empty_like(arr)
+    out[:periods] = np.nan
+    out[periods:] = arr[:-periods]
+    return out
+
+
+# 🔍 Whole-array masks for the five reversal patterns
+def candle_masks(o, h, l, c):
+    prev_o, prev_c = shift(o), shift(c)
+    body = np.abs(c - o)
+    range_ = h - l
+
+    with np.errstate(invalid="ignore"):
+        masks = [
+            (c > o) & (prev_c < prev_o) & (c > prev_o) & (o < prev_c),
+            (c < o) & (prev_c > prev_o) & (c < prev_o) & (o > prev_c),
+            (body < 0.15) & (range_ > 1),
+            (body < 1) & (o - l > body * 2) & (c > o),
+            (body < 1) & (h - c > body * 2) & (c < o),
+        ]
+
+    # The bar-by-bar scan always started at the second bar
+    for mask in masks:
+        mask[:1] = False
+    return masks, body
+
+
+# ⚡ One label per bar, first matching pattern wins — returns (bar index, pattern code, rating code)
+def scan_candles(o, h, l, c):
+    masks, body = candle_masks(o, h, l, c)
+    hit = np.select(masks, np.arange(len(masks), dtype=np.int8), default=-1)
+
+    idx = np.flatnonzero(hit >= 0)
+    codes = hit[idx]
+    engulfing_rating = np.where(body[idx] > 1, STRONG, MODERATE)
+    ratings = np.where(codes <= BEAR_ENGULF, engulfing_rating, np.where(codes == DOJI, NEUTRAL, MODERATE))
+    return idx, codes, ratings.astype(np.int8)
+
+
+# 📊 Compact result table: one row per detected bar
+def detect_patterns_table(df, date_col="Date"):
+    idx, codes, ratings = scan_candles(*ohlc_arrays(df))
+    return pd.DataFrame({
+        "Index": idx,
+        "Date": df[date_col].to_numpy()[idx],
+        "Pattern": pd.Categorical.from_codes(codes, PATTERN_NAMES),
+        "Rating": pd.Categorical.from_codes(ratings, RATING_NAMES),
+    })
+
+
+# ─────────────────────────────────────────────
+# Pattern library — declarative rules over shifted OHLC arrays
+# ─────────────────────────────────────────────
+
+# Bars averaged for the "long"/"small" body baselines and bars looked back for trend
+BODY_LOOKBACK = 10
+TREND_LOOKBACK = 5
+
+
+def _rolling_prior_mean(arr, window):
+    # Mean of the `window` bars before each bar (NaN until enough history)
+    csum = np.concatenate(([0.0], np.cumsum(arr)))
+    out = np.full(len(arr), np.nan)
+    if len(arr) > window:
+        out[window:] = (csum[window:-1] - csum[:-window - 1]) / window
+    return out
+
+
+# 🧱 Intermediate arrays shared by every rule. Name suffix = bars back ("o1" = previous open).
+FEATURES = {
+    "body": lambda f: np.abs(f["c"] - f["o"]),
+    "range": lambda f: f["h"] - f["l"],
+    "top": lambda f: np.maximum(f["o"], f["c"]),
+    "bottom": lambda f: np.minimum(f["o"], f["c"]),
+    "upper": lambda f: f["h"] - f["top"],
+    "lower": lambda f: f["bottom"] - f["l"],
+    "mid": lambda f: (f["o"] + f["c"]) / 2,
+    "bull": lambda f: f["c"] > f["o"],
+    "bear": lambda f: f["c"] < f["o"],
+    "avg_body": lambda f: _rolling_prior_mean(f["body"], BODY_LOOKBACK),
+    "avg_range": lambda f: _rolling_prior_mean(f["range"], BODY_LOOKBACK),
+    "long": lambda f: f["body"] > f["avg_body"],
+    "small": lambda f: f["body"] < 0.5 * f["avg_body"],
+    "rising": lambda f: f["c"] > shift(f["c"], TREND_LOOKBACK),
+    "falling": lambda f: f["c"] < shift(f["c"], TREND_LOOKBACK),
+}
+
+
+# 🗃️ Lazy per-evaluation cache: every feature is computed on first use and reused by all rules
+class CandleFrame(dict):
+    def __init__(self, o, h, l, c):
+        super().__init__(o=o, h=h, l=l, c=c)
+
+    def __missing__(self, key):
+        name, lag = key.rstrip("0123456789"), key[len(key.rstrip("0123456789")):]
+        if lag:
+            base = self[name]
+            value = shift(base.astype(np.float64), int(lag))
+            if base.dtype == bool:
+                value = value == 1.0
+        elif name in FEATURES:
+            value = FEATURES[name](self)
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+
+# 📚 name → {"bars": pattern length, "type": bull/bear/neutral, "rule": f → bool mask}
+PATTERN_LIBRARY = {}
+
+
+def register_pattern(name, bars, kind, rule):
+    PATTERN_LIBRARY[name] = {"bars": bars, "type": kind, "rule": rule}
+
+
+# 🕯️ Single-bar patterns
+register_pattern("Doji", 1, "neutral",
+                 lambda f: (f["range"] > 0) & (f["body"] <= 0.1 * f["range"]))
+register_pattern("Spinning Top", 1, "neutral",
+                 lambda f: (f["body"] > 0.1 * f["range"]) & (f["body"] <= 0.3 * f["range"])
+                 & (f["upper"] > f["body"]) & (f["lower"] > f["body"]))
+register_pattern("Hammer", 1, "bull",
+                 lambda f: (f["lower"] >= 2 * f["body"]) & (f["upper"] <= 0.1 * f["range"])
+                 & (f["body"] > 0) & f["falling1"])
+register_pattern("Hanging Man", 1, "bear",
+                 lambda f: (f["lower"] >= 2 * f["body"]) & (f["upper"] <= 0.1 * f["range"])
+                 & (f["body"] > 0) & f["rising1"])
+register_pattern("Inverted Hammer", 1, "bull",
+                 lambda f: (f["upper"] >= 2 * f["body"]) & (f["lower"] <= 0.1 * f["range"])
+                 & (f["body"] > 0) & f["falling1"])
+register_pattern("Shooting Star", 1, "bear",
+                 lambda f: (f["upper"] >= 2 * f["body"]) & (f["lower"] <= 0.1 * f["range"])
+                 & (f["body"] > 0) & f["rising1"])
+register_pattern("Bullish Marubozu", 1, "bull",
+                 lambda f: f["bull"] & f["long"] & (f["body"] >= 0.95 * f["range"]))
+register_pattern("Bearish Marubozu", 1, "bear",
+                 lambda f: f["bear"] & f["long"] & (f["body"] >= 0.95 * f["range"]))
+
+# 🕯️🕯️ Two-bar patterns
+register_pattern("Bullish Engulfing", 2, "bull",
+                 lambda f: f["bear1"] & f["bull"] & (f["o"] <= f["c1"]) & (f["c"] >= f["o1"])
+                 & (f["body"] > f["body1"]))
+register_pattern("Bearish Engulfing", 2, "bear",
+                 lambda f: f["bull1"] & f["bear"] & (f["o"] >= f["c1"]) & (f["c"] <= f["o1"])
+                 & (f["body"] > f["body1"]))
+register_pattern("Bullish Harami", 2, "bull",
+                 lambda f: f["bear1"] & f["long1"] & f["bull"]
+                 & (f["top"] < f["top1"]) & (f["bottom"] > f["bottom1"]))
+register_pattern("Bearish Harami", 2, "bear",
+                 lambda f: f["bull1"] & f["long1"] & f["bear"]
+                 & (f["top"] < f["top1"]) & (f["bottom"] > f["bottom1"]))
+register_pattern("Tweezer Top", 2, "bear",
+                 lambda f: f["rising2"] & f["bull1"] & f["bear"]
+                 & (np.abs(f["h"] - f["h1"]) <= 0.05 * f["avg_range"]))
+register_pattern("Tweezer Bottom", 2, "bull",
+                 lambda f: f["falling2"] & f["bear1"] & f["bull"]
+                 & (np.abs(f["l"] - f["l1"]) <= 0.05 * f["avg_range"]))
+register_pattern("Piercing Line", 2, "bull",
+                 lambda f: f["bear1"] & f["long1"] & f["bull"] & (f["o"] < f["c1"])
+                 & (f["c"] > f["mid1"]) & (f["c"] < f["o1"]))
+register_pattern("Dark Cloud Cover", 2, "bear",
+                 lambda f: f["bull1"] & f["long1"] & f["bear"] & (f["o"] > f["c1"])
+                 & (f["c"] < f["mid1"]) & (f["c"] > f["o1"]))
+
+# 🕯️🕯️🕯️ Three-bar patterns
+register_pattern("Morning Star", 3, "bull",
+                 lambda f: f["bear2"] & f["long2"] & f["small1"] & (f["top1"] < f["mid2"])
+                 & f["bull"] & (f["c"] > f["mid2"]))
+register_pattern("Evening Star", 3, "bear",
+                 lambda f: f["bull2"] & f["long2"] & f["small1"] & (f["bottom1"] > f["mid2"])
+                 & f["bear"] & (f["c"] < f["mid2"]))
+register_pattern("Three White Soldiers", 3, "bull",
+                 lambda f: f["bull2"] & f["bull1"] & f["bull"]
+                 & (f["c1"] > f["c2"]) & (f["c"] > f["c1"])
+                 & (f["o1"] > f["o2"]) & (f["o1"] < f["c2"]) & (f["o"] > f["o1"]) & (f["o"] < f["c1"])
+                 & (f["upper"] <= 0.3 * f["body"]) & (f["upper1"] <= 0.3 * f["body1"]))
+register_pattern("Three Black Crows", 3, "bear",
+                 lambda f: f["bear2"] & f["bear1"] & f["bear"]
+                 & (f["c1"] < f["c2"]) & (f["c"] < f["c1"])
+                 & (f["o1"] < f["o2"]) & (f["o1"] > f["c2"]) & (f["o"] < f["o1"]) & (f["o"] > f["c1"])
+                 & (f["lower"] <= 0.3 * f["body"]) & (f["lower1"] <= 0.3 * f["body1"]))
+
+
+# ⚡ Evaluate any subset of the library in one pass over shared arrays → {name: bool mask}
+def evaluate_patterns(o, h, l, c, names=None):
+    frame = CandleFrame(o, h, l, c)
+    masks = {}
+    with np.errstate(invalid="ignore"):
+        for name in names or PATTERN_LIBRARY:
+            spec = PATTERN_LIBRARY[name]
+            mask = np.array(spec["rule"](frame), dtype=bool)
+            mask[:spec["bars"] - 1] = False
+            masks[name] = mask
+    return masks
+
+
+# 📊 Long-form library hits: one row per (bar, pattern), sorted by bar
+def library_table(df, names=None, date_col="Date"):
+    masks = evaluate_patterns(*ohlc_arrays(df), names=names)
+    labels = list(masks)
+    hits = [np.flatnonzero(mask) for mask in masks.values()]
+    idx = np.concatenate(hits) if hits else np.empty(0, dtype=np.int64)
+    codes = np.repeat(np.arange(len(labels)), [len(h) for h in hits])
+    order = np.argsort(idx, kind="stable")
+    idx, codes = idx[order], codes[order]
+    kinds = np.array([PATTERN_LIBRARY[name]["type"] for name in labels], dtype=object)
+    return pd.DataFrame({
+        "Index": idx,
+        "Date": df[date_col].to_numpy()[idx],
+        "Pattern": pd.Categorical.from_codes(codes, labels),
+        "Type": kinds[codes],
+    })
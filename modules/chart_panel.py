@@ -1,50 +1,28 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.graph_objs as go
-from datetime import datetime
+from modules.indicator_engine import IndicatorEngine
+from modules.market_data_store import load_ohlc
+from modules.bar_aggregator import BarAggregator, BASE_TIMEFRAME
 
 # ──────────────────────────────────────────────────────
-# Simulated data generator (placeholder for live APIs)
+# Price data from the shared OHLCV store (simulated until a live feed writes to it)
 # ──────────────────────────────────────────────────────
 def generate_price_data(days=100, ticker="AAPL"):
-    np.random.seed(len(ticker))
-    price = 100 + np.cumsum(np.random.randn(days))
-    date_range = pd.date_range(end=datetime.today(), periods=days, freq='B')
-    df = pd.DataFrame({
-        'Date': date_range,
-        'Open': price + np.random.uniform(-1, 1, days),
-        'High': price + np.random.uniform(0, 2, days),
-        'Low': price - np.random.uniform(0, 2, days),
-        'Close': price + np.random.uniform(-1, 1, days),
-        'Volume': np.random.randint(1000000, 5000000, days)
-    })
-    return df
+    return load_ohlc(ticker, "1D", bars=days, simulate=True)
+
+# Finest bars for the timeframe selector: every higher timeframe is aggregated from these
+BASE_BARS_PER_DAY = 96
+
+def generate_base_data(days=100, ticker="AAPL"):
+    return load_ohlc(ticker, BASE_TIMEFRAME, bars=days * BASE_BARS_PER_DAY, simulate=True)
 
 # ──────────────────────────────────────────────────────
 # Indicator overlays
 # ──────────────────────────────────────────────────────
-def add_indicators(df, indicators):
-    if "SMA" in indicators:
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    if "EMA" in indicators:
-        df['EMA_20'] = df['Close'].ewm(span=20).mean()
-    if "RSI" in indicators:
-        delta = df['Close'].diff()
-        gain = delta.clip(lower=0)
-        loss = -1 * delta.clip(upper=0)
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        rs = avg_gain / avg_loss
-        df['RSI'] = 100 - (100 / (1 + rs))
-    if "Bollinger" in indicators:
-        df['BB_MID'] = df['Close'].rolling(window=20).mean()
-        df['BB_STD'] = df['Close'].rolling(window=20).std()
-        df['BB_UPPER'] = df['BB_MID'] + 2 * df['BB_STD']
-        df['BB_LOWER'] = df['BB_MID'] - 2 * df['BB_STD']
-    if "VWAP" in indicators:
-        df['VWAP'] = (df['Close'] * df['Volume']).cumsum() / df['Volume'].cumsum()
-    return df
+def add_indicators(df, indicators, engine=None):
+    # Stateful engine: full batch on first sight, O(1) per bar for anything appended since
+    engine = engine or IndicatorEngine(indicators)
+    return engine.sync(df)
 
 # ──────────────────────────────────────────────────────
 # Chart builder with platform style logic
@@ -93,12 +71,22 @@ def render_chart_tab():
     with col2:
         style = st.selectbox("Chart Style", ["TradingView", "TrendSpider", "ThinkOrSwim", "TC2000", "Line", "Bar"])
     with col3:
-        timeframe = st.selectbox("Timeframe (Simulated)", ["1D", "1H", "30min", "15min"])
+        timeframe = st.selectbox("Timeframe", ["1D", "1H", "30min", "15min"])
 
     st.markdown("---")
     indicators = st.multiselect("🧩 Select Indicators to Overlay", ["SMA", "EMA", "RSI", "Bollinger", "VWAP"])
-    df = generate_price_data(days=150, ticker=ticker)
-    df = add_indicators(df, indicators)
+
+    # 🕒 All timeframes built once per ticker from the base bars; new bars only touch the last bucket
+    aggregator_key = f"bar_aggregator::{ticker}"
+    if aggregator_key not in st.session_state:
+        st.session_state[aggregator_key] = BarAggregator()
+    aggregator = st.session_state[aggregator_key].sync(generate_base_data(days=150, ticker=ticker))
+    df = aggregator.frame(timeframe)
+
+    engine_key = f"indicator_engine::{ticker}::{timeframe}::{'|'.join(indicators)}"
+    if engine_key not in st.session_state:
+        st.session_state[engine_key] = IndicatorEngine(indicators)
+    df = add_indicators(df, indicators, engine=st.session_state[engine_key]).tail(150)
 
     chart = render_chart(df, style, indicators)
     st.plotly_chart(chart, use_container_width=True)
@@ -3,7 +3,10 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objs as go
 from datetime import datetime
-from modules.pattern_logbook import log_pattern
+from modules.pattern_logbook import logbook_writer
+from modules.chart_pattern_engine import detect_structures
+from modules.market_data_store import load_ohlc
+from modules.fusion_engine import fusion_engine
 
 # ───────────────
 # Pattern Color Map
@@ -32,38 +35,28 @@ chart_patterns_available = list(pattern_color_map.keys())
 selected_chart_patterns = st.sidebar.multiselect("Select Patterns", chart_patterns_available, default=chart_patterns_available)
 
 # ───────────────
-# Price Generator
+# Price Data (shared OHLCV store)
 # ───────────────
 def generate_price_data(days=150):
-    np.random.seed(42)
-    base = 100 + np.cumsum(np.random.randn(days))
-    date_range = pd.date_range(end=datetime.today(), periods=days, freq='B')
-    df = pd.DataFrame({
-        'Date': date_range,
-        'Close': base + np.random.uniform(-1, 1, days)
-    })
-    df["Open"] = df["Close"] + np.random.uniform(-1, 1, days)
-    df["High"] = df[["Open", "Close"]].max(axis=1) + np.random.uniform(0, 2, days)
-    df["Low"] = df[["Open", "Close"]].min(axis=1) - np.random.uniform(0, 2, days)
-    return df
+    return load_ohlc("CAMBO", "1D", bars=days, simulate=True)
 
 # ───────────────
-# Pattern Detection Engine
+# Pattern Detection Engine (zigzag pivots → geometric matchers)
 # ───────────────
-def detect_chart_patterns(df):
-    detected = []
-    dates = df["Date"].values
-    for i, pattern in enumerate(selected_chart_patterns):
-        idx = (i + 1) * 10
-        if idx < len(dates):
-            detected.append((dates[idx], pattern))
-            log_pattern(pattern, dates[idx], None, f"Detected {pattern} structure")
+def detect_chart_patterns(df, asset="CAMBO"):
+    structures = detect_structures(df, names=selected_chart_patterns)
+    detected = list(zip(structures["Date"].to_numpy(), structures["Pattern"]))
+    with logbook_writer:  # one SQLite transaction for the whole scan
+        for date, pattern in detected:
+            logbook_writer.add(pattern, date, None, f"Detected {pattern} structure")
+    # Latest structure feeds the pattern stream under the same key the voting stream uses for this asset
+    fusion_engine.publish_latest_pattern(asset, detected)
     return detected
-def render_chart_pattern_tab():
+def render_chart_pattern_tab(asset="CAMBO"):
     st.subheader("📐 Structure Scanner — Expanded Patterns")
 
     df = generate_price_data(150)
-    detected_patterns = detect_chart_patterns(df) if auto_detect_chart_patterns else []
+    detected_patterns = detect_chart_patterns(df, asset) if auto_detect_chart_patterns else []
 
     fig = go.Figure()
     fig.add_trace(go.Candlestick(
@@ -0,0 +1,192 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Minimum reversal (fraction of price) for a swing to become a pivot
+PIVOT_THRESHOLD = 0.03
+# Relative tolerance for "equal" levels and "flat" trendlines
+PRICE_TOL = 0.02
+# Minimum bars from rim to rim for a Cup & Handle
+MIN_CUP_BARS = 20
+
+HIGH, LOW = 1, -1
+
+# Pattern names match chart_pattern_detector.pattern_color_map / strategy_linker
+SIX_PIVOT_PATTERNS = [
+    "Head & Shoulders", "Triple Top", "Triple Bottom",
+    "Ascending Triangle", "Descending Triangle",
+    "Rising Wedge", "Falling Wedge", "Flag", "Rectangle",
+]
+FOUR_PIVOT_PATTERNS = ["Double Top", "Double Bottom", "Cup & Handle"]
+
+
+# ─────────────────────────────────────────────
+# O(n) zigzag pivot extractor
+# ─────────────────────────────────────────────
+def zigzag_pivots(high, low, threshold=PIVOT_THRESHOLD):
+    hi, lo = np.asarray(high, dtype=np.float64).tolist(), np.asarray(low, dtype=np.float64).tolist()
+    idx, price, kind = [], [], []
+    if not hi:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=np.int8)
+
+    up, down = 1 + threshold, 1 - threshold
+    trend = 0
+    hi_i, hi_p, lo_i, lo_p = 0, hi[0], 0, lo[0]
+
+    for i in range(1, len(hi)):
+        h, l = hi[i], lo[i]
+        if trend >= 0 and h > hi_p:
+            hi_i, hi_p = i, h
+        if trend <= 0 and l < lo_p:
+            lo_i, lo_p = i, l
+
+        if trend >= 0 and l <= hi_p * down and hi_i < i:
+            # Swing high confirmed; start tracking a new low
+            if trend == 0 and lo_i < hi_i:
+                idx.append(lo_i); price.append(lo_p); kind.append(LOW)
+            idx.append(hi_i); price.append(hi_p); kind.append(HIGH)
+            trend, lo_i, lo_p = -1, i, l
+        elif trend <= 0 and h >= lo_p * up and lo_i < i:
+            if trend == 0 and hi_i < lo_i:
+                idx.append(hi_i); price.append(hi_p); kind.append(HIGH)
+            idx.append(lo_i); price.append(lo_p); kind.append(LOW)
+            trend, hi_i, hi_p = 1, i, h
+
+    # Trailing extreme is the (unconfirmed) last pivot
+    if trend == 1:
+        idx.append(hi_i); price.append(hi_p); kind.append(HIGH)
+    elif trend == -1:
+        idx.append(lo_i); price.append(lo_p); kind.append(LOW)
+
+    return np.array(idx, dtype=np.int64), np.array(price), np.array(kind, dtype=np.int8)
+
+
+# ─────────────────────────────────────────────
+# Geometric matchers over sliding pivot windows
+# ─────────────────────────────────────────────
+def _windows(arr, size):
+    if len(arr) < size:
+        return np.empty((0, size), dtype=arr.dtype)
+    return sliding_window_view(arr, size)
+
+
+def _rel_diff(a, b):
+    return np.abs(a - b) / ((a + b) / 2)
+
+
+def _rel_slope(x, y, span, level):
+    # Least-squares slope of a trendline, expressed as relative price change over the window
+    mx, my = x.mean(axis=1, keepdims=True), y.mean(axis=1, keepdims=True)
+    slope = ((x - mx) * (y - my)).sum(axis=1) / ((x - mx) ** 2).sum(axis=1)
+    return slope * span / level
+
+
+def _six_pivot_codes(idx, price, kind, tol):
+    w, x = _windows(price, 6), _windows(idx, 6).astype(np.float64)
+    if not len(w):
+        return np.empty(0, dtype=np.int64)
+
+    starts_high = _windows(kind, 6)[:, :1] == HIGH
+    hi_cols = np.where(starts_high, [0, 2, 4], [1, 3, 5])
+    lo_cols = np.where(starts_high, [1, 3, 5], [0, 2, 4])
+    hy, hx = np.take_along_axis(w, hi_cols, 1), np.take_along_axis(x, hi_cols, 1)
+    ly, lx = np.take_along_axis(w, lo_cols, 1), np.take_along_axis(x, lo_cols, 1)
+    starts_high = starts_high[:, 0]
+
+    level = w.mean(axis=1)
+    span = x[:, -1] - x[:, 0]
+    sh, sl = _rel_slope(hx, hy, span, level), _rel_slope(lx, ly, span, level)
+    flat_h, flat_l = np.abs(sh) <= tol, np.abs(sl) <= tol
+    height = (hy.mean(axis=1) - ly.mean(axis=1)) / level
+
+    # Pole into the window = move from the pivot before it to the window's first pivot
+    prev = np.concatenate(([np.nan], price[:-1]))[:len(w)]
+    pole = (w[:, 0] - prev) / level
+
+    with np.errstate(invalid="ignore"):
+        masks = [
+            # L H L H L H: head clears both shoulders, shoulders and neckline level
+            ~starts_high & (hy[:, 1] > np.maximum(hy[:, 0], hy[:, 2]) * (1 + tol))
+            & (_rel_diff(hy[:, 0], hy[:, 2]) <= 2 * tol) & (_rel_diff(ly[:, 1], ly[:, 2]) <= 2 * tol),
+            # Three equal highs after an advance
+            ~starts_high & ((hy.max(axis=1) - hy.min(axis=1)) / level <= tol)
+            & (ly[:, 0] < ly[:, 1:].min(axis=1)) & (height >= 2 * tol),
+            # Three equal lows after a decline
+            starts_high & ((ly.max(axis=1) - ly.min(axis=1)) / level <= tol)
+            & (hy[:, 0] > hy[:, 1:].max(axis=1)) & (height >= 2 * tol),
+            flat_h & (sl > tol),
+            (sh < -tol) & flat_l,
+            (sh > tol) & (sl > sh + tol / 2),
+            (sl < -tol) & (sh < sl - tol / 2),
+            # Parallel channel drifting against a pole at least twice its height
+            (np.abs(sh - sl) <= tol / 2) & ~flat_h & (np.abs(pole) >= 2 * height) & (np.sign(pole) == -np.sign(sh)),
+            flat_h & flat_l,
+        ]
+    return np.select(masks, np.arange(len(masks)), default=-1)
+
+
+def _four_pivot_codes(idx, price, kind, tol, min_cup_bars):
+    w, x = _windows(price, 4), _windows(idx, 4)
+    if not len(w):
+        return np.empty(0, dtype=np.int64)
+
+    starts_high = _windows(kind, 4)[:, 0] == HIGH
+    cup_width = x[:, 2] - x[:, 0]
+    cup_depth = (np.minimum(w[:, 0], w[:, 2]) - w[:, 1]) / w[:, 0]
+
+    masks = [
+        # L H L H: equal highs after an advance with a real trough between
+        ~starts_high & (_rel_diff(w[:, 1], w[:, 3]) <= tol) & (w[:, 0] < w[:, 2])
+        & ((np.minimum(w[:, 1], w[:, 3]) - w[:, 2]) / w[:, 2] >= 2 * tol),
+        # H L H L: equal lows after a decline with a real peak between
+        starts_high & (_rel_diff(w[:, 1], w[:, 3]) <= tol) & (w[:, 0] > w[:, 2])
+        & ((w[:, 2] - np.maximum(w[:, 1], w[:, 3])) / w[:, 2] >= 2 * tol),
+        # H L H L: level rims, centred 12–50% cup, shallow and short handle
+        starts_high & (_rel_diff(w[:, 0], w[:, 2]) <= 2 * tol)
+        & (cup_depth >= 0.12) & (cup_depth <= 0.5) & (cup_width >= min_cup_bars)
+        & (np.abs((x[:, 1] - x[:, 0]) / np.maximum(cup_width, 1) - 0.5) <= 0.25)
+        & ((w[:, 2] - w[:, 3]) <= (w[:, 2] - w[:, 1]) / 2)
+        & ((x[:, 3] - x[:, 2]) * 3 <= cup_width),
+    ]
+    return np.select(masks, np.arange(len(masks)), default=-1)
+
+
+def _collect(codes, idx, size, names):
+    # A structure spanning several consecutive windows is reported once, at its first match
+    fresh = (codes >= 0) & (codes != np.concatenate(([-1], codes[:-1])))
+    j = np.flatnonzero(fresh)
+    return idx[j], idx[j + size - 1], np.asarray(names, dtype=object)[codes[j]]
+
+
+# ⚡ Array-level scan → (start bar, end bar, pattern name) arrays, ordered by end bar
+def scan_structures(high, low, names=None, threshold=PIVOT_THRESHOLD, tol=PRICE_TOL,
+                    min_cup_bars=MIN_CUP_BARS):
+    idx, price, kind = zigzag_pivots(high, low, threshold)
+
+    parts = [
+        _collect(_six_pivot_codes(idx, price, kind, tol), idx, 6, SIX_PIVOT_PATTERNS),
+        _collect(_four_pivot_codes(idx, price, kind, tol, min_cup_bars), idx, 4, FOUR_PIVOT_PATTERNS),
+    ]
+    start = np.concatenate([p[0] for p in parts])
+    end = np.concatenate([p[1] for p in parts])
+    pattern = np.concatenate([p[2] for p in parts])
+
+    if names is not None:
+        keep = np.isin(pattern, list(names))
+        start, end, pattern = start[keep], end[keep], pattern[keep]
+
+    order = np.argsort(end, kind="stable")
+    return start[order], end[order], pattern[order]
+
+
+# 📐 Pivot-driven chart pattern table: one row per structure, dated at its last pivot
+def detect_structures(df, names=None, threshold=PIVOT_THRESHOLD, tol=PRICE_TOL,
+                      min_cup_bars=MIN_CUP_BARS, date_col="Date"):
+    start, end, pattern = scan_structures(df["High"].to_numpy(), df["Low"].to_numpy(),
+                                          names, threshold, tol, min_cup_bars)
+    return pd.DataFrame({
+        "Start": start,
+        "End": end,
+        "Date": df[date_col].to_numpy()[end],
+        "Pattern": pattern,
+    })
@@ -1,23 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.graph_objs as go
-from datetime import datetime
+from modules.market_data_store import load_ohlc
 
-# Generate price + volume data
+# Price + volume data from the shared OHLCV store
 def generate_chart_data(days=150):
-    np.random.seed(42)
-    base = 100 + np.cumsum(np.random.randn(days))
-    date_range = pd.date_range(end=datetime.today(), periods=days, freq='B')
-    df = pd.DataFrame({
-        'Date': date_range,
-        'Open': base + np.random.uniform(-1, 1, days),
-        'High': base + np.random.uniform(0, 2, days),
-        'Low': base - np.random.uniform(0, 2, days),
-        'Close': base + np.random.uniform(-1, 1, days),
-        'Volume': np.random.randint(500000, 5000000, days)
-    })
-    return df
+    return load_ohlc("CAMBO", "1D", bars=days, simulate=True)
 
 # Render the chart tab
 def render_chart_tab():
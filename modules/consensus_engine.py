@@ -0,0 +1,127 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+# ─────────────────────────────────────────────
+# Consensus engine: an (assets × engines) matrix of signal codes and
+# confidences → majority, weighted confidence and agreement for every
+# asset in one NumPy pass. Code -1 = engine had no (valid) vote.
+# ─────────────────────────────────────────────
+SIGNALS = ("buy", "sell", "neutral")  # last label doubles as the abstain answer
+
+# Which weight_config slider an engine answers to; AI engines form the voting block. The sliders
+# only move a vote when more than one block is in the matrix (render_voting adds the pattern /
+# sentiment streams) — within one block the shared factor cancels
+ENGINE_SOURCES = {
+    "sentiment": "sentiment", "sentiment_grid": "sentiment",
+    "pattern": "pattern", "pattern_engine": "pattern",
+}
+DEFAULT_WEIGHTS = {"voting": 0.6, "sentiment": 0.2, "pattern": 0.2}
+
+
+def encode_signals(signals, labels=SIGNALS):
+    lookup = {label.lower(): i for i, label in enumerate(labels)}
+    flat = pd.Series(np.asarray(signals, dtype=object).ravel(), dtype=object)
+    codes = flat.str.lower().map(lookup).fillna(-1).to_numpy(dtype=np.int8)
+    return codes.reshape(np.shape(signals))
+
+
+# {asset: {engine: {"signal": ..., "confidence": ...}}} → (assets, engines, codes[A, E], conf[A, E])
+def vote_matrix(engine_signals, labels=SIGNALS):
+    assets = list(engine_signals)
+    engines = list(dict.fromkeys(e for votes in engine_signals.values() for e in votes))
+    col = {e: j for j, e in enumerate(engines)}
+    signals = np.full((len(assets), len(engines)), None, dtype=object)
+    conf = np.full(signals.shape, np.nan)
+    for i, votes in enumerate(engine_signals.values()):
+        for engine, vote in votes.items():
+            signals[i, col[engine]] = vote["signal"]
+            conf[i, col[engine]] = vote.get("confidence", np.nan)
+    return assets, engines, encode_signals(signals, labels), conf
+
+
+# Slider weights (voting / sentiment / pattern) → one weight per engine column,
+# each source's share split across the engines that belong to it — evenly, or in
+# proportion to `scales` ({engine: multiplier}, e.g. learned voter weights)
+def engine_weights(engines, weights=None, scales=None):
+    weights, scales = weights or DEFAULT_WEIGHTS, scales or {}
+    sources = [ENGINE_SOURCES.get(e, "voting") for e in engines]
+    scale = [float(scales.get(e, 1.0)) for e in engines]
+    per_source = Counter()
+    for s, k in zip(sources, scale):
+        per_source[s] += k
+    return np.array([weights.get(s, 0.0) * k / (per_source[s] or 1.0) for s, k in zip(sources, scale)],
+                    dtype=np.float64)
+
+
+def strength_labels(confidence):
+    return np.select([confidence > 0.75, confidence > 0.5], ["HIGH", "MEDIUM"], "LOW")
+
+
+# tiebreak="first": tied labels go to the one voted by the earliest engine (dict-tally order);
+# tiebreak="label": to the one listed first in `labels`
+def consensus(codes, conf, weights=None, labels=SIGNALS, assets=None, tiebreak="first"):
+    codes = np.asarray(codes)
+    conf = np.nan_to_num(np.asarray(conf, dtype=np.float64))
+    n_engines, n_labels = codes.shape[1], len(labels)
+    if n_engines == 0:  # nothing voted: every asset abstains
+        n = len(codes)
+        return pd.DataFrame({"majority": [labels[-1]] * n, "confidence": np.zeros(n), "agreement": np.zeros(n),
+                             "strength": strength_labels(np.zeros(n)), "votes": np.zeros(n, dtype=np.int64)},
+                            index=assets)
+    w = np.ones(n_engines) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    w_ae = np.where(codes >= 0, w, 0.0)                                  # (A, E)
+    onehot = codes[:, :, None] == np.arange(n_labels, dtype=codes.dtype)  # (A, E, S)
+    tally = np.einsum("ae,aes->as", w_ae, onehot.astype(np.float64))      # weighted votes per label
+    total = w_ae.sum(axis=1)
+
+    tied = np.isclose(tally, tally.max(axis=1, keepdims=True)) & (tally > 0)
+    if tiebreak == "label":
+        majority = tied.argmax(axis=1)
+    else:
+        first_engine = np.where(onehot.any(axis=1), onehot.argmax(axis=1), n_engines)
+        majority = np.where(tied, first_engine, n_engines + 1).argmin(axis=1)
+    has_votes = total > 0
+    majority = np.where(has_votes, majority, n_labels - 1)
+
+    safe_total = np.where(has_votes, total, 1.0)
+    confidence = np.where(has_votes, (w_ae * conf).sum(axis=1) / safe_total, 0.0)
+    agreement = np.where(has_votes, np.take_along_axis(tally, majority[:, None], axis=1)[:, 0] / safe_total, 0.0)
+
+    return pd.DataFrame({
+        "majority": np.asarray(labels, dtype=object)[majority],
+        "confidence": confidence,
+        "agreement": agreement,  # weighted share of the vote behind the majority
+        "strength": strength_labels(confidence),
+        "votes": (codes >= 0).sum(axis=1),
+    }, index=assets)
+
+
+# Nested-dict front end used by the voting panels
+def tally_votes(engine_signals, weights=None, labels=SIGNALS, scales=None):
+    assets, engines, codes, conf = vote_matrix(engine_signals, labels)
+    return consensus(codes, conf, engine_weights(engines, weights, scales), labels, assets=assets)
+
+
+# Bare label votes ({agent: "BUY", ...} or a list) → majority label
+def majority_vote(votes, labels=None, tiebreak="first"):
+    votes = list(votes.values()) if isinstance(votes, dict) else list(votes)
+    labels = labels or tuple(dict.fromkeys(votes))
+    codes = encode_signals([votes], labels)
+    return consensus(codes, np.ones(codes.shape), labels=labels, tiebreak=tiebreak)["majority"].iat[0]
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(7)
+    engines = ["grok", "chatgpt", "gemini", "tradegpt", "claude", "llama", "sentiment", "pattern"]
+    for n_assets in (1_000, 10_000, 100_000):
+        codes = rng.integers(-1, len(SIGNALS), size=(n_assets, len(engines))).astype(np.int8)
+        conf = rng.uniform(0.4, 0.95, size=codes.shape)
+        started = time.perf_counter()
+        frame = consensus(codes, conf, engine_weights(engines))
+        elapsed = time.perf_counter() - started
+        print(f"{n_assets:>7} assets × {len(engines)} engines: {elapsed * 1e3:7.1f} ms  "
+              f"({n_assets / elapsed:,.0f} assets/sec) → {frame['majority'].value_counts().to_dict()}")
@@ -0,0 +1,245 @@
+import asyncio, os, threading, time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from modules.consensus_engine import SIGNALS, engine_weights, tally_votes
+except ImportError:
+    from consensus_engine import SIGNALS, engine_weights, tally_votes
+
+# ─────────────────────────────────────────────
+# AI engine fan-out: every engine is queried concurrently over one pooled
+# requests.Session. Per-engine timeout, a hedged second request when an
+# engine runs past its usual latency, and a circuit breaker for engines
+# that keep failing. The vote closes as soon as the engines still out
+# can no longer change the majority.
+# ─────────────────────────────────────────────
+ENGINES = ("grok", "chatgpt", "gemini", "tradegpt")
+STUB_URL = "http://127.0.0.1:8765"  # engine_stub_server
+# CAMBO_<ENGINE>_URL points an engine at its real gateway; default is the local stub
+ENGINE_URLS = {e: os.environ.get(f"CAMBO_{e.upper()}_URL", f"{STUB_URL}/{e}") for e in ENGINES}
+
+TIMEOUT = 2.0          # seconds per engine, across both hedged attempts
+HEDGE_AFTER = 0.5      # hedge delay until an engine has latency history...
+HEDGE_QUANTILE = 0.9   # ...then hedge at its recent p90
+QUORUM = 3             # answers needed before a partial vote counts
+POOL_SIZE = 64         # pooled connections = worker threads; size to assets × engines in flight per tick
+
+
+class EngineError(Exception):
+    pass
+
+
+# ─────────────────────────────────────────────
+# Circuit breaker: open after `threshold` straight failures, one probe per cooldown
+# ─────────────────────────────────────────────
+class CircuitBreaker:
+    def __init__(self, threshold=3, cooldown=30.0):
+        self.threshold, self.cooldown = threshold, cooldown
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def allow(self):
+        state = self.state
+        if state == "half-open":
+            self.opened_at = time.monotonic()  # let one probe through, hold the rest
+        return state != "open"
+
+    def record(self, ok):
+        if ok:
+            self.failures, self.opened_at = 0, None
+            return
+        self.failures += 1
+        if self.failures >= self.threshold or self.opened_at is not None:
+            self.opened_at = time.monotonic()
+
+
+# The majority is settled once the engines still out can't overturn it: the weighted lead has to
+# beat their combined weight (same slider weights / voter scales as the final tally_votes).
+# `fixed`: votes that join the tally without being queried (render_voting's pattern / sentiment streams)
+def vote_decided(votes, outstanding, weights=None, scales=None, fixed=None):
+    known = {**(fixed or {}), **votes}
+    engines = list(known) + list(outstanding)
+    w = dict(zip(engines, engine_weights(engines, weights, scales)))
+    tally = Counter()
+    for engine, vote in known.items():
+        tally[vote["signal"].lower()] += w[engine]
+    top = sorted(tally.values(), reverse=True) + [0.0, 0.0]
+    return top[0] - top[1] > sum(w[e] for e in outstanding)
+
+
+class EngineClient:
+    def __init__(self, urls=None, timeout=TIMEOUT, quorum=QUORUM, pool_size=POOL_SIZE):
+        self.urls = dict(urls or ENGINE_URLS)
+        self.timeout = timeout  # float, or {engine: seconds}
+        self.quorum = quorum
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.urls), pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="engine")
+        self.breakers = {e: CircuitBreaker() for e in self.urls}
+        self.latency = {e: deque(maxlen=200) for e in self.urls}
+        self.pool_size = pool_size
+        self.inflight = 0  # attempts submitted to the pool and not yet finished
+        self.inflight_lock = threading.Lock()  # decremented from the pool threads
+        self.stats = Counter()  # hedges / timeouts / errors / breaker_skips
+
+    def engine_timeout(self, engine):
+        return self.timeout.get(engine, TIMEOUT) if isinstance(self.timeout, dict) else self.timeout
+
+    def hedge_delay(self, engine):
+        history = self.latency[engine]
+        return float(np.quantile(history, HEDGE_QUANTILE)) if len(history) >= 10 else HEDGE_AFTER
+
+    # Blocking call, runs on the pool
+    def _post(self, engine, payload, timeout):
+        started = time.perf_counter()
+        resp = self.session.post(self.urls[engine], json=payload, timeout=timeout)
+        resp.raise_for_status()
+        vote = resp.json()
+        if not isinstance(vote, dict):
+            raise ValueError(f"expected a JSON object, got {type(vote).__name__}")
+        if str(vote.get("signal", "")).lower() not in SIGNALS:
+            raise ValueError(f"bad signal {vote.get('signal')!r}")
+        return vote, time.perf_counter() - started
+
+    # Done-callback on the pool's own future: runs when the thread returns, or when a still-queued
+    # attempt is cancelled — not when the asyncio wrapper is cancelled while the thread keeps going
+    def _finished(self, job):
+        with self.inflight_lock:
+            self.inflight -= 1
+
+    async def query_engine(self, engine, payload):
+        if not self.breakers[engine].allow():
+            self.stats["breaker_skips"] += 1
+            raise EngineError(f"{engine}: circuit open")
+        loop = asyncio.get_running_loop()
+        timeout = self.engine_timeout(engine)
+        deadline = loop.time() + timeout
+
+        def attempt():
+            with self.inflight_lock:
+                self.inflight += 1
+            job = self.executor.submit(self._post, engine, payload, timeout)
+            job.add_done_callback(self._finished)
+            return asyncio.wrap_future(job, loop=loop)
+
+        attempts = {attempt()}
+        done, _ = await asyncio.wait(attempts, timeout=min(self.hedge_delay(engine), timeout))
+        # Hedge only into spare pool capacity: when the pool is the bottleneck a hedge just queues behind it
+        if not done and self.inflight < self.pool_size:
+            self.stats["hedges"] += 1
+            attempts.add(attempt())
+
+        error = None
+        try:
+            while attempts and loop.time() < deadline:
+                done, attempts = await asyncio.wait(attempts, timeout=deadline - loop.time(),
+                                                    return_when=asyncio.FIRST_COMPLETED)
+                for fut in done:
+                    try:
+                        vote, secs = fut.result()
+                    except (requests.RequestException, ValueError) as exc:
+                        error = exc
+                        continue
+                    self.latency[engine].append(secs)
+                    self.breakers[engine].record(True)
+                    return vote
+        finally:
+            for fut in attempts:
+                fut.cancel()  # the losing thread finishes on its own; its answer is dropped
+
+        self.breakers[engine].record(False)
+        if error is None:
+            self.stats["timeouts"] += 1
+            raise EngineError(f"{engine}: no answer within {timeout}s")
+        self.stats["errors"] += 1
+        raise EngineError(f"{engine}: {error}") from error
+
+    async def gather_votes(self, asset, engines=None, quorum=None, weights=None, scales=None, fixed=None):
+        engines = list(engines or self.urls)
+        quorum = min(quorum or self.quorum, len(engines))
+        payload = {"asset": asset}
+        tasks = {asyncio.ensure_future(self.query_engine(e, payload)): e for e in engines}
+        votes, failed, pending = {}, {}, set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        votes[tasks[task]] = task.result()
+                    except EngineError as exc:
+                        failed[tasks[task]] = str(exc)
+                if len(votes) >= quorum and vote_decided(votes, [tasks[t] for t in pending], weights, scales, fixed):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        return {"votes": votes, "failed": failed, "skipped": [tasks[t] for t in pending],
+                "quorum": len(votes) >= quorum}
+
+    # fixed: {asset: {source: vote}} added to each asset's tally next to the engines
+    async def gather_many(self, assets, engines=None, quorum=None, weights=None, scales=None, fixed=None):
+        fixed = fixed or {}
+        results = await asyncio.gather(*(self.gather_votes(a, engines, quorum, weights, scales, fixed.get(a))
+                                         for a in assets))
+        return dict(zip(assets, results))
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+_client = None
+
+
+def get_client():
+    global _client
+    if _client is None:
+        _client = EngineClient()
+    return _client
+
+
+# Sync entry point for Streamlit: {asset: {"votes", "failed", "skipped", "quorum"}};
+# pass the weights / scales the votes will be tallied with so the early stop agrees with the tally
+def fetch_votes(assets, engines=None, quorum=None, client=None, weights=None, scales=None, fixed=None):
+    return asyncio.run((client or get_client()).gather_many(list(assets), engines, quorum, weights, scales, fixed))
+
+
+# Live votes → consensus_engine frame; assets short of quorum come back neutral with 0 confidence
+def live_consensus(assets, weights=None, engines=None, quorum=None, client=None, scales=None):
+    results = fetch_votes(assets, engines, quorum, client, weights, scales)
+    frame = tally_votes({a: r["votes"] if r["quorum"] else {} for a, r in results.items()}, weights, scales=scales)
+    frame["responded"] = [len(r["votes"]) for r in results.values()]
+    frame["quorum"] = [r["quorum"] for r in results.values()]
+    return frame, results
+
+
+if __name__ == "__main__":
+    from modules.engine_stub_server import serve_stub
+
+    server = serve_stub()
+    client = EngineClient()
+    try:
+        for n_assets in (1, 10, 100):
+            assets = [f"SYM{i:04d}" for i in range(n_assets)]
+            started = time.perf_counter()
+            frame, results = live_consensus(assets, client=client)
+            elapsed = time.perf_counter() - started
+            answered = sum(len(r["votes"]) for r in results.values())
+            print(f"{n_assets:>4} assets: {elapsed:6.2f}s  {answered}/{n_assets * len(ENGINES)} engine answers, "
+                  f"{frame['quorum'].mean():.0%} at quorum  stats={dict(client.stats)}")
+        print(frame.head())
+    finally:
+        client.close()
+        server.shutdown()
@@ -0,0 +1,69 @@
+import json, random, threading, time, zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ─────────────────────────────────────────────
+# Local stand-in for the AI signal engines: POST /<engine> {"asset": ...}
+# → {"signal", "confidence"} after a configurable delay. Latency / failure
+# knobs per engine let the client's timeouts, hedging and breaker be exercised.
+# ─────────────────────────────────────────────
+STUB_PORT = 8765
+STUB_ENGINES = {
+    # engine: (median latency s, jitter s, failure rate)
+    "grok": (0.08, 0.04, 0.0),
+    "chatgpt": (0.15, 0.10, 0.0),
+    "gemini": (0.10, 0.05, 0.0),
+    "tradegpt": (0.40, 0.60, 0.05),  # the slow, flaky one
+}
+SIGNALS = ("buy", "sell", "neutral")
+
+
+# Same asset + engine → same vote, so runs are reproducible
+def stub_vote(engine, asset):
+    seed = zlib.crc32(f"{engine}:{asset}".encode())
+    rng = random.Random(seed)
+    return {"signal": rng.choice(SIGNALS), "confidence": round(rng.uniform(0.5, 0.95), 2)}
+
+
+def _handler(engines):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            engine = self.path.strip("/")
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            if engine not in engines:
+                return self._reply(404, {"error": f"unknown engine {engine}"})
+            latency, jitter, fail_rate = engines[engine]
+            time.sleep(max(0.0, random.gauss(latency, jitter / 2)) if jitter else latency)
+            if random.random() < fail_rate:
+                return self._reply(503, {"error": "engine overloaded"})
+            self._reply(200, stub_vote(engine, body.get("asset", "")))
+
+        def _reply(self, status, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass  # keep the console quiet
+
+    return StubHandler
+
+
+# Starts in a daemon thread; call .shutdown() on the returned server when done
+def serve_stub(port=STUB_PORT, engines=None):
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(engines or STUB_ENGINES))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    server = serve_stub()
+    print(f"🧪 Stub engines on http://127.0.0.1:{server.server_port}/<engine>: {', '.join(STUB_ENGINES)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,308 @@
+import os
+import csv
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, time
+
+import pandas as pd
+
+# ──────────────────────────────────────────────────────
+# One embedded SQLite event store (WAL) for trades, pattern detections and
+# strategy-lab signals. Writers insert in batches, views query by index.
+# ──────────────────────────────────────────────────────
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(MODULE_DIR, "..", "data", "cambo_events.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    asset TEXT,
+    signal TEXT,
+    confidence REAL,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS trades_ts ON trades (timestamp);
+CREATE INDEX IF NOT EXISTS trades_asset_ts ON trades (asset, timestamp);
+
+CREATE TABLE IF NOT EXISTS patterns (
+    id INTEGER PRIMARY KEY,
+    logged_at TEXT NOT NULL,
+    pattern TEXT,
+    detection_date TEXT,
+    commentary TEXT,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS patterns_logged ON patterns (logged_at);
+CREATE INDEX IF NOT EXISTS patterns_pattern_date ON patterns (pattern, detection_date);
+
+CREATE TABLE IF NOT EXISTS strategy_signals (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    strategy TEXT,
+    pattern TEXT,
+    outcome TEXT,
+    impact TEXT,
+    follow_through TEXT,
+    comment TEXT
+);
+CREATE INDEX IF NOT EXISTS strategy_ts ON strategy_signals (timestamp);
+CREATE INDEX IF NOT EXISTS strategy_pattern ON strategy_signals (pattern, timestamp);
+
+CREATE TABLE IF NOT EXISTS fills (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    order_id TEXT,
+    asset TEXT,
+    side TEXT,
+    quantity REAL,
+    price REAL,
+    venue TEXT,
+    latency_ms REAL
+);
+CREATE INDEX IF NOT EXISTS fills_ts ON fills (timestamp);
+CREATE INDEX IF NOT EXISTS fills_asset_ts ON fills (asset, timestamp);
+CREATE INDEX IF NOT EXISTS fills_order ON fills (order_id);
+
+CREATE TABLE IF NOT EXISTS migrations (
+    source TEXT PRIMARY KEY,
+    rows INTEGER,
+    imported_at TEXT
+);
+"""
+
+# table → (store columns, legacy/display column names in the same order)
+TABLES = {
+    "trades": (
+        ("timestamp", "asset", "signal", "confidence", "outcome"),
+        ("timestamp", "asset", "signal", "confidence", "outcome"),
+    ),
+    "patterns": (
+        ("logged_at", "pattern", "detection_date", "commentary", "outcome"),
+        ("Timestamp", "Pattern", "DetectionDate", "Commentary", "Outcome"),
+    ),
+    "strategy_signals": (
+        ("timestamp", "strategy", "pattern", "outcome", "impact", "follow_through", "comment"),
+        ("Timestamp", "Strategy", "Pattern", "Outcome", "Impact", "FollowThrough", "Comment"),
+    ),
+    "fills": (
+        ("timestamp", "order_id", "asset", "side", "quantity", "price", "venue", "latency_ms"),
+        ("timestamp", "order_id", "asset", "side", "quantity", "price", "venue", "latency_ms"),
+    ),
+}
+ORDER_COLUMN = {"trades": "timestamp", "patterns": "logged_at", "strategy_signals": "timestamp", "fills": "timestamp"}
+
+# Files written by trade_log / pattern_logbook / strategy_lab before the store existed
+LEGACY_SOURCES = [
+    ("trades", os.path.join(MODULE_DIR, "..", "logs", "voting_history.json")),
+    ("trades", os.path.join(MODULE_DIR, "..", "logs", "voting_history.jsonl")),
+    ("patterns", os.path.join("logs", "pattern_log.csv")),
+    ("strategy_signals", os.path.join("data", "strategy_log.csv")),
+]
+
+_local = threading.local()
+STAMP_MIGRATION = "timestamps:isoformat"  # migrations key for the one-off rewrite of space-separated stamps
+
+
+# Ordered columns hold datetime.isoformat() text ("T" separator) in every table, so text order is time order
+def _stamp(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return datetime.combine(value, time.min).isoformat()
+    try:
+        return datetime.fromisoformat(str(value)).isoformat()  # "2026-10-17 10:00:00" → "2026-10-17T10:00:00"
+    except ValueError:
+        return value
+
+
+# Query bound in the stored format; a bare date covers its whole day
+def _bound(value, end=False):
+    if isinstance(value, str) and len(value) == 10:
+        value = date.fromisoformat(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, time.max if end else time.min).isoformat()
+    return _stamp(value)
+
+
+# 🔌 One connection per thread (Streamlit serves sessions from several threads)
+def connect(path=None):
+    path = os.path.abspath(path or DB_PATH)
+    conns = _local.__dict__.setdefault("conns", {})
+    if path not in conns:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        conns[path] = conn
+        normalise_stamps(conn)
+        if path == os.path.abspath(DB_PATH):
+            migrate_legacy(conn)
+    return conns[path]
+
+
+# ─────────────────────────────────────────────
+# Writers: one transaction + executemany per batch
+# ─────────────────────────────────────────────
+def _insert(conn, table, rows):
+    columns, names = TABLES[table]
+    i = columns.index(ORDER_COLUMN[table])
+    rows = [tuple(row.get(name) for name in names) if isinstance(row, dict) else tuple(row) for row in rows]
+    rows = [row[:i] + (_stamp(row[i]),) + row[i + 1:] for row in rows]
+    if rows:
+        conn.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+    return len(rows)
+
+
+def insert_rows(table, rows, path=None, conn=None):
+    conn = conn or connect(path)
+    with conn:
+        return _insert(conn, table, rows)
+
+
+def insert_trades(rows, path=None):
+    return insert_rows("trades", rows, path)
+
+
+def insert_patterns(rows, path=None):
+    return insert_rows("patterns", rows, path)
+
+
+def insert_strategy_signals(rows, path=None):
+    return insert_rows("strategy_signals", rows, path)
+
+
+def insert_fills(rows, path=None):
+    return insert_rows("fills", rows, path)
+
+
+# ─────────────────────────────────────────────
+# Readers: filters and tails are served from the indexes
+# ─────────────────────────────────────────────
+def query(table, last=None, start=None, end=None, path=None, **equals):
+    columns, names = TABLES[table]
+    order = ORDER_COLUMN[table]
+    where, params = [], []
+    if start is not None:
+        where.append(f"{order} >= ?")
+        params.append(_bound(start))
+    if end is not None:
+        where.append(f"{order} <= ?")
+        params.append(_bound(end, end=True))
+    for col, value in equals.items():
+        if value is not None:
+            where.append(f"{col} = ?")
+            params.append(value)
+
+    aliases = ", ".join(f'{c} AS "{n}"' for c, n in zip(columns, names))
+    select = f"SELECT id, {aliases} FROM {table}"
+    if where:
+        select += " WHERE " + " AND ".join(where)
+    if last is not None:
+        # Newest N via the index, then back into chronological order
+        outer = names[columns.index(order)]
+        sql = f'SELECT * FROM ({select} ORDER BY {order} DESC, id DESC LIMIT ?) ORDER BY "{outer}", id'
+        params.append(int(last))
+    else:
+        sql = f"{select} ORDER BY {order}, id"
+    df = pd.read_sql_query(sql, connect(path), params=params)
+    return df.drop(columns="id")
+
+
+def query_trades(last=None, start=None, end=None, asset=None, path=None):
+    return query("trades", last=last, start=start, end=end, path=path, asset=asset)
+
+
+def query_patterns(last=None, start=None, end=None, pattern=None, path=None):
+    return query("patterns", last=last, start=start, end=end, path=path, pattern=pattern)
+
+
+def query_strategy_signals(last=None, start=None, end=None, pattern=None, path=None):
+    return query("strategy_signals", last=last, start=start, end=end, path=path, pattern=pattern)
+
+
+def query_fills(last=None, start=None, end=None, asset=None, order_id=None, path=None):
+    return query("fills", last=last, start=start, end=end, path=path, asset=asset, order_id=order_id)
+
+
+def count(table, path=None):
+    return connect(path).execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+# O(1) emptiness check for views (COUNT(*) walks a whole index)
+def has_rows(table, path=None):
+    return connect(path).execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None
+
+
+# ─────────────────────────────────────────────
+# Migration: import each legacy file once (recorded in the migrations table)
+# ─────────────────────────────────────────────
+def _read_legacy(source):
+    if source.endswith(".json"):
+        with open(source, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if source.endswith(".jsonl"):
+        with open(source, "r", encoding="utf-8") as f:
+            rows = []
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue  # torn line
+            return rows
+    with open(source, "r", encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+# Run `work(conn)` once per database under `key`: the claim and the work share one write transaction,
+# so concurrent first connects (one per Streamlit thread) and crashes halfway can't run it twice
+def _run_once(conn, key, work):
+    if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (key,)).fetchone():
+        return None
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (key,)).fetchone():
+            conn.rollback()
+            return None
+        done = work(conn)
+        conn.execute("INSERT INTO migrations VALUES (?, ?, ?)", (key, done, datetime.now().isoformat()))
+        conn.commit()
+        return done
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def migrate_legacy(conn=None, sources=None):
+    conn = conn or connect()
+    imported = {}
+    for table, source in sources or LEGACY_SOURCES:
+        if not os.path.exists(source):
+            continue
+        rows = _run_once(conn, os.path.abspath(source), lambda c: _insert(c, table, _read_legacy(source)))
+        if rows is not None:
+            imported[source] = rows
+    return imported
+
+
+# Stores written before every table used isoformat() kept "YYYY-mm-dd HH:MM:SS" stamps
+def normalise_stamps(conn):
+    def rewrite(c):
+        changed = 0
+        for table, column in ORDER_COLUMN.items():
+            changed += c.execute(f"UPDATE {table} SET {column} = substr({column}, 1, 10) || 'T' || substr({column}, 12) "
+                                 f"WHERE {column} LIKE '____-__-__ %'").rowcount
+        return changed
+    return _run_once(conn, STAMP_MIGRATION, rewrite)
+
+
+if __name__ == "__main__":
+    conn = connect()
+    print(f"📦 Event store: {os.path.abspath(DB_PATH)}")
+    for table in TABLES:
+        print(f"  {table}: {count(table)} rows")
+    done = conn.execute("SELECT source, rows, imported_at FROM migrations").fetchall()
+    for source, rows, when in done:
+        print(f"  ✅ migrated {rows} rows from {source} at {when}")
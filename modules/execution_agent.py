@@ -1,24 +1,47 @@
 ﻿import streamlit as st
-from modules import trade_log, execution_delay, risk_filter, live_alerts
+import time
+from modules import trade_log, execution_delay, risk_filter, live_alerts, order_router
+from modules.market_regime import latest_regime
+from modules.meta_learning_genome import entry_predictions
 
-def render(signal="neutral", confidence=0.0, asset="unspecified"):
+# Runs on the execution scheduler once the delay is up: log the decision, hand the order to the paper router
+def execute_trade(asset, signal, confidence, outcome, signal_ts, sources=None):
+    trade_log.log_trade(asset, signal, confidence, outcome)
+    return order_router.submit_trade(asset, signal, confidence, outcome, signal_ts=signal_ts, sources=sources)
+
+
+def show_queue(handles):
+    # Show this session's queue (pending plus the last few finished); reruns refresh it
+    handles[:] = [h for h in handles if not h.done()] + [h for h in handles if h.done()][-10:]
+    execution_delay.render_pending(handles)
+
+    orders = [h.result.summary() for h in handles if h.done() and h.result is not None]
+    if orders:
+        st.markdown("#### 📬 Paper Orders")
+        st.dataframe(orders, use_container_width=True)
+
+
+# vote_ts: when the vote was taken (module_dispatcher keeps it across reruns of the same vote)
+def render(signal="neutral", confidence=0.0, asset="unspecified", vote_ts=None):
     st.subheader("🎯 Execution Agent")
+    signal_ts = time.perf_counter()
 
     # Send alert
     live_alerts.alert(signal, confidence)
 
-    # Apply risk filter
-    if not risk_filter.apply_filter(mock_vix=32.1):
-        trade_log.log_trade(asset, signal, confidence, "blocked_by_risk")
-        return
-
-    # Apply execution delay
-    execution_delay.apply_delay(3)
+    # Nightly HMM regime for the asset (None if it was not in the last run)
+    regime = latest_regime(asset)
+    against_regime = (signal.lower(), regime) in [("buy", "Bear"), ("sell", "Bull")]
+    if regime:
+        st.caption(f"🌐 Market regime: {regime}")
 
     # Final routing based on signal strength
     if signal.lower() in ["buy", "sell"]:
         st.markdown(f"**Received Signal:** `{signal.upper()}` with confidence `{confidence}`")
-        if confidence >= 0.85:
+        if confidence >= 0.85 and against_regime:
+            outcome = "partial_trade"
+            st.warning("⚠️ Executing partial-size trade — signal runs against the market regime.")
+        elif confidence >= 0.85:
             outcome = "full_trade"
             st.success("✅ Executing full-size trade setup.")
             st.info("💡 Confidence high — confirmed entry.")
@@ -32,5 +55,27 @@ def render(signal="neutral", confidence=0.0, asset="unspecified"):
         outcome = "neutral_vote"
         st.info("No actionable signal detected.")
 
-    # Log execution
-    trade_log.log_trade(asset, signal, confidence, outcome)
+    # Streamlit reruns the page on every widget change: a vote already acted on is not routed again
+    handles = st.session_state.setdefault("scheduled_executions", [])
+    executed = st.session_state.setdefault("executed_votes", set())
+    key = (asset.lower(), signal.lower(), vote_ts)
+    if vote_ts is not None and key in executed:
+        st.caption("🔁 This vote has already been routed.")
+        show_queue(handles)
+        return
+    executed.add(key)
+
+    # Apply risk filter to the order this outcome would send
+    quantity = order_router.trade_quantity(outcome)
+    if quantity:
+        check = risk_filter.apply_filter(asset, signal, quantity)
+        if not check["approved"]:
+            trade_log.log_trade(asset, signal, confidence, f"blocked_by_risk:{check['blocked_by']}")
+            return
+
+    # Apply execution delay: the order is logged and routed by the background scheduler, the session carries on
+    # Source predictions are captured now, at signal time, for the fusion-weight learner
+    handle = execution_delay.apply_delay(3, execute_trade, asset, signal, confidence, outcome, signal_ts,
+                                         entry_predictions(asset), label=f"{asset} {signal.upper()} → {outcome}")
+    handles.append(handle)
+    show_queue(handles)
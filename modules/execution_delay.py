@@ -1,7 +1,186 @@
 ﻿import streamlit as st
 import time
+import heapq
+import atexit
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def apply_delay(seconds=3):
-    with st.spinner(f"⏳ Waiting {seconds}s before execution..."):
-        time.sleep(seconds)
-    st.success("⏱️ Delay complete – proceeding with execution.")
+# ─────────────────────────────────────────────
+# Scheduled executions: delayed orders sit in a due-time heap and are run by
+# one background timer thread (handing the work to a small pool), so the
+# Streamlit script thread returns immediately with a handle to poll.
+# ─────────────────────────────────────────────
+class ScheduledExecution:
+    def __init__(self, job_id, due, action, args, kwargs, label):
+        self.id, self.due, self.label = job_id, due, label
+        self.action, self.args, self.kwargs = action, args, kwargs
+        self.created = time.time()
+        self.status = "pending"  # pending → running → done / failed, or cancelled
+        self.result = self.error = None
+        self.ran_at = self.finished_at = None
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        return max(0.0, self.due - time.monotonic()) if self.status == "pending" else 0.0
+
+    def done(self):
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        self._event.wait(timeout)
+        return self.result
+
+    def cancel(self):
+        with self._lock:
+            if self.status != "pending":
+                return False
+            self.status = "cancelled"
+        self._finish()
+        return True
+
+    def add_done_callback(self, fn):
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _start(self):
+        with self._lock:
+            if self.status != "pending":
+                return False
+            self.status = "running"
+            return True
+
+    def _finish(self):
+        with self._lock:
+            self.finished_at = time.time()
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def _run(self):
+        if not self._start():
+            return
+        self.ran_at = time.monotonic()
+        try:
+            self.result = self.action(*self.args, **self.kwargs) if self.action else None
+            self.status = "done"
+        except Exception as exc:  # surfaced on the handle; never kills the worker
+            self.error, self.status = exc, "failed"
+        self._finish()
+
+    def summary(self):
+        return {"id": self.id, "label": self.label, "status": self.status,
+                "due_in": round(self.remaining(), 1), "error": str(self.error) if self.error else ""}
+
+
+class ExecutionScheduler:
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.heap = []  # (due, seq, handle)
+        self.jobs = {}
+        self.ids = itertools.count(1)
+        self.cond = threading.Condition()
+        self.pool = None
+        self.thread = None
+        self.stopping = False
+
+    def _ensure_started(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.pool = self.pool or ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="execution")
+            self.stopping = False
+            self.thread = threading.Thread(target=self._loop, name="execution-scheduler", daemon=True)
+            self.thread.start()
+
+    def schedule(self, delay, action=None, *args, label="", **kwargs):
+        with self.cond:
+            self._ensure_started()
+            job_id = next(self.ids)
+            handle = ScheduledExecution(job_id, time.monotonic() + delay, action, args, kwargs, label)
+            self.jobs[job_id] = handle
+            heapq.heappush(self.heap, (handle.due, job_id, handle))
+            self.cond.notify()
+        handle.add_done_callback(self._forget)
+        return handle
+
+    def _forget(self, handle):
+        with self.cond:
+            self.jobs.pop(handle.id, None)
+
+    # Timer thread: sleep until the earliest due time (or a new, earlier job), then dispatch
+    def _loop(self):
+        while True:
+            with self.cond:
+                while not self.stopping and (not self.heap or self.heap[0][0] > time.monotonic()):
+                    self.cond.wait(self.heap[0][0] - time.monotonic() if self.heap else None)
+                if self.stopping and not self.heap:
+                    return
+                due = []
+                now = time.monotonic()
+                while self.heap and (self.heap[0][0] <= now or self.stopping):
+                    due.append(heapq.heappop(self.heap)[2])
+            for handle in due:
+                if handle.status == "pending":
+                    self.pool.submit(handle._run)
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def pending(self):
+        with self.cond:
+            return sorted(self.jobs.values(), key=lambda h: h.due)
+
+    # drain=True runs what is still queued right away; False cancels it
+    def shutdown(self, drain=True):
+        with self.cond:
+            if self.thread is None:
+                return
+            if not drain:
+                for _, _, handle in self.heap:
+                    handle.cancel()
+                self.heap = []
+            self.stopping = True
+            self.cond.notify()
+        self.thread.join()
+        self.pool.shutdown(wait=True)
+        self.thread = self.pool = None
+
+
+execution_scheduler = ExecutionScheduler()
+# On exit, queued orders are cancelled — draining would send them all at once, skipping their delay
+atexit.register(lambda: execution_scheduler.shutdown(drain=False))
+
+
+# Queue `action(*args)` to run after `seconds`; returns at once with the handle
+def apply_delay(seconds=3, action=None, *args, label="", **kwargs):
+    handle = execution_scheduler.schedule(seconds, action, *args, label=label, **kwargs)
+    st.info(f"⏳ Execution #{handle.id} queued — runs in {seconds}s.")
+    return handle
+
+
+def render_pending(handles):
+    rows = [h.summary() for h in handles]
+    if rows:
+        st.markdown("#### ⏱️ Scheduled Executions")
+        st.dataframe(rows, use_container_width=True)
+    return rows
+
+
+if __name__ == "__main__":
+    import random
+
+    n = 500
+    started = time.perf_counter()
+    handles = [execution_scheduler.schedule(random.uniform(0.0, 3.0), label=f"demo-{i}") for i in range(n)]
+    submit = time.perf_counter() - started
+    print(f"📥 {n} executions queued in {submit * 1e3:.1f} ms ({submit / n * 1e6:.1f} µs each)")
+    for h in handles:
+        h.wait()
+    late = sorted(h.ran_at - h.due for h in handles)
+    print(f"✅ {sum(h.status == 'done' for h in handles)}/{n} done in {time.perf_counter() - started:.2f}s, "
+          f"lateness p50 {late[n // 2] * 1e3:.1f} ms / max {late[-1] * 1e3:.1f} ms")
@@ -0,0 +1,257 @@
+import math, threading, time
+import numpy as np
+import pandas as pd
+
+# ─────────────────────────────────────────────
+# Streaming signal fusion: voting / pattern / sentiment streams publish
+# per-asset scores in [-1, 1]; the engine keeps the latest value of each
+# with its timestamp, decays it by source half-life, and re-fuses only
+# the assets whose inputs changed (batched per flush).
+# ─────────────────────────────────────────────
+SOURCES = ("voting", "pattern", "sentiment")
+DEFAULT_WEIGHTS = {"voting": 0.6, "sentiment": 0.2, "pattern": 0.2}  # weight_config defaults
+HALF_LIFE = {"voting": 300.0, "pattern": 2 * 86400.0, "sentiment": 900.0}  # seconds
+THRESHOLD = 0.25   # |fused score| needed for buy / sell, otherwise hold
+FLUSH_EVERY = 512  # dirty assets that trigger a flush on publish
+
+SIGNAL_SCORES = {"buy": 1.0, "bullish": 1.0, "positive": 1.0,
+                 "sell": -1.0, "bearish": -1.0, "negative": -1.0,
+                 "neutral": 0.0, "hold": 0.0, "pass": 0.0}
+
+# Chart structures → expected direction (continuation patterns carry no bias)
+PATTERN_BIAS = {
+    "Double Bottom": 1.0, "Triple Bottom": 1.0, "Ascending Triangle": 1.0, "Falling Wedge": 1.0, "Cup & Handle": 1.0,
+    "Double Top": -1.0, "Triple Top": -1.0, "Descending Triangle": -1.0, "Rising Wedge": -1.0, "Head & Shoulders": -1.0,
+    "Flag": 0.0, "Rectangle": 0.0,
+}
+
+
+def signal_score(signal):
+    if isinstance(signal, (int, float, np.floating)):
+        return float(np.clip(signal, -1.0, 1.0))
+    return SIGNAL_SCORES.get(str(signal).lower(), 0.0)
+
+
+def pattern_bias(name):
+    if name in PATTERN_BIAS:
+        return PATTERN_BIAS[name]
+    lowered = str(name).lower()  # candlestick names: "bullish_engulfing", "Bearish Harami", ...
+    return 1.0 if "bullish" in lowered else -1.0 if "bearish" in lowered else 0.0
+
+
+class FusionEngine:
+    def __init__(self, weights=None, half_life=None, capacity=256):
+        self.lock = threading.RLock()
+        self.index, self.assets = {}, []
+        self.value = np.zeros((capacity, len(SOURCES)))
+        self.conf = np.zeros((capacity, len(SOURCES)))
+        self.ts = np.full((capacity, len(SOURCES)), -np.inf)  # -inf = never published → zero weight
+        self.fused = np.zeros(capacity)
+        self.coverage = np.zeros(capacity)  # decayed, confidence-weighted share of the inputs present
+        self.fused_at = np.zeros(capacity)
+        self.dirty = np.zeros(capacity, dtype=bool)
+        self.n_dirty = 0
+        self.subscribers = []
+        self.stats = {"updates": 0, "flushes": 0, "evaluated": 0}
+        self.rate = np.array([math.log(2) / (half_life or HALF_LIFE)[s] for s in SOURCES])
+        self.multiplier = np.ones(len(SOURCES))
+        self.set_weights(weights or DEFAULT_WEIGHTS)
+
+    # ─────────────────────────────────────────────
+    # Inputs
+    # ─────────────────────────────────────────────
+    def _grow(self, n):
+        cap = len(self.fused)
+        if n <= cap:
+            return
+        new_cap = max(n, cap * 2)
+        for name in ("value", "conf", "ts"):
+            old = getattr(self, name)
+            grown = np.full((new_cap, len(SOURCES)), -np.inf if name == "ts" else 0.0)
+            grown[:cap] = old
+            setattr(self, name, grown)
+        for name in ("fused", "coverage", "fused_at", "dirty"):
+            old = getattr(self, name)
+            grown = np.zeros(new_cap, dtype=old.dtype)
+            grown[:cap] = old
+            setattr(self, name, grown)
+
+    def _slots(self, assets):
+        new = [a for a in dict.fromkeys(assets) if a not in self.index]
+        if new:
+            self._grow(len(self.assets) + len(new))
+            for asset in new:
+                self.index[asset] = len(self.assets)
+                self.assets.append(asset)
+        return np.fromiter((self.index[a] for a in assets), dtype=np.int64, count=len(assets))
+
+    def _mark(self, rows):
+        fresh = rows[~self.dirty[rows]]
+        self.dirty[fresh] = True
+        self.n_dirty += len(np.unique(fresh))
+        if self.n_dirty >= FLUSH_EVERY:
+            self.flush()
+
+    def publish(self, source, asset, value, confidence=1.0, ts=None):
+        self.publish_many(source, [asset], [value], [confidence], ts)
+
+    # Bulk update from one stream; within a batch the last value per asset wins
+    def publish_many(self, source, assets, values, confidences=None, ts=None):
+        s = SOURCES.index(source)
+        scores = np.fromiter((signal_score(v) for v in values), dtype=np.float64, count=len(values))
+        conf = np.ones(len(scores)) if confidences is None else np.asarray(confidences, dtype=np.float64)
+        stamp = np.broadcast_to(np.asarray(time.time() if ts is None else ts, dtype=np.float64), scores.shape)
+        with self.lock:
+            rows = self._slots([str(a).lower() for a in assets])
+            self.value[rows, s], self.conf[rows, s], self.ts[rows, s] = scores, conf, stamp
+            self.stats["updates"] += len(rows)
+            self._mark(rows)
+
+    # Engine-wide default weights (the stored fusion and subscribers). They change every asset's fusion,
+    # so everything is re-evaluated on the next flush — a call with the same values is a no-op
+    def set_weights(self, weights):
+        base = np.array([float(weights.get(s, 0.0)) for s in SOURCES])
+        with self.lock:
+            if np.array_equal(base, getattr(self, "base_weights", None)):
+                return
+            self.base_weights = base
+            self._apply_weights()
+
+    # Learned per-source multipliers (meta_learning_genome) tilt the slider weights, same total
+    def set_multipliers(self, multipliers):
+        with self.lock:
+            self.multiplier = np.array([float(multipliers.get(s, 1.0)) for s in SOURCES])
+            self._apply_weights()
+
+    def _tilt(self, base):
+        tilted = base * self.multiplier
+        return tilted * (base.sum() / (tilted.sum() or 1.0))
+
+    def _apply_weights(self):
+        self.weights = self._tilt(self.base_weights)
+        if self.assets:
+            self._mark(np.arange(len(self.assets)))
+
+    def subscribe(self, callback):
+        # callback(frame of the assets re-fused in a flush)
+        self.subscribers.append(callback)
+        return callback
+
+    # ─────────────────────────────────────────────
+    # Fusion
+    # ─────────────────────────────────────────────
+    def _evaluate(self, rows, now, weights=None):
+        weights = self.weights if weights is None else weights
+        decay = np.exp(-self.rate * np.maximum(now - self.ts[rows], 0.0))  # never-published → exp(-inf) = 0
+        eff = weights * self.conf[rows] * decay
+        total = weights.sum() or 1.0
+        return (eff * self.value[rows]).sum(axis=1) / total, eff.sum(axis=1) / total
+
+    def _frame(self, rows, fused, coverage):
+        return pd.DataFrame({
+            "asset": [self.assets[i] for i in rows],
+            "fused": fused,
+            "coverage": coverage,
+            "signal": np.where(fused > THRESHOLD, "buy", np.where(fused < -THRESHOLD, "sell", "hold")),
+        })
+
+    def flush(self, now=None):
+        with self.lock:
+            if not self.n_dirty:
+                return 0
+            now = time.time() if now is None else now
+            rows = np.flatnonzero(self.dirty[:len(self.assets)])
+            fused, coverage = self._evaluate(rows, now)
+            self.fused[rows], self.coverage[rows], self.fused_at[rows] = fused, coverage, now
+            self.dirty[rows] = False
+            self.n_dirty = 0
+            self.stats["flushes"] += 1
+            self.stats["evaluated"] += len(rows)
+        if self.subscribers:
+            changed = self._frame(rows, fused, coverage)
+            for callback in self.subscribers:
+                callback(changed)
+        return len(rows)
+
+    # Current view, decayed to `now`; assets=None → every asset seen so far. `weights`: one session's
+    # slider weights ({source: w}) for this view only — the engine-wide ones stay as they are
+    def snapshot(self, assets=None, now=None, weights=None):
+        self.flush(now)
+        with self.lock:
+            rows = np.arange(len(self.assets)) if assets is None else \
+                np.array([self.index[a.lower()] for a in assets if a.lower() in self.index], dtype=np.int64)
+            w = None if weights is None else self._tilt(np.array([float(weights.get(s, 0.0)) for s in SOURCES]))
+            fused, coverage = self._evaluate(rows, time.time() if now is None else now, w)
+            frame = self._frame(rows, fused, coverage)
+            for s, source in enumerate(SOURCES):
+                frame[source] = self.value[rows, s]
+                frame[f"{source}_age"] = (time.time() if now is None else now) - self.ts[rows, s]
+        return frame.set_index("asset")
+
+    # Pattern stream takes structure / candlestick names and publishes their directional bias
+    def publish_pattern(self, asset, name, confidence=1.0, ts=None):
+        self.publish("pattern", asset, pattern_bias(name), confidence, ts)
+
+    # Latest hit of a structure scan [(bar date, name), ...], stamped with its bar so older ones have already decayed
+    def publish_latest_pattern(self, asset, detected):
+        if detected:
+            date, name = max(detected, key=lambda d: d[0])
+            self.publish_pattern(asset, name, ts=pd.Timestamp(date).timestamp())
+
+    # Live streams of one asset as consensus votes ({source: {"signal", "confidence"}}), decayed to `now`
+    def stream_votes(self, asset, sources=SOURCES, now=None):
+        now = time.time() if now is None else now
+        votes = {}
+        with self.lock:
+            i = self.index.get(asset.lower())
+            if i is None:
+                return votes
+            for source in sources:
+                s = SOURCES.index(source)
+                if self.ts[i, s] == -np.inf:
+                    continue
+                value = self.value[i, s]
+                votes[source] = {"signal": "buy" if value > 0 else "sell" if value < 0 else "neutral",
+                                 "confidence": float(self.conf[i, s] * math.exp(-self.rate[s] * max(now - self.ts[i, s], 0.0)))}
+        return votes
+
+    def fused_signal(self, asset, now=None, weights=None):
+        frame = self.snapshot([asset], now, weights)
+        return None if frame.empty else frame.iloc[0].to_dict()
+
+
+fusion_engine = FusionEngine()
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(11)
+    engine = FusionEngine()
+    n_assets = 2_000
+    universe = [f"F{i:04d}" for i in range(n_assets)]
+    seen = []
+    engine.subscribe(lambda changed: seen.append(len(changed)))
+
+    # One update at a time, the way a UI stream would arrive
+    n = 50_000
+    picks = rng.integers(0, n_assets, n)
+    sources = rng.integers(0, len(SOURCES), n)
+    values = rng.uniform(-1, 1, n)
+    started = time.perf_counter()
+    for i in range(n):
+        engine.publish(SOURCES[sources[i]], universe[picks[i]], values[i], 0.8)
+    engine.flush()
+    single = time.perf_counter() - started
+
+    # Batched stream ticks (e.g. a sentiment scan over the whole universe)
+    started = time.perf_counter()
+    for _ in range(200):
+        batch = rng.integers(0, n_assets, 1_000)
+        engine.publish_many("sentiment", [universe[j] for j in batch], rng.uniform(-1, 1, 1_000))
+    engine.flush()
+    batched = time.perf_counter() - started
+
+    print(f"single publish: {n / single:10,.0f} updates/sec")
+    print(f"publish_many:   {200_000 / batched:10,.0f} updates/sec")
+    print(f"{engine.stats['flushes']} flushes re-fused {engine.stats['evaluated']:,} asset rows "
+          f"for {engine.stats['updates']:,} updates; subscribers saw {sum(seen):,} changed rows")
+    print(engine.snapshot().sort_values("fused").tail(3)[["fused", "coverage", "signal"]])
@@ -1,5 +1,9 @@
+try:
+    from modules.consensus_engine import majority_vote
+except ImportError:
+    from consensus_engine import majority_vote
+
+
+# Ties resolve in BUY → SELL → PASS order, as before
 def composite_vote(contrarian, prophet, ghost):
-    votes = {"BUY": 0, "SELL": 0, "PASS": 0}
-    for vote in [contrarian, prophet, ghost]:
-        votes[vote] += 1
-    return max(votes, key=votes.get)
+    return majority_vote([contrarian, prophet, ghost], labels=("BUY", "SELL", "PASS"), tiebreak="label")
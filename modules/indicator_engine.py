@@ -0,0 +1,237 @@
+import math
+from collections import deque
+
+import numpy as np
+
+NAN = float("nan")
+
+
+# ──────────────────────────────────────────────────────
+# Indicators: batch() reproduces the pandas formulas exactly and seeds
+# the rolling state from the tail; update() then costs O(1) per bar.
+# ──────────────────────────────────────────────────────
+class SMA:
+    def __init__(self, window=20, column="SMA_20"):
+        self.window, self.columns = window, (column,)
+
+    def batch(self, close, volume):
+        out = close.rolling(window=self.window).mean()
+        self.buf = deque(close.to_numpy()[-self.window:], maxlen=self.window)
+        self.total = float(sum(self.buf))
+        return {self.columns[0]: out}
+
+    def update(self, close, volume):
+        if len(self.buf) == self.window:
+            self.total -= self.buf[0]
+        self.buf.append(close)
+        self.total += close
+        value = self.total / self.window if len(self.buf) == self.window else NAN
+        return {self.columns[0]: value}
+
+
+class EMA:
+    # pandas ewm(adjust=True): weighted sum and weight total both decay by (1 - alpha)
+    def __init__(self, span=20, column="EMA_20"):
+        self.span, self.alpha, self.columns = span, 2 / (span + 1), (column,)
+
+    def batch(self, close, volume):
+        out = close.ewm(span=self.span).mean()
+        decay, n = 1 - self.alpha, len(close)
+        self.weight = (1 - decay ** n) / self.alpha
+        self.carry = float(out.iat[-1]) * self.weight if n else 0.0
+        return {self.columns[0]: out}
+
+    def update(self, close, volume):
+        decay = 1 - self.alpha
+        self.carry = close + decay * self.carry
+        self.weight = 1 + decay * self.weight
+        return {self.columns[0]: self.carry / self.weight}
+
+
+class RSI:
+    # Same smoothing as the chart panel: simple rolling means of gains/losses ("wilder" for RMA)
+    def __init__(self, window=14, column="RSI", smoothing="sma"):
+        self.window, self.columns, self.smoothing = window, (column,), smoothing
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        if avg_loss == 0:
+            return NAN if avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def batch(self, close, volume):
+        delta = close.diff()
+        gain = delta.clip(lower=0)
+        loss = -1 * delta.clip(upper=0)
+        if self.smoothing == "wilder":
+            rma_gain = gain.ewm(alpha=1 / self.window, adjust=False).mean()
+            rma_loss = loss.ewm(alpha=1 / self.window, adjust=False).mean()
+            enough = delta.notna().cumsum() >= self.window
+            avg_gain, avg_loss = rma_gain.where(enough), rma_loss.where(enough)
+            self.avg_gain = float(rma_gain.iat[-1]) if len(close) else NAN
+            self.avg_loss = float(rma_loss.iat[-1]) if len(close) else NAN
+        else:
+            avg_gain = gain.rolling(window=self.window).mean()
+            avg_loss = loss.rolling(window=self.window).mean()
+        rs = avg_gain / avg_loss
+        out = 100 - (100 / (1 + rs))
+
+        self.prev = float(close.iat[-1]) if len(close) else None
+        self.seen = int(delta.notna().sum())
+        self.gains = deque(gain.dropna().to_numpy()[-self.window:], maxlen=self.window)
+        self.losses = deque(loss.dropna().to_numpy()[-self.window:], maxlen=self.window)
+        self.gain_total, self.loss_total = float(sum(self.gains)), float(sum(self.losses))
+        return {self.columns[0]: out}
+
+    def update(self, close, volume):
+        if self.prev is None:
+            self.prev = close
+            return {self.columns[0]: NAN}
+        delta, self.prev = close - self.prev, close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self.seen += 1
+
+        if self.smoothing == "wilder":
+            if self.seen == 1:
+                self.avg_gain, self.avg_loss = gain, loss
+            else:
+                a = 1 / self.window
+                self.avg_gain += a * (gain - self.avg_gain)
+                self.avg_loss += a * (loss - self.avg_loss)
+            if self.seen < self.window:
+                return {self.columns[0]: NAN}
+            return {self.columns[0]: self._rsi(self.avg_gain, self.avg_loss)}
+
+        if len(self.gains) == self.window:
+            self.gain_total -= self.gains[0]
+            self.loss_total -= self.losses[0]
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_total += gain
+        self.loss_total += loss
+        if len(self.gains) < self.window:
+            return {self.columns[0]: NAN}
+        return {self.columns[0]: self._rsi(self.gain_total / self.window, self.loss_total / self.window)}
+
+
+class Bollinger:
+    # Sliding-window Welford: mean and M2 move in O(1) as one close enters and one leaves
+    def __init__(self, window=20, width=2):
+        self.window, self.width = window, width
+        self.columns = ("BB_MID", "BB_STD", "BB_UPPER", "BB_LOWER")
+
+    def _bands(self, mid, std):
+        return {"BB_MID": mid, "BB_STD": std,
+                "BB_UPPER": mid + self.width * std, "BB_LOWER": mid - self.width * std}
+
+    def batch(self, close, volume):
+        mid = close.rolling(window=self.window).mean()
+        std = close.rolling(window=self.window).std()
+        tail = close.to_numpy()[-self.window:]
+        self.buf = deque(tail, maxlen=self.window)
+        self.mean = float(tail.mean()) if len(tail) else 0.0
+        self.m2 = float(((tail - self.mean) ** 2).sum())
+        return self._bands(mid, std)
+
+    def update(self, close, volume):
+        if len(self.buf) == self.window:
+            old = self.buf[0]
+            new_mean = self.mean + (close - old) / self.window
+            self.m2 += (close - old) * (close - new_mean + old - self.mean)
+            self.mean = new_mean
+        else:
+            delta = close - self.mean
+            self.mean += delta / (len(self.buf) + 1)
+            self.m2 += delta * (close - self.mean)
+        self.buf.append(close)
+
+        if len(self.buf) < self.window:
+            return self._bands(NAN, NAN)
+        std = math.sqrt(max(self.m2, 0.0) / (self.window - 1))
+        return self._bands(self.mean, std)
+
+
+class VWAP:
+    def __init__(self, column="VWAP"):
+        self.columns = (column,)
+
+    def batch(self, close, volume):
+        pv = close * volume
+        out = pv.cumsum() / volume.cumsum()
+        self.pv_total, self.v_total = float(pv.sum()), float(volume.sum())
+        return {self.columns[0]: out}
+
+    def update(self, close, volume):
+        self.pv_total += close * volume
+        self.v_total += volume
+        return {self.columns[0]: self.pv_total / self.v_total if self.v_total else NAN}
+
+
+INDICATORS = {"SMA": SMA, "EMA": EMA, "RSI": RSI, "Bollinger": Bollinger, "VWAP": VWAP}
+
+
+# ──────────────────────────────────────────────────────
+# Engine: full batch once, then append-only bar updates
+# ──────────────────────────────────────────────────────
+class IndicatorEngine:
+    def __init__(self, indicators):
+        self.indicators = [INDICATORS[name]() for name in indicators if name in INDICATORS]
+        self.values = {}
+        self.length = 0
+        self.last_bar = None  # (date, close, volume) of the newest bar folded in
+        self.undo = None      # indicator states from before that bar
+
+    # Copy of an indicator's rolling state; deques are the only mutable parts
+    @staticmethod
+    def _state(ind):
+        return {k: deque(v, maxlen=v.maxlen) if isinstance(v, deque) else v for k, v in vars(ind).items()}
+
+    # Every bar but the last in one pass, then the last one through append() so it can be revised in place
+    def batch(self, df):
+        head = df.iloc[:-1]
+        self.values = {}
+        for ind in self.indicators:
+            for col, series in ind.batch(head["Close"], head["Volume"]).items():
+                self.values[col] = series.to_numpy(dtype=np.float64).tolist()
+        self.length = len(head)
+        self.last_bar = self.undo = None
+        if len(df):
+            self.append(df.iloc[-1])
+        return self.values
+
+    # O(1) per indicator: fold one new bar into every rolling state
+    def append(self, bar):
+        close, volume = float(bar["Close"]), float(bar["Volume"])
+        self.undo = [self._state(ind) for ind in self.indicators]
+        latest = {}
+        for ind in self.indicators:
+            latest.update(ind.update(close, volume))
+        for col, value in latest.items():
+            self.values[col].append(value)
+        self.length += 1
+        self.last_bar = (bar["Date"], close, volume)
+        return latest
+
+    # Still-forming bar revised in place: roll every state back one bar and fold in the new values
+    def revise_last(self, bar):
+        for ind, state in zip(self.indicators, self.undo):
+            vars(ind).update(state)
+        for values in self.values.values():
+            values.pop()
+        self.length -= 1
+        return self.append(bar)
+
+    # Bring the engine level with df: append only unseen bars, recompute just the last bar if only it
+    # was revised (a still-forming higher-timeframe bucket), full batch if older history changed
+    def sync(self, df):
+        n = self.length
+        if n == 0 or len(df) < n or df["Date"].iat[n - 1] != self.last_bar[0]:
+            self.batch(df)
+        else:
+            if (float(df["Close"].iat[n - 1]), float(df["Volume"].iat[n - 1])) != self.last_bar[1:]:
+                self.revise_last(df.iloc[n - 1])
+            for bar in df.iloc[n:].to_dict("records"):
+                self.append(bar)
+        for col, values in self.values.items():
+            df[col] = values
+        return df
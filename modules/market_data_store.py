@@ -0,0 +1,143 @@
+import os
+import zlib
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# data/market/<SYMBOL>/<TIMEFRAME>/<Column>.bin — one raw fixed-dtype column per file,
+# memory-mapped on read so slicing years of bars never copies the full history.
+STORE_ROOT = os.path.join(os.path.dirname(__file__), "..", "data", "market")
+
+SCHEMA = {
+    "Date": np.dtype("<i8"),   # nanoseconds since epoch
+    "Open": np.dtype("<f8"),
+    "High": np.dtype("<f8"),
+    "Low": np.dtype("<f8"),
+    "Close": np.dtype("<f8"),
+    "Volume": np.dtype("<f8"),
+}
+
+# Bars simulated for a demo symbol that has nothing stored yet (~10y daily)
+SIMULATED_HISTORY = 2520
+
+FREQ = {"1D": "B", "1H": "h", "30min": "30min", "15min": "15min", "5min": "5min", "1min": "min"}
+
+
+def _series_dir(symbol, timeframe, root=None):
+    return os.path.join(root or STORE_ROOT, symbol.upper(), timeframe)
+
+
+def _column_path(symbol, timeframe, column, root=None):
+    return os.path.join(_series_dir(symbol, timeframe, root), f"{column}.bin")
+
+
+def _encode(df):
+    cols = {"Date": pd.to_datetime(df["Date"]).to_numpy(dtype="datetime64[ns]").view("<i8")}
+    for col in SCHEMA:
+        if col != "Date":
+            values = df[col] if col in df else np.zeros(len(df))
+            cols[col] = np.ascontiguousarray(values, dtype=SCHEMA[col])
+    return cols
+
+
+# ─────────────────────────────────────────────
+# Writers
+# ─────────────────────────────────────────────
+def write_bars(symbol, timeframe, df, root=None):
+    folder = _series_dir(symbol, timeframe, root)
+    os.makedirs(folder, exist_ok=True)
+    for col, values in _encode(df).items():
+        path = _column_path(symbol, timeframe, col, root)
+        values.tofile(path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+
+# O(new bars): columns are appended in place; Date goes last so readers never see a half-written bar.
+# Every column is first cut back to the common length, so bars left by a crashed append can't misalign new ones
+def append_bars(symbol, timeframe, df, root=None):
+    if not has_series(symbol, timeframe, root):
+        return write_bars(symbol, timeframe, df, root)
+    encoded = _encode(df)
+    n = series_length(symbol, timeframe, root)
+    for col in [c for c in SCHEMA if c != "Date"] + ["Date"]:
+        with open(_column_path(symbol, timeframe, col, root), "r+b") as f:
+            f.truncate(n * SCHEMA[col].itemsize)
+            f.seek(0, os.SEEK_END)
+            encoded[col].tofile(f)
+
+
+# ─────────────────────────────────────────────
+# Readers
+# ─────────────────────────────────────────────
+def has_series(symbol, timeframe="1D", root=None):
+    return os.path.exists(_column_path(symbol, timeframe, "Date", root))
+
+
+def list_symbols(timeframe="1D", root=None):
+    root = root or STORE_ROOT
+    if not os.path.isdir(root):
+        return []
+    return sorted(s for s in os.listdir(root) if has_series(s, timeframe, root))
+
+
+def series_length(symbol, timeframe="1D", root=None):
+    # Shortest column wins, so a crash mid-append only hides the unfinished bar
+    return min(os.path.getsize(_column_path(symbol, timeframe, col, root)) // dtype.itemsize
+               for col, dtype in SCHEMA.items())
+
+
+# Zero-copy column views: {column: np.memmap}; Date is exposed as datetime64[ns]
+def open_columns(symbol, timeframe="1D", columns=None, root=None):
+    n = series_length(symbol, timeframe, root)
+    views = {}
+    for col in columns or SCHEMA:
+        if n == 0:
+            views[col] = np.empty(0, dtype=SCHEMA[col])
+        else:
+            views[col] = np.memmap(_column_path(symbol, timeframe, col, root), dtype=SCHEMA[col], mode="r", shape=(n,))
+        if col == "Date":
+            views[col] = views[col].view("datetime64[ns]")
+    return views
+
+
+def load_ohlcv(symbol, timeframe="1D", start=None, end=None, last=None, columns=None, root=None):
+    views = open_columns(symbol, timeframe, root=root)
+    dates = views["Date"]
+    lo, hi = 0, len(dates)
+    if start is not None:
+        lo = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns"), side="left"))
+    if end is not None:
+        hi = int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), side="right"))
+    if last is not None:
+        lo = max(lo, hi - last)
+    wanted = ["Date"] + [c for c in (columns or SCHEMA) if c != "Date"]
+    return pd.DataFrame({col: views[col][lo:hi] for col in wanted}, copy=False)
+
+
+# ─────────────────────────────────────────────
+# Shared loader for every chart / pattern module
+# ─────────────────────────────────────────────
+def simulate_ohlcv(symbol, bars=SIMULATED_HISTORY, timeframe="1D"):
+    rng = np.random.default_rng(zlib.crc32(symbol.upper().encode()))
+    base = 100 + np.cumsum(rng.standard_normal(bars))
+    open_ = base + rng.uniform(-1, 1, bars)
+    close = base + rng.uniform(-1, 1, bars)
+    return pd.DataFrame({
+        "Date": pd.date_range(end=datetime.today().date(), periods=bars, freq=FREQ.get(timeframe, "B")),
+        "Open": open_,
+        "High": np.maximum(open_, close) + rng.uniform(0, 2, bars),
+        "Low": np.minimum(open_, close) - rng.uniform(0, 2, bars),
+        "Close": close,
+        "Volume": rng.integers(500_000, 5_000_000, bars).astype(np.float64),
+    })
+
+
+# Last `bars` bars of symbol/timeframe (fewer if that is all that is stored). A stored series is
+# never touched; simulate=True (demo charts only) seeds simulated history for a symbol with none
+def load_ohlc(symbol="CAMBO", timeframe="1D", bars=None, root=None, simulate=False):
+    if not has_series(symbol, timeframe, root):
+        if not simulate:
+            raise FileNotFoundError(f"no {timeframe} bars stored for {symbol.upper()}")
+        write_bars(symbol, timeframe, simulate_ohlcv(symbol, max(bars or 0, SIMULATED_HISTORY), timeframe), root)
+    return load_ohlcv(symbol, timeframe, last=bars, root=root)
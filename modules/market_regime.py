@@ -0,0 +1,253 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+try:
+    from modules.market_data_store import list_symbols, load_ohlcv
+except ImportError:
+    from market_data_store import list_symbols, load_ohlcv
+
+# ─────────────────────────────────────────────
+# Market regimes: 3-state Gaussian HMM on (log return, log realised vol) per
+# ticker, fitted in a process pool; states are ordered by mean return so
+# code 0/1/2 means the same thing for every ticker.
+# ─────────────────────────────────────────────
+REGIME_LABELS = ("Bear", "Neutral", "Bull")
+N_STATES = len(REGIME_LABELS)
+N_FEATURES = 2
+VOL_WINDOW = 10      # bars in the realised-volatility estimate
+MIN_OBS = 120        # tickers with less usable history are left unlabelled (-1)
+FIT_ITER = 50
+CHUNK_SIZE = 50      # tickers fitted per pool task
+DECODE_BATCH = 512   # tickers decoded together (bounds the (batch, T, K) work arrays)
+
+REGIMES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "market_regimes.npz")
+
+
+# ─────────────────────────────────────────────
+# Panel + features
+# ─────────────────────────────────────────────
+def store_universe(timeframe="1D", days=756, symbols=None):
+    symbols = symbols or list_symbols(timeframe)
+    return {s: load_ohlcv(s, timeframe, last=days, columns=["Close"]) for s in symbols}
+
+
+# {symbol: frame with Date/Close} → (dates, symbols, closes[T, N]) aligned on the union of dates
+def close_panel(universe):
+    symbols = list(universe)
+    closes = pd.concat({s: universe[s].set_index("Date")["Close"] for s in symbols}, axis=1).sort_index()
+    return closes.index, symbols, closes.to_numpy(dtype=np.float64)
+
+
+# (N, T, 2) standardised features; NaN where a ticker has no data or not enough warm-up
+def regime_features(closes):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ret = np.diff(np.log(closes), axis=0, prepend=np.nan)
+    sq = pd.DataFrame(log_ret ** 2)
+    rv = np.sqrt(sq.rolling(VOL_WINDOW, min_periods=VOL_WINDOW).mean().to_numpy())
+    with np.errstate(divide="ignore"):
+        feats = np.stack([log_ret, np.log(rv + 1e-12)], axis=-1).transpose(1, 0, 2)
+    feats[~np.isfinite(feats).all(axis=-1)] = np.nan
+    mean = np.nanmean(feats, axis=1, keepdims=True)
+    std = np.nanstd(feats, axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.ascontiguousarray((feats - mean) / std)
+
+
+# ─────────────────────────────────────────────
+# Pool fitting over a shared-memory feature block
+# ─────────────────────────────────────────────
+_worker = {}
+
+
+def _attach(shm_name, shape):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["feats"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def fit_ticker(x):
+    from hmmlearn import hmm
+
+    x = x[np.isfinite(x).all(axis=1)]
+    if len(x) < MIN_OBS:
+        return None
+    model = hmm.GaussianHMM(n_components=N_STATES, covariance_type="diag", n_iter=FIT_ITER, random_state=7)
+    model.fit(x)
+    order = np.argsort(model.means_[:, 0])  # Bear → Bull by mean return
+    variances = np.diagonal(model.covars_, axis1=1, axis2=2)
+    return (model.means_[order], variances[order],
+            model.startprob_[order], model.transmat_[np.ix_(order, order)])
+
+
+def _fit_chunk(first, last):
+    started = time.process_time()
+    params = {}
+    for i in range(first, last):
+        try:
+            fitted = fit_ticker(_worker["feats"][i])
+        except (ValueError, np.linalg.LinAlgError):
+            fitted = None  # degenerate series (flat prices, too few distinct values)
+        if fitted is not None:
+            params[i] = fitted
+    return {"pid": os.getpid(), "first": first, "last": last,
+            "busy": time.process_time() - started, "params": params}
+
+
+# ─────────────────────────────────────────────
+# Batched Viterbi: every ticker in a batch advances one bar per step
+# ─────────────────────────────────────────────
+def _log_emissions(feats, means, variances):
+    # (B, T, D) x (B, K, D) → (B, T, K) diagonal-Gaussian log-likelihoods; missing bars are uninformative
+    diff = feats[:, :, None, :] - means[:, None, :, :]
+    ll = -0.5 * (np.log(2 * np.pi * variances)[:, None, :, :] + diff ** 2 / variances[:, None, :, :]).sum(axis=-1)
+    return np.nan_to_num(ll, nan=0.0)
+
+
+def viterbi_panel(feats, means, variances, startprob, transmat):
+    n, steps = feats.shape[:2]
+    log_b = _log_emissions(feats, means, variances)
+    with np.errstate(divide="ignore"):
+        log_a, log_pi = np.log(transmat), np.log(startprob)
+    back = np.empty((n, steps, N_STATES), dtype=np.int8)
+    delta = log_pi + log_b[:, 0]
+    for t in range(1, steps):
+        scores = delta[:, :, None] + log_a  # (B, from, to)
+        back[:, t] = scores.argmax(axis=1)
+        delta = scores.max(axis=1) + log_b[:, t]
+    path = np.empty((n, steps), dtype=np.int8)
+    path[:, -1] = delta.argmax(axis=1)
+    for t in range(steps - 1, 0, -1):
+        path[:, t - 1] = back[np.arange(n), t, path[:, t]]
+    return path
+
+
+# ─────────────────────────────────────────────
+# Overnight job: features → pool fit → batched decode → data/market_regimes.npz
+# ─────────────────────────────────────────────
+def run_market_regimes(universe=None, workers=None, chunk_size=CHUNK_SIZE, save=True):
+    started = time.perf_counter()
+    dates, symbols, closes = close_panel(universe if universe is not None else store_universe())
+    feats = regime_features(closes)
+    n = len(symbols)
+
+    means = np.full((n, N_STATES, N_FEATURES), np.nan)
+    variances = np.ones((n, N_STATES, N_FEATURES))
+    startprob = np.full((n, N_STATES), 1.0 / N_STATES)
+    transmat = np.full((n, N_STATES, N_STATES), 1.0 / N_STATES)
+    fitted = np.zeros(n, dtype=bool)
+    busy = {}
+
+    shm = shared_memory.SharedMemory(create=True, size=max(feats.nbytes, 8))
+    try:
+        np.ndarray(feats.shape, dtype=np.float64, buffer=shm.buf)[:] = feats
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, initializer=_attach,
+                                 initargs=(shm.name, feats.shape)) as pool:
+            futures = [pool.submit(_fit_chunk, first, min(first + chunk_size, n))
+                       for first in range(0, n, chunk_size)]
+            for future in as_completed(futures):
+                result = future.result()
+                busy[result["pid"]] = busy.get(result["pid"], 0.0) + result["busy"]
+                for i, (mu, var, pi, a) in result["params"].items():
+                    means[i], variances[i], startprob[i], transmat[i] = mu, var, pi, a
+                    fitted[i] = True
+    finally:
+        shm.close()
+        shm.unlink()
+    fit_secs = time.perf_counter() - started
+
+    codes = np.full((n, len(dates)), -1, dtype=np.int8)
+    for lo in range(0, n, DECODE_BATCH):
+        idx = np.flatnonzero(fitted[lo:lo + DECODE_BATCH]) + lo
+        if len(idx):
+            codes[idx] = viterbi_panel(feats[idx], means[idx], variances[idx], startprob[idx], transmat[idx])
+    codes[np.isnan(closes.T)] = -1
+
+    elapsed = time.perf_counter() - started
+    result = {
+        "dates": np.asarray(dates, dtype="datetime64[ns]"),
+        "symbols": np.asarray(symbols),
+        "codes": codes,
+        "labels": np.asarray(REGIME_LABELS),
+        "fit_secs": fit_secs,
+        "elapsed": elapsed,
+        "tickers_per_sec": n / elapsed if elapsed else 0.0,
+        "utilisation": {pid: round(b / elapsed, 3) for pid, b in busy.items()},
+    }
+    if save:
+        save_regimes(result)
+    return result
+
+
+# ─────────────────────────────────────────────
+# Persistence + readers for the regime console and the execution path
+# ─────────────────────────────────────────────
+def save_regimes(result, path=None):
+    path = path or REGIMES_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        np.savez_compressed(f, dates=result["dates"], symbols=result["symbols"],
+                            codes=result["codes"], labels=result["labels"])
+    os.replace(path + ".tmp", path)
+
+
+_loaded = {}
+
+
+def load_regimes(path=None):
+    path = path or REGIMES_PATH
+    if not os.path.exists(path):
+        return None
+    sig = os.stat(path).st_mtime_ns
+    if _loaded.get(path, (None,))[0] != sig:
+        with np.load(path) as data:
+            result = {key: data[key] for key in data.files}
+        result["row"] = {s: i for i, s in enumerate(result["symbols"].tolist())}
+        _loaded[path] = (sig, result)
+    return _loaded[path][1]
+
+
+# Date × Symbol frame of regime labels ("" where a ticker is unlabelled)
+def regime_frame(result, symbols=None, last=None):
+    rows = [result["row"][s] for s in symbols] if symbols else slice(None)
+    codes = result["codes"][rows]
+    if last:
+        codes = codes[:, -last:]
+    dates = result["dates"][-codes.shape[1]:]
+    names = np.append(result["labels"], "")  # code -1 → ""
+    syms = symbols or result["symbols"].tolist()
+    return pd.DataFrame(names[codes].T, index=pd.DatetimeIndex(dates, name="Date"), columns=syms)
+
+
+def latest_regime(symbol, path=None):
+    result = load_regimes(path)
+    if result is None or str(symbol).upper() not in result["row"]:
+        return None
+    code = result["codes"][result["row"][str(symbol).upper()], -1]
+    return str(result["labels"][code]) if code >= 0 else None
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Nightly job: the stored universe → data/market_regimes.npz.
+    # `--benchmark` fits a simulated universe instead and never touches the real regimes file
+    if "--benchmark" in sys.argv:
+        import tempfile
+        from modules.pattern_scanner import generate_universe
+
+        result = run_market_regimes(generate_universe(n_symbols=1000, days=756), save=False)
+        path = os.path.join(tempfile.mkdtemp(), "market_regimes.npz")
+        save_regimes(result, path)
+        print(f"💾 round trip via {path}: {load_regimes(path)['codes'].shape == result['codes'].shape}")
+    else:
+        result = run_market_regimes()
+    print(f"{len(result['symbols'])} tickers in {result['elapsed']:.1f}s "
+          f"(fit {result['fit_secs']:.1f}s) → {result['tickers_per_sec']:.0f} tickers/sec")
+    latest = regime_frame(result).iloc[-1].replace("", "Unlabelled").value_counts()
+    print("Latest regime mix:", latest.to_dict())
+    print("Worker utilisation:", result["utilisation"])
@@ -1,6 +1,264 @@
-def update_weights(trade_log):
-    if recent_accuracy["pattern"] > recent_accuracy["sentiment"]:
-        fusion_weights["pattern"] += 0.05
-    else:
-        fusion_weights["sentiment"] += 0.05
-    normalize_weights(fusion_weights)
+import os, json, math, threading, time, atexit
+from datetime import datetime
+
+# ─────────────────────────────────────────────
+# Online fusion-weight learning: every source (the three fusion streams and
+# each AI voter) keeps a multiplicative-weights log-weight plus an
+# exponentially weighted hit rate. A closed paper round trip scores the
+# predictions captured when it was opened against its realised P&L — O(1)
+# per source, no history replay. State snapshots to data/fusion_weights.json.
+# ─────────────────────────────────────────────
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "fusion_weights.json")
+FUSION_SOURCES = ("voting", "pattern", "sentiment")
+VOTER_PREFIX = "voter:"
+ETA = 0.2                 # learning rate: a fully wrong call costs e^-0.2 of a source's weight
+SHARE = 0.02              # fixed-share mixing: a slice of weight returns to every source, so none is written off
+ACCURACY_HALF_LIFE = 50   # closed trades
+SAVE_EVERY = 25           # closed trades between snapshots...
+SAVE_INTERVAL = 30.0      # ...or seconds since the last one once anything changed, fills on open round trips
+                          # included — checked as each order batch lands (plus one at exit)
+
+
+def _group(name):
+    return "voters" if name.startswith(VOTER_PREFIX) else "fusion"
+
+
+class FusionWeightLearner:
+    def __init__(self, path=None, eta=ETA, share=SHARE, half_life=ACCURACY_HALF_LIFE):
+        self.path = path or STATE_PATH
+        self.eta, self.share = eta, share
+        self.alpha = 1 - 0.5 ** (1 / half_life)
+        self.lock = threading.RLock()
+        self.sources = {s: self._fresh() for s in FUSION_SOURCES}  # name → {"log_weight", "accuracy", "trades"}
+        self.positions = {}  # asset → open round trip {"qty", "avg_price", "realised", "predictions"}
+        self.closed_trades = 0
+        self.unsaved = 0       # closed trades since the last snapshot
+        self.dirty = False     # anything (open round trips included) changed since the last snapshot
+        self.saved_at = time.monotonic()
+        self.load()
+
+    @staticmethod
+    def _fresh():
+        return {"log_weight": 0.0, "accuracy": 0.5, "trades": 0}
+
+    # ─────────────────────────────────────────────
+    # Learning step
+    # ─────────────────────────────────────────────
+    # predictions: {source: score in [-1, 1]} at entry; a source in the group that said nothing scores 0
+    def update(self, predictions, pnl):
+        outcome = (pnl > 0) - (pnl < 0)
+        if not outcome:
+            return False
+        with self.lock:
+            for name in predictions:
+                self.sources.setdefault(name, self._fresh())  # new voters start level with the best
+            groups = {}
+            for name, stats in self.sources.items():
+                pred = max(-1.0, min(1.0, float(predictions.get(name) or 0.0)))
+                stats["log_weight"] -= self.eta * (1 - pred * outcome) / 2  # loss in [0, 1]; abstain = 0.5
+                if pred:
+                    stats["accuracy"] += self.alpha * (float(pred * outcome > 0) - stats["accuracy"])
+                    stats["trades"] += 1
+                groups.setdefault(_group(name), []).append(stats)
+            for members in groups.values():  # mix toward uniform, then put the best source of the group at 0
+                top = max(s["log_weight"] for s in members)
+                raw = [math.exp(s["log_weight"] - top) for s in members]
+                total = sum(raw)
+                mixed = [(1 - self.share) * r / total + self.share / len(raw) for r in raw]
+                best = max(mixed)
+                for s, w in zip(members, mixed):
+                    s["log_weight"] = math.log(w / best)
+            self.closed_trades += 1
+            self.unsaved += 1
+            self.dirty = True
+        return True
+
+    # ─────────────────────────────────────────────
+    # Round-trip tracking from paper fills
+    # ─────────────────────────────────────────────
+    def _apply_fill(self, asset, qty, price, predictions):
+        pos = self.positions.get(asset)
+        if pos is None:
+            self.positions[asset] = {"qty": qty, "avg_price": price, "realised": 0.0, "predictions": dict(predictions)}
+            return
+        if (pos["qty"] > 0) == (qty > 0):
+            total = pos["qty"] + qty
+            pos["avg_price"] = (pos["avg_price"] * pos["qty"] + price * qty) / total
+            pos["qty"] = total
+            return
+        closing = min(abs(qty), abs(pos["qty"]))
+        direction = 1.0 if pos["qty"] > 0 else -1.0
+        pos["realised"] += closing * (price - pos["avg_price"]) * direction
+        pos["qty"] -= closing * direction
+        if abs(pos["qty"]) < 1e-9:
+            self.update(pos["predictions"], pos["realised"])
+            del self.positions[asset]
+            leftover = qty + closing * direction  # a flip opens a new round trip with the rest
+            if abs(leftover) > 1e-9:
+                self._apply_fill(asset, leftover, price, predictions)
+
+    # Terminal orders from order_router (fills + meta["sources"] captured at signal time).
+    # Runs on the router's sink path, so snapshots are debounced rather than written per batch
+    def record_orders(self, orders, save=True):
+        closed_before = self.closed_trades
+        with self.lock:
+            for order in orders:
+                sign = 1.0 if order.side == "buy" else -1.0
+                for fill in order.fills:
+                    self._apply_fill(order.asset, sign * fill.quantity, fill.price, order.meta.get("sources", {}))
+                    self.dirty = True
+            closed = self.closed_trades - closed_before
+            if save and self.dirty:
+                self.maybe_save()
+        return closed
+
+    def maybe_save(self):
+        if self.unsaved >= SAVE_EVERY or (self.dirty and time.monotonic() - self.saved_at >= SAVE_INTERVAL):
+            self.save()
+
+    # Exit hook: whatever the debounce still holds
+    def flush(self):
+        if self.dirty:
+            self.save()
+
+    # ─────────────────────────────────────────────
+    # Weights
+    # ─────────────────────────────────────────────
+    # Relative multipliers averaging 1 across `names` (softmax of the log-weights)
+    def multipliers(self, names):
+        with self.lock:
+            logs = [self.sources.get(n, self._fresh())["log_weight"] for n in names]
+        if not logs:
+            return {}
+        top = max(logs)
+        raw = [math.exp(l - top) for l in logs]
+        scale = len(raw) / sum(raw)
+        return {n: r * scale for n, r in zip(names, raw)}
+
+    def fusion_multipliers(self):
+        return self.multipliers(FUSION_SOURCES)
+
+    def voter_multipliers(self):
+        with self.lock:
+            voters = [n for n in self.sources if n.startswith(VOTER_PREFIX)]
+        return {n[len(VOTER_PREFIX):]: m for n, m in self.multipliers(voters).items()}
+
+    def report(self):
+        with self.lock:
+            rows = [{"source": n, "multiplier": m, **self.sources[n]}
+                    for group in (list(FUSION_SOURCES), [n for n in self.sources if n.startswith(VOTER_PREFIX)])
+                    for n, m in self.multipliers(group).items()]
+        return rows
+
+    # ─────────────────────────────────────────────
+    # Snapshots (tmp + os.replace)
+    # ─────────────────────────────────────────────
+    def save(self):
+        with self.lock:
+            state = {"saved_at": datetime.now().isoformat(), "closed_trades": self.closed_trades,
+                     "eta": self.eta, "share": self.share, "sources": self.sources, "positions": self.positions}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(self.path + ".tmp", self.path)
+            self.unsaved, self.dirty, self.saved_at = 0, False, time.monotonic()
+
+    # A missing or unreadable snapshot starts fresh; a corrupt one is kept aside as <path>.corrupt
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if not isinstance(state, dict):
+                raise ValueError("snapshot is not a JSON object")
+        except (OSError, ValueError):
+            try:
+                os.replace(self.path, self.path + ".corrupt")
+            except OSError:
+                pass
+            return
+        with self.lock:
+            self.sources.update(state.get("sources", {}))
+            self.positions = state.get("positions", {})
+            self.closed_trades = state.get("closed_trades", 0)
+
+
+_learner = None
+_learner_lock = threading.Lock()
+_latest_votes = {}  # asset → {engine: signal} from the last voting round
+
+
+def learner():
+    global _learner
+    with _learner_lock:
+        if _learner is None:
+            _learner = FusionWeightLearner()
+            atexit.register(_learner.flush)
+            _push(_learner)
+    return _learner
+
+
+def _push(model):
+    from modules.fusion_engine import fusion_engine
+
+    fusion_engine.set_multipliers(model.fusion_multipliers())
+
+
+def record_votes(asset, votes):
+    _latest_votes[asset.lower()] = {engine: vote["signal"] for engine, vote in votes.items()}
+
+
+# What every source was saying about `asset` when a trade is signalled
+def entry_predictions(asset):
+    from modules.fusion_engine import fusion_engine, signal_score
+
+    predictions = {}
+    row = fusion_engine.fused_signal(asset)
+    if row:
+        predictions.update({s: row[s] for s in FUSION_SOURCES if row[f"{s}_age"] != float("inf")})
+    for engine, signal in _latest_votes.get(asset.lower(), {}).items():
+        predictions[VOTER_PREFIX + engine] = signal_score(signal)
+    return predictions
+
+
+# order_router sink: closed paper orders → learner → fusion engine multipliers
+def learning_sink(fills, closed):
+    model = learner()
+    if model.record_orders(closed):
+        _push(model)
+
+
+# Batch entry point: closed trades as {"predictions": {...}, "pnl": float}
+def update_weights(closed_trades):
+    model = learner()
+    for trade in closed_trades:
+        model.update(trade["predictions"], trade["pnl"])
+    model.save()
+    _push(model)
+    return model.fusion_multipliers()
+
+
+if __name__ == "__main__":
+    import random, tempfile, time
+
+    rng = random.Random(5)
+    hit_rate = {"pattern": 0.62, "sentiment": 0.50, "voting": 0.56,
+                "voter:grok": 0.66, "voter:chatgpt": 0.55, "voter:gemini": 0.50, "voter:tradegpt": 0.44}
+    path = os.path.join(tempfile.mkdtemp(), "fusion_weights.json")
+    model = FusionWeightLearner(path=path)
+
+    started = time.perf_counter()
+    n = 5_000
+    for _ in range(n):
+        outcome = rng.choice((-1, 1))
+        predictions = {s: outcome if rng.random() < p else -outcome for s, p in hit_rate.items()}
+        model.update(predictions, pnl=outcome * rng.uniform(1, 50))
+    elapsed = time.perf_counter() - started
+    model.save()
+    print(f"⚡ {n} closed trades in {elapsed * 1e3:.1f} ms ({elapsed / n * 1e6:.1f} µs per update)")
+    for row in model.report():
+        print(f"  {row['source']:<16} true hit {hit_rate[row['source']]:.0%}  ew accuracy {row['accuracy']:.0%}  "
+              f"multiplier {row['multiplier']:.2f}")
+    restored = FusionWeightLearner(path=path)
+    print(f"💾 restored from snapshot: {restored.fusion_multipliers() == model.fusion_multipliers()}")
@@ -1,6 +1,6 @@
-import json, os
 from datetime import datetime, timedelta
 import random
+from myth_legacy_store import replace_legacy
 
 def synth_myth(archetypes, moods):
     arch = random.choice(archetypes)
@@ -8,7 +8,6 @@ def synth_myth(archetypes, moods):
     return f"The {arch} felt a shift and proclaimed '{mood}' through the mythstream."
 
 def drop_mock_legacy():
-    path = os.path.join(os.path.expanduser("~"), "CamboStation_QuantumOS", "modules", "myth_legacy.json")
     logs = {}
 
     archetypes = ["Oracle", "Ghost", "Trickster", "Hero", "Seeker"]
@@ -18,8 +17,7 @@ def drop_mock_legacy():
         dt = (datetime.today() - timedelta(days=i)).strftime("%Y-%m-%d")
         logs[dt] = synth_myth(archetypes, moods)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    replace_legacy(logs)
 
     print("✅ Mock legacy injected with 7 synthetic myth entries.")
 
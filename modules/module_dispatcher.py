@@ -1,7 +1,13 @@
 ﻿import streamlit as st
-import json, os
+import json, os, time
 
 from modules import voting_system, pattern_engine, sentiment_grid, execution_agent
+from modules.consensus_engine import tally_votes
+from modules.chart_pattern_engine import detect_structures
+from modules.market_data_store import has_series, load_ohlc
+from modules.engine_client import fetch_votes
+from modules.fusion_engine import fusion_engine
+from modules.meta_learning_genome import learner, record_votes
 
 def load_manifest():
     manifest_path = os.path.join(os.path.dirname(__file__), "..", "config", "modules.manifest.json")
@@ -14,13 +20,18 @@ def load_manifest():
 def dispatch_modules(selected_asset):
     manifest = load_manifest()
 
+    # Pattern stream first, so the vote below sees it for the same asset
+    if manifest.get("features", {}).get("pattern_engine", False):
+        scan_patterns(selected_asset)
+
     # Dispatch Voting System if toggled
     if manifest.get("features", {}).get("voting_system", False):
         st.markdown("### 🗳 AI Voting Consensus")
-        signal = render_voting(selected_asset)
+        signal = render_voting(selected_asset, live=manifest.get("features", {}).get("live_engines", False))
         if signal["majority"] in ["buy", "sell"] and signal["confidence"] >= 0.75:
             st.markdown("### 🎯 Signal Routed to Execution Agent")
-            execution_agent.render(signal["majority"], signal["confidence"])
+            execution_agent.render(signal["majority"], signal["confidence"], asset=selected_asset,
+                                   vote_ts=signal.get("ts"))
 
     # Dispatch Pattern + Sentiment (example)
     if manifest.get("features", {}).get("pattern_engine", False):
@@ -28,7 +39,16 @@ def dispatch_modules(selected_asset):
     if manifest.get("features", {}).get("sentiment_grid", False):
         sentiment_grid.render()
 
-def render_voting(asset):
+# Structure scan → pattern stream, keyed like the voting stream. Uses the asset's stored daily bars,
+# or the demo chart series until a feed writes them
+def scan_patterns(asset, bars=150):
+    symbol = asset.upper() if has_series(asset.upper()) else "CAMBO"
+    structures = detect_structures(load_ohlc(symbol, "1D", bars=bars, simulate=True))
+    detected = list(zip(structures["Date"].to_numpy(), structures["Pattern"]))
+    fusion_engine.publish_latest_pattern(asset, detected)
+    return detected
+
+def render_voting(asset, live=False):
     engine_signals = {
         "stocks": {
             "grok": {"signal": "buy", "confidence": 0.82},
@@ -44,23 +64,43 @@ def render_voting(asset):
         }
     }
 
-    signals = engine_signals.get(asset.lower(), {})
-    if not signals:
+    # The pattern / sentiment streams vote next to the AI engines, so the Signal Weight Configurator
+    # splits the vote between the three blocks; within the voting block the learned voter weights apply
+    weights, scales = st.session_state.get("signal_weights"), learner().voter_multipliers()
+    streams = fusion_engine.stream_votes(asset, ("pattern", "sentiment"))
+
+    # Live mode: fan out to the engine endpoints (engine_client), partial quorum if some are late;
+    # the early stop weighs votes exactly like the tally below
+    if live:
+        result = fetch_votes([asset.lower()], weights=weights, scales=scales,
+                             fixed={asset.lower(): streams})[asset.lower()]
+        for engine, reason in result["failed"].items():
+            st.caption(f"⏱ {reason}")
+        if not result["quorum"]:
+            st.warning("Not enough AI engines answered in time — holding at neutral.")
+            return {"majority": "neutral", "confidence": 0.0}
+        engine_signals = {asset.lower(): result["votes"]}
+
+    if asset.lower() not in engine_signals:
         st.warning("No signals defined for this asset class.")
         return {"majority": "neutral", "confidence": 0.0}
 
-    vote_count = {}
-    total_conf = 0
-    for engine, vote in signals.items():
-        signal = vote["signal"]
-        conf = vote["confidence"]
-        vote_count[signal] = vote_count.get(signal, 0) + 1
-        total_conf += conf
+    record_votes(asset, engine_signals[asset.lower()])
+    engine_signals[asset.lower()] = {**engine_signals[asset.lower()], **streams}
+    consensus = tally_votes(engine_signals, weights=weights, scales=scales)
+    row = consensus.loc[asset.lower()]
+    majority = row["majority"]
+    avg_conf = round(float(row["confidence"]), 2)
 
-    majority = max(vote_count, key=vote_count.get)
-    avg_conf = round(total_conf / len(signals), 2)
+    # A rerun that lands on the same vote keeps its timestamp, so execution_agent routes it once
+    vote = (majority, avg_conf, tuple(sorted((e, v["signal"]) for e, v in engine_signals[asset.lower()].items())))
+    last_votes = st.session_state.setdefault("last_votes", {})
+    previous = last_votes.get(asset.lower())
+    vote_ts = previous[1] if previous and previous[0] == vote else time.time()
+    last_votes[asset.lower()] = (vote, vote_ts)
+    fusion_engine.publish("voting", asset, majority, avg_conf, ts=vote_ts)  # voting stream for signal_fusion
 
     st.markdown(f"**Majority Signal:** `{majority.upper()}`")
     st.markdown(f"**Average Confidence:** `{avg_conf}`")
 
-    return {"majority": majority, "confidence": avg_conf}
+    return {"majority": majority, "confidence": avg_conf, "ts": vote_ts}
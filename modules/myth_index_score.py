@@ -1,46 +1,24 @@
-import json
-import os
-from collections import Counter
-from datetime import datetime
+from myth_metrics import myth_metrics
 
-def compute_myth_index():
-    path = os.path.expandvars("$HOME\\CamboStation_QuantumOS\\modules\\myth_legacy.json")
-    if not os.path.exists(path):
+# window = last N sessions (30 / 90 / 365 are kept live); None = the whole legacy
+def compute_myth_index(window=None):
+    m = myth_metrics()
+    if not m.total_entries:
         return "❌ No legacy data found."
 
-    with open(path, "r", encoding="utf-8") as f:
-        logs = json.load(f)
-
-    mood_variability = 0
-    mood_list = []
-    archetype_list = []
-
-    dates = sorted(logs.keys())
-    prev_mood = None
-
-    for date in dates:
-        entry = logs[date]
-        parts = entry.split("'")
-        if len(parts) < 4: continue
-        archetype = parts[1]
-        mood = parts[3]
-        mood_list.append(mood)
-        archetype_list.append(archetype)
-
-        if prev_mood is not None and prev_mood != mood:
-            mood_variability += 1
-        prev_mood = mood
-
-    mood_vol = round(mood_variability / max(1, len(dates) - 1), 2)
-    arch_freq = Counter(archetype_list)
+    # All-time volatility keeps its original denominator (every legacy day, parsed or not)
+    analyzed = m.total_entries if window is None else m.sessions(window)
+    mood_vol = round(m.mood_changes(window) / max(1, analyzed - 1), 2)
+    arch_freq = m.archetype_spread(window)
     dominant_arch = arch_freq.most_common(1)[0][0] if arch_freq else "Unknown"
+    title = "📊 Myth Index Score" if window is None else f"📊 Myth Index Score (last {window} sessions)"
 
     summary = f"""
-📊 Myth Index Score
+{title}
 ---------------------
 🪐 Mood Volatility     → {mood_vol * 100:.0f}% variation
 🔮 Dominant Archetype  → {dominant_arch}
-📆 Sessions Analyzed   → {len(dates)}
+📆 Sessions Analyzed   → {analyzed}
 🎯 Archetype Spread    → {dict(arch_freq)}
 
 ✅ Interpretation:
@@ -0,0 +1,210 @@
+import os, json, shutil
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+
+# Legacy entries: {"YYYY-MM-DD": "... '<Archetype>' ... '<Mood>' ..."} — one myth per session day
+LEGACY_PATH = os.path.join(os.path.expanduser("~"), "CamboStation_QuantumOS", "modules", "myth_legacy.json")  # pre-shard single file
+
+
+def _readonly(values):
+    arr = np.asarray(values, dtype=object)
+    arr.flags.writeable = False
+    return arr
+
+
+# ─────────────────────────────────────────────
+# Parsed legacy: still a read-only {date: entry} mapping for old callers, plus
+# structured columns split once (archetype = parts[1], mood = parts[3])
+# ─────────────────────────────────────────────
+class LegacyLog(Mapping):
+    def __init__(self, raw):
+        dates = sorted(raw)
+        entries = [raw[d] for d in dates]
+        parts = pd.Series(entries, dtype=object).str.split("'")
+        n = parts.str.len().fillna(0).to_numpy()
+        has_quote, valid = n >= 2, n >= 4
+        has_quote.flags.writeable = valid.flags.writeable = False
+
+        self._entries = dict(zip(dates, entries))
+        self.columns = {
+            "date": _readonly(dates),
+            "entry": _readonly(entries),
+            "archetype": _readonly(np.where(valid, parts.str[1], None)),
+            "mood": _readonly(np.where(valid, parts.str[3], None)),
+            "quoted": _readonly(np.where(has_quote, parts.str[-2], None)),  # last quoted word, whatever the entry's shape
+            "has_quote": has_quote,
+            "valid": valid,
+        }
+        # Sessions that carry both an archetype and a mood, in date order
+        self.sessions = {col: _readonly(self.columns[col][valid]) for col in ("date", "archetype", "mood")}
+
+    def __getitem__(self, date):
+        return self._entries[date]
+
+    def __iter__(self):
+        return iter(self.columns["date"])
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ─────────────────────────────────────────────
+# Storage: one append-only JSONL shard per month (myth_legacy/YYYY-MM.jsonl),
+# each line {"date": ..., "entry": ...}; a later line for the same date wins.
+# The old single myth_legacy.json is split into shards on first use.
+# ─────────────────────────────────────────────
+LEGACY_DIR = os.path.join(os.path.dirname(LEGACY_PATH), "myth_legacy")
+
+
+def _shard_path(month, root=None):
+    return os.path.join(root or LEGACY_DIR, f"{month}.jsonl")
+
+
+def _line(date, entry):
+    return (json.dumps({"date": date, "entry": entry}, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_shard(month, entries, root=None):
+    # Whole-shard writes go through a temp file + os.replace, so a crash leaves the old shard intact
+    path = _shard_path(month, root)
+    with open(path + ".tmp", "wb") as f:
+        f.write(b"".join(_line(d, e) for d, e in sorted(entries.items())))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def _by_month(logs):
+    months = {}
+    for date, entry in logs.items():
+        months.setdefault(date[:7], {})[date] = entry
+    return months
+
+
+# Several processes may race here: each builds its own temp dir and the first rename wins
+def _migrate_monolith(root=None, legacy_path=None):
+    root, legacy_path = root or LEGACY_DIR, legacy_path or LEGACY_PATH
+    if os.path.isdir(root) or not os.path.exists(legacy_path):
+        return
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            logs = json.load(f)
+    except FileNotFoundError:
+        return  # another process finished the migration meanwhile
+    tmp = f"{root}.tmp{os.getpid()}"
+    os.makedirs(tmp, exist_ok=True)
+    for month, entries in _by_month(logs).items():
+        _write_shard(month, entries, tmp)
+    try:
+        os.replace(tmp, root)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isdir(root):
+            raise
+        return  # lost the race: root already holds the shards
+    try:
+        os.replace(legacy_path, legacy_path + ".migrated")
+    except FileNotFoundError:
+        pass
+
+
+# ✍️ O(1) daily logging: one appended line in the current month's shard. A torn last line
+# (crashed append) is closed off first, so the new entry doesn't get glued onto the fragment
+def append_entry(date, entry, root=None):
+    root = root or LEGACY_DIR
+    _migrate_monolith(root)
+    os.makedirs(root, exist_ok=True)
+    fd = os.open(_shard_path(date[:7], root), os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        line = _line(date, entry)
+        size = os.fstat(fd).st_size
+        if size:
+            os.lseek(fd, size - 1, os.SEEK_SET)
+            if os.read(fd, 1) != b"\n":
+                line = b"\n" + line
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+# Swap the whole legacy for `logs` (used by the mock bootloader); shards are replaced one by one
+def replace_legacy(logs, root=None):
+    root = root or LEGACY_DIR
+    _migrate_monolith(root)
+    os.makedirs(root, exist_ok=True)
+    months = _by_month(logs)
+    for month, entries in months.items():
+        _write_shard(month, entries, root)
+    for month in list_months(root):
+        if month not in months:
+            os.remove(_shard_path(month, root))
+
+
+def list_months(root=None):
+    root = root or LEGACY_DIR
+    if not os.path.isdir(root):
+        return []
+    return sorted(name[:-6] for name in os.listdir(root) if name.endswith(".jsonl"))
+
+
+# ─────────────────────────────────────────────
+# Merged read view, cached per shard by (mtime, size): an append to this
+# month re-reads one shard; every module shares the same parsed LegacyLog
+# ─────────────────────────────────────────────
+_shard_cache = {}
+_view_cache = {}
+
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_shard(path, sig):
+    cached = _shard_cache.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    entries = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue  # torn last line from a crashed append
+            entries[row["date"]] = row["entry"]
+    _shard_cache[path] = (sig, entries)
+    return entries
+
+
+# start / end are "YYYY-MM" (or full dates); only shards for those months are opened
+def load_legacy(start=None, end=None, root=None):
+    root = root or LEGACY_DIR
+    _migrate_monolith(root)
+    months = [m for m in list_months(root)
+              if (start is None or m >= start[:7]) and (end is None or m <= end[:7])]
+    paths = [_shard_path(m, root) for m in months]
+    sigs = tuple(_signature(p) for p in paths)
+
+    key = (root, start, end)
+    cached = _view_cache.get(key)
+    if cached is not None and cached[0] == (tuple(paths), sigs):
+        return cached[1]
+    raw = {}
+    for path, sig in zip(paths, sigs):
+        raw.update(_read_shard(path, sig))
+    if start is not None or end is not None:
+        raw = {d: e for d, e in raw.items() if (start is None or d >= start) and (end is None or d[:len(end)] <= end)}
+    log = LegacyLog(raw)
+    _view_cache[key] = ((tuple(paths), sigs), log)
+    return log
+
+
+if __name__ == "__main__":
+    logs = load_legacy()
+    print(f"📜 {len(logs)} legacy entries in {len(list_months())} monthly shards, "
+          f"{len(logs.sessions['mood'])} with archetype + mood")
+    print(f"🔁 cached: {load_legacy() is logs}")
@@ -1,5 +1,5 @@
-import json, os
 from datetime import datetime
+from myth_legacy_store import append_entry, load_legacy
 
 # Import your identity synthesis engine (replace with actual module if different)
 try:
@@ -9,18 +9,11 @@ except ImportError:
         return "The Oracle felt a sense of clarity and proclaimed 'Joy' through the mythstream."
 
 def log_myth_today():
-    path = os.path.join(os.path.expanduser("~"), "CamboStation_QuantumOS", "modules", "myth_legacy.json")
-
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            logs = json.load(f)
-    else:
-        logs = {}
-
     today = datetime.today().strftime("%Y-%m-%d")
-    logs[today] = synthesize_identity_myth()
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    append_entry(today, synthesize_identity_myth())  # one line in this month's shard
 
     print(f"✅ Myth snapshot logged for {today}")
+
+# 📜 Merged {date: entry} view over the monthly shards
+def read_legacy_log(start=None, end=None):
+    return load_legacy(start=start, end=end)
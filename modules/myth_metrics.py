@@ -0,0 +1,112 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+from myth_legacy_store import load_legacy
+
+# Rolling windows (in sessions) kept live alongside the all-time state
+WINDOWS = (30, 90, 365)
+
+
+# ──────────────────────────────────────────────────────
+# Streaming accumulator: each legacy session is pushed once, in date order.
+# Mood changes are kept as a prefix sum, so any trailing window's variability
+# is O(1); archetype counters for the standard windows slide with each push.
+# ──────────────────────────────────────────────────────
+class MythMetrics:
+    def __init__(self, windows=WINDOWS):
+        self.windows = tuple(windows)
+        self.reset()
+
+    def reset(self):
+        self.dates, self.moods, self.archetypes = [], [], []
+        self.cum_changes = [0]  # cum_changes[i] = mood changes among the first i sessions
+        self.transitions = Counter()  # (from mood, to mood) → count
+        self.archetype_counts = Counter()
+        self.window_archetypes = {w: Counter() for w in self.windows}
+        self.total_entries = 0  # every legacy day, parsed or not (the myth index reports this)
+        self.synced = None
+
+    def push(self, date, archetype, mood):
+        changed = False
+        if self.moods:
+            prev = self.moods[-1]
+            self.transitions[(prev, mood)] += 1
+            changed = prev != mood
+        self.cum_changes.append(self.cum_changes[-1] + changed)
+        self.dates.append(date)
+        self.moods.append(mood)
+        self.archetypes.append(archetype)
+        self.archetype_counts[archetype] += 1
+        for w, counter in self.window_archetypes.items():
+            counter[archetype] += 1
+            if len(self.archetypes) > w:
+                old = self.archetypes[-w - 1]
+                counter[old] -= 1
+                if not counter[old]:
+                    del counter[old]
+
+    # Consume only sessions appended since the last sync; anything else (an edited past day) rebuilds
+    def sync(self, logs):
+        if logs is self.synced:
+            return self
+        sessions = logs.sessions
+        n = len(self.dates)
+        same_prefix = (len(sessions["date"]) >= n
+                       and np.array_equal(sessions["date"][:n], self.dates)
+                       and np.array_equal(sessions["mood"][:n], self.moods)
+                       and np.array_equal(sessions["archetype"][:n], self.archetypes))
+        if not same_prefix:
+            self.reset()
+            n = 0
+        for date, arch, mood in zip(sessions["date"][n:], sessions["archetype"][n:], sessions["mood"][n:]):
+            self.push(date, arch, mood)
+        self.total_entries = len(logs)
+        self.synced = logs
+        return self
+
+    # ─────────────────────────────────────────────
+    # Queries (window = last N sessions, None = all time)
+    # ─────────────────────────────────────────────
+    def sessions(self, window=None):
+        n = len(self.moods)
+        return n if window is None else min(window, n)
+
+    def mood_changes(self, window=None):
+        n, k = len(self.moods), self.sessions(window)
+        return self.cum_changes[n] - self.cum_changes[n - k + 1] if k else 0
+
+    def variability(self, window=None):
+        return self.mood_changes(window) / max(1, self.sessions(window) - 1)
+
+    def archetype_spread(self, window=None):
+        if window is None or window >= len(self.archetypes):
+            return self.archetype_counts
+        if window in self.window_archetypes:
+            return self.window_archetypes[window]
+        return Counter(self.archetypes[-window:])
+
+    def transition_matrix(self, window=None):
+        if window is None or window >= len(self.moods):
+            counts = self.transitions
+        else:
+            tail = self.moods[-window:]
+            counts = Counter(zip(tail[:-1], tail[1:]))
+        if not counts:
+            return pd.DataFrame()
+        matrix = pd.Series(counts).unstack(fill_value=0)
+        return matrix.div(matrix.sum(axis=1), axis=0)
+
+
+_metrics = MythMetrics()
+
+
+def myth_metrics(logs=None):
+    return _metrics.sync(load_legacy() if logs is None else logs)
+
+
+if __name__ == "__main__":
+    m = myth_metrics()
+    print(f"Sessions: {m.sessions()}  Mood changes: {m.mood_changes()}")
+    for w in (None,) + m.windows:
+        print(f"  window {w or 'all'}: variability {m.variability(w):.2%}")
+    print(m.transition_matrix().round(2))
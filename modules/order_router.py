@@ -0,0 +1,372 @@
+import asyncio, itertools, math, random, threading, time
+from collections import Counter, deque, namedtuple
+from datetime import datetime
+import numpy as np
+
+# ─────────────────────────────────────────────
+# Paper-trading pipeline: Order → OrderRouter (one bounded asyncio queue
+# + batching worker per venue) → SimulatedBroker (in-process matching
+# engine with latency / partial fills / rejects) → fill sinks (trade log).
+# ─────────────────────────────────────────────
+BASE_QUANTITY = 100
+SIZES = {"full_trade": 1.0, "partial_trade": 0.5}  # execution_agent outcome → fraction of BASE_QUANTITY
+TERMINAL = ("filled", "rejected", "cancelled")
+
+# Same column order as the event store's fills table
+Fill = namedtuple("Fill", "timestamp order_id asset side quantity price venue latency_ms")
+
+_order_ids = itertools.count(1)
+
+
+class Order:
+    def __init__(self, asset, side, quantity, order_type="market", limit_price=None, venue=None,
+                 signal_ts=None, meta=None):
+        self.id = f"PT-{next(_order_ids):07d}"
+        self.asset, self.side, self.quantity = asset, side.lower(), float(quantity)
+        self.order_type, self.limit_price, self.venue = order_type, limit_price, venue
+        self.signal_ts = signal_ts or time.perf_counter()  # start of the signal-to-fill clock
+        self.meta = meta or {}
+        self.status = "new"  # new → routed → (resting) → partially_filled → filled, or rejected / cancelled
+        self.filled_qty = 0.0
+        self.avg_price = None
+        self.fills = []
+        self.reason = ""
+        self.done = None  # future, resolved by the router once the order is terminal
+
+    @property
+    def remaining(self):
+        return self.quantity - self.filled_qty
+
+    def apply_fill(self, fill):
+        cost = (self.avg_price or 0.0) * self.filled_qty + fill.price * fill.quantity
+        self.filled_qty += fill.quantity
+        self.avg_price = cost / self.filled_qty
+        self.fills.append(fill)
+        self.status = "filled" if self.remaining <= 1e-9 else "partially_filled"
+
+    def reject(self, reason):
+        self.status, self.reason = "rejected", reason
+
+    def summary(self):
+        return {"id": self.id, "asset": self.asset, "side": self.side, "qty": self.quantity,
+                "filled": self.filled_qty, "avg_price": self.avg_price, "status": self.status,
+                "venue": self.venue, "reason": self.reason}
+
+
+# ─────────────────────────────────────────────
+# Simulated venue: one round trip of `latency` per batch, reference prices
+# random-walk per touch, market orders fill with slippage (sometimes in two
+# pieces), limit orders fill when marketable or rest until they are
+# ─────────────────────────────────────────────
+class SimulatedBroker:
+    def __init__(self, venue, latency=0.002, jitter=0.001, partial_rate=0.1, reject_rate=0.0,
+                 slippage_bps=2.0, prices=None, price_source=None, seed=None):
+        self.venue = venue
+        self.latency, self.jitter = latency, jitter
+        self.partial_rate, self.reject_rate = partial_rate, reject_rate
+        self.slippage = slippage_bps / 1e4
+        self.prices = dict(prices or {})
+        self.price_source = price_source  # asset → opening reference price (e.g. last close)
+        self.book = {}  # asset → resting limit orders
+        self.rng = random.Random(seed)
+
+    def price(self, asset):
+        if asset not in self.prices:
+            start = self.price_source(asset) if self.price_source else 100.0
+            self.prices[asset] = start if start > 0 else 100.0  # NaN / no data → nominal 100
+        price = self.prices[asset] * math.exp(self.rng.gauss(0.0, 5e-4))
+        self.prices[asset] = price
+        return price
+
+    def _fill(self, order, quantity, price, fills):
+        now = time.perf_counter()
+        fill = Fill(datetime.now().isoformat(), order.id, order.asset, order.side, quantity, round(price, 4),
+                    self.venue, round((now - order.signal_ts) * 1e3, 3))
+        order.apply_fill(fill)
+        fills.append(fill)
+
+    def _marketable(self, order, price):
+        if order.order_type != "limit":
+            return True
+        return price <= order.limit_price if order.side == "buy" else price >= order.limit_price
+
+    def _match(self, order, fills):
+        if order.status == "cancelled":
+            return  # cancelled while still queued for the venue
+        if self.rng.random() < self.reject_rate:
+            order.reject("venue reject")
+            return
+        price = self.price(order.asset)
+        if not self._marketable(order, price):
+            order.status = "resting"
+            self.book.setdefault(order.asset, []).append(order)
+            return
+        sign = 1 if order.side == "buy" else -1
+        exec_price = price * (1 + sign * self.slippage)
+        if order.order_type == "limit":
+            exec_price = min(exec_price, order.limit_price) if sign > 0 else max(exec_price, order.limit_price)
+        if self.rng.random() < self.partial_rate and order.remaining >= 2:
+            first = max(1.0, math.floor(order.remaining * self.rng.uniform(0.3, 0.8)))
+            self._fill(order, first, exec_price, fills)
+            exec_price *= 1 + sign * self.slippage  # second piece walks the book a little further
+        self._fill(order, order.remaining, exec_price, fills)
+
+    # Resting limits on assets this batch moved get another look
+    def _sweep(self, assets, fills):
+        for asset in assets:
+            resting = self.book.get(asset)
+            if not resting:
+                continue
+            price = self.prices[asset]
+            still = []
+            for order in resting:
+                if order.status == "cancelled":
+                    continue
+                if self._marketable(order, price):
+                    self._fill(order, order.remaining, order.limit_price, fills)
+                else:
+                    still.append(order)
+            self.book[asset] = still
+
+    async def execute(self, orders):
+        await asyncio.sleep(max(0.0, self.rng.gauss(self.latency, self.jitter)))  # venue round trip
+        fills = []
+        for order in orders:
+            self._match(order, fills)
+        self._sweep({o.asset for o in orders}, fills)
+        return fills
+
+
+# ─────────────────────────────────────────────
+# Router: bounded per-venue queues (submit() waits when a venue is full),
+# one worker per venue draining up to `batch_size` orders per broker call
+# ─────────────────────────────────────────────
+class OrderRouter:
+    def __init__(self, brokers, default_venue=None, routes=None, batch_size=256, max_pending=10_000, sinks=None):
+        self.brokers = brokers
+        self.default_venue = default_venue or next(iter(brokers))
+        self.routes = routes or {}  # asset → venue
+        self.batch_size, self.max_pending = batch_size, max_pending
+        self.sinks = list(sinks or [])  # sink(fills, closed_orders), run off the loop
+        self.queues, self.workers = {}, []
+        self.open_orders = {}
+        self.latencies = deque(maxlen=100_000)  # signal-to-last-fill, ms
+        self.stats = Counter()
+        self.last_sink_error = None
+
+    async def start(self):
+        self.queues = {venue: asyncio.Queue(self.max_pending) for venue in self.brokers}
+        self.workers = [asyncio.create_task(self._venue_worker(venue)) for venue in self.brokers]
+        return self
+
+    def _prepare(self, order):
+        order.venue = order.venue or self.routes.get(order.asset, self.default_venue)
+        order.done = asyncio.get_running_loop().create_future()
+        order.status = "routed"
+        self.open_orders[order.id] = order
+        return self.queues[order.venue]
+
+    async def submit(self, order):
+        await self._prepare(order).put(order)
+        self.stats["submitted"] += 1
+        return order
+
+    # Non-waiting variant: a full venue queue rejects the order instead of stalling the caller
+    def submit_nowait(self, order):
+        queue = self._prepare(order)
+        try:
+            queue.put_nowait(order)
+            self.stats["submitted"] += 1
+        except asyncio.QueueFull:
+            order.reject("venue queue full")
+            self._close([order])
+        return order
+
+    def _close(self, orders):
+        for order in orders:
+            self.open_orders.pop(order.id, None)
+            self.stats[order.status] += 1
+            if order.status == "filled":
+                self.latencies.append(order.fills[-1].latency_ms)
+            if order.done is not None and not order.done.done():
+                order.done.set_result(order)
+
+    async def _venue_worker(self, venue):
+        queue, broker = self.queues[venue], self.brokers[venue]
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                fills = await broker.execute(batch)
+            except Exception as exc:  # a broker failure rejects the batch, the worker keeps going
+                for order in batch:
+                    order.reject(f"broker error: {exc}")
+                fills = []
+            try:
+                touched = {f.order_id for f in fills} | {o.id for o in batch}
+                closed = [self.open_orders[i] for i in touched
+                          if i in self.open_orders and self.open_orders[i].status in TERMINAL]
+                self._close(closed)
+                self.stats["batches"] += 1
+                self.stats["fills"] += len(fills)
+                for sink in self.sinks:
+                    if fills or closed:
+                        try:
+                            await asyncio.to_thread(sink, fills, closed)
+                        except Exception as exc:  # a failing sink loses its copy of the batch, not the worker
+                            self.stats["sink_errors"] += 1
+                            self.last_sink_error = f"{getattr(sink, '__name__', sink)}: {exc!r}"
+            finally:
+                for _ in batch:
+                    queue.task_done()  # drain() must never wait on a batch the worker already let go
+
+    async def drain(self):
+        await asyncio.gather(*(q.join() for q in self.queues.values()))
+
+    async def stop(self):
+        for task in self.workers:
+            task.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+
+    def cancel(self, order):
+        if order.status in ("routed", "resting"):
+            order.status = "cancelled"
+            self._close([order])
+            return True
+        return False
+
+    def latency_summary(self):
+        if not self.latencies:
+            return {}
+        lat = np.asarray(self.latencies)
+        return {"p50_ms": float(np.percentile(lat, 50)), "p99_ms": float(np.percentile(lat, 99)),
+                "max_ms": float(lat.max()), "orders": len(lat)}
+
+
+# Keeps the pre-trade risk book in step with what actually filled. The book must already exist
+# (default_router seeds it): created here, its seed would re-read this batch from the trade log
+def risk_sink(fills, closed):
+    from modules.risk_engine import risk_engine
+
+    if fills:
+        risk_engine().apply_fills(fills)
+
+
+# Closed round trips train the fusion weights (meta_learning_genome)
+def learning_sink(fills, closed):
+    from modules.meta_learning_genome import learning_sink as learn
+
+    learn(fills, closed)
+
+
+# Default sink: fills into the trade log's fills table, rejected orders as trade rows
+def trade_log_sink(fills, closed):
+    from modules import trade_log
+
+    if fills:
+        trade_log.log_fills(fills)
+    for order in closed:
+        if order.status == "rejected":
+            trade_log.log_trade(order.asset, order.side, order.meta.get("confidence"), f"order_rejected: {order.reason}")
+
+
+# ─────────────────────────────────────────────
+# Background service: the router's event loop lives on its own thread so
+# Streamlit sessions (and the execution scheduler's workers) just hand orders over
+# ─────────────────────────────────────────────
+class PaperTradingService:
+    def __init__(self, router):
+        self.router = router
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), name="paper-router", daemon=True)
+        self.thread.start()
+        ready.wait()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self.router.start())
+        ready.set()
+        self.loop.run_forever()
+
+    # Returns a concurrent Future for the routed order (blocks only while the venue queue is full)
+    def submit(self, order):
+        return asyncio.run_coroutine_threadsafe(self.router.submit(order), self.loop)
+
+
+def default_router(sinks=(trade_log_sink, risk_sink, learning_sink)):
+    from modules.risk_engine import last_close, risk_engine
+
+    risk_engine()  # seed the shared book from the stored fills before any new fill reaches the sinks
+
+    brokers = {
+        "equities_sim": SimulatedBroker("equities_sim", latency=0.002, jitter=0.001, price_source=last_close),
+        "crypto_sim": SimulatedBroker("crypto_sim", latency=0.005, jitter=0.002, partial_rate=0.2, price_source=last_close),
+    }
+    routes = {asset: "crypto_sim" for asset in ("crypto", "btc", "eth", "sol")}
+    return OrderRouter(brokers, default_venue="equities_sim", routes=routes, sinks=sinks)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def paper_service():
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = PaperTradingService(default_router())
+    return _service
+
+
+def trade_quantity(outcome):
+    return BASE_QUANTITY * SIZES.get(outcome, 0.0)
+
+
+# execution_agent entry point: routing outcome → market order on the paper venue (None if nothing to trade)
+# `sources`: what each signal source said at signal time, scored once the round trip closes
+def submit_trade(asset, signal, confidence, outcome, signal_ts=None, sources=None):
+    if not trade_quantity(outcome) or signal.lower() not in ("buy", "sell"):
+        return None
+    order = Order(asset.lower(), signal, trade_quantity(outcome), signal_ts=signal_ts,
+                  meta={"confidence": confidence, "outcome": outcome, "sources": sources or {}})
+    paper_service().submit(order).result()
+    return order
+
+
+if __name__ == "__main__":
+    import os, tempfile
+    from modules.event_store import insert_fills, count
+
+    db = os.path.join(tempfile.mkdtemp(), "router_bench.db")
+
+    # rate=None submits one burst (throughput); a rate paces submissions (steady-state latency)
+    async def bench(n_orders, rate=None, assets=500):
+        router = OrderRouter(
+            {"equities_sim": SimulatedBroker("equities_sim", seed=1), "crypto_sim": SimulatedBroker("crypto_sim", latency=0.005, seed=2)},
+            routes={f"C{i:03d}": "crypto_sim" for i in range(0, assets, 5)},
+            sinks=[lambda fills, closed: insert_fills(fills, path=db)])
+        await router.start()
+        rng = random.Random(7)
+        started = time.perf_counter()
+        orders = []
+        for i in range(n_orders):
+            if rate and i % 100 == 0:
+                await asyncio.sleep(max(0.0, started + i / rate - time.perf_counter()))
+            asset = f"C{rng.randrange(assets):03d}"
+            order = Order(asset, rng.choice(("buy", "sell")), rng.choice((50, 100)))
+            orders.append(await router.submit(order))
+        await asyncio.gather(*(o.done for o in orders))
+        await router.drain()
+        elapsed = time.perf_counter() - started
+        await router.stop()
+        return router, elapsed
+
+    for n, rate in ((1_000, None), (10_000, None), (50_000, None), (10_000, 5_000)):
+        router, elapsed = asyncio.run(bench(n, rate))
+        lat = router.latency_summary()
+        mode = f"paced at {rate:,}/s" if rate else "burst"
+        print(f"{n:>6} orders ({mode}): {elapsed:5.2f}s → {n / elapsed:8,.0f} orders/sec, {router.stats['batches']} batches, "
+              f"{router.stats['fills']} fills | signal→fill p50 {lat['p50_ms']:.1f} ms  p99 {lat['p99_ms']:.1f} ms")
+    print(f"💾 {count('fills', path=db)} fills written to {db}")
@@ -2,48 +2,79 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objs as go
 from datetime import datetime
-import os
+import time
+import atexit
+import threading
+from modules.event_store import insert_patterns, query_patterns, has_rows
 
-logbook_path = "logs/pattern_log.csv"
+logbook_path = "logs/pattern_log.csv"  # legacy CSV, imported into the event store on first connect
+
+LOG_COLUMNS = ["Timestamp", "Pattern", "DetectionDate", "Commentary", "Outcome"]
 
 # ─────────────────────────────────────────────
-# Logging function
+# Buffered writer: entries collect in memory and land in the event store as
+# one bulk insert per flush (size / age threshold, end of a `with` block, or exit)
 # ─────────────────────────────────────────────
-def log_pattern(pattern_name, date, chart_data, commentary, outcome="Pending"):
-    log_entry = {
-        "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "Pattern": pattern_name,
-        "DetectionDate": pd.to_datetime(date).strftime("%Y-%m-%d"),
+class PatternLogWriter:
+    def __init__(self, path=None, max_entries=500, max_age=5.0):
+        self.path, self.max_entries, self.max_age = path, max_entries, max_age
+        self.buffer = []
+        self.first_buffered = None
+        self.lock = threading.Lock()
+
+    def add(self, pattern_name, date, chart_data, commentary, outcome="Pending"):
+        with self.lock:
+            if not self.buffer:
+                self.first_buffered = time.monotonic()
+            self.buffer.append((datetime.now().isoformat(timespec="seconds"), pattern_name, date, commentary, outcome))
+            due = len(self.buffer) >= self.max_entries or time.monotonic() - self.first_buffered >= self.max_age
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self.buffer:
+                return 0
+            df = pd.DataFrame(self.buffer, columns=LOG_COLUMNS)
+            df["DetectionDate"] = pd.to_datetime(df["DetectionDate"]).dt.strftime("%Y-%m-%d")
+            # One transaction for the whole batch, so the viewer never sees half a flush
+            insert_patterns(df.itertuples(index=False, name=None), path=self.path)
+            written, self.buffer = len(self.buffer), []
+            return written
+
+    def __enter__(self):
+        return self
 
-        "Commentary": commentary,
-        "Outcome": outcome
-    }
-    df = pd.DataFrame([log_entry])
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
 
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
 
-    if os.path.exists(logbook_path):
-        df.to_csv(logbook_path, mode="a", header=False, index=False)
-    else:
-        df.to_csv(logbook_path, index=False)
+logbook_writer = PatternLogWriter()
+atexit.register(logbook_writer.flush)
+
+# ─────────────────────────────────────────────
+# Logging function
+# ─────────────────────────────────────────────
+def log_pattern(pattern_name, date, chart_data, commentary, outcome="Pending"):
+    logbook_writer.add(pattern_name, date, chart_data, commentary, outcome)
 
 # ─────────────────────────────────────────────
 # Viewer function
 # ─────────────────────────────────────────────
 def render_logbook_viewer():
     st.subheader("✍️ Pattern Intelligence Logbook")
+    logbook_writer.flush()  # show everything logged so far, not just what has hit the disk
 
-    if not os.path.exists(logbook_path):
+    if not has_rows("patterns"):
         st.warning("🗂 No pattern logs found yet.")
         return
 
-    df = pd.read_csv(logbook_path)
-    st.dataframe(df.tail(20), use_container_width=True)
+    st.dataframe(query_patterns(last=20), use_container_width=True)
 
     st.download_button(
         label="📄 Download Full Logbook (CSV)",
-        data=df.to_csv(index=False).encode(),
+        data=query_patterns().to_csv(index=False).encode(),
         file_name="pattern_logbook.csv",
         mime="text/csv"
     )
@@ -4,6 +4,8 @@ import numpy as np
 import plotly.graph_objs as go
 from datetime import datetime
 from modules.pattern_logbook import log_pattern  # Optional: used for journal logging
+from modules.candlestick_engine import detect_patterns_table, library_table, PATTERN_LIBRARY
+from modules.market_data_store import load_ohlc
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -17,60 +19,28 @@ candlestick_patterns = {
     "Hammer": {"type": "bull", "color": "blue"},
     "Shooting Star": {"type": "bear", "color": "purple"},
 }
+library_type_colors = {"bull": "seagreen", "bear": "crimson", "neutral": "goldenrod"}
 
-# 📈 Generate dummy price data
+# 📈 Price data from the shared OHLCV store
 def generate_candle_data(days=150):
-    np.random.seed(42)
-    base = 100 + np.cumsum(np.random.randn(days))
-    date_range = pd.date_range(end=datetime.today(), periods=days, freq='B')
-    df = pd.DataFrame({
-        'Date': date_range,
-        'Open': base + np.random.uniform(-1, 1, days),
-        'High': base + np.random.uniform(0, 2, days),
-        'Low': base - np.random.uniform(0, 2, days),
-        'Close': base + np.random.uniform(-1, 1, days)
-    })
-    return df
+    return load_ohlc("CAMBO", "1D", bars=days, simulate=True)
 
-# 🔍 Detect true candlestick patterns with reversal ratings
+# 🔍 Detect true candlestick patterns with reversal ratings (vectorized engine)
 def detect_candlestick_patterns(df):
-    detected = []
-    for i in range(1, len(df)):
-        o, h, l, c = df.loc[i, ["Open", "High", "Low", "Close"]]
-        prev_o, prev_c = df.loc[i - 1, ["Open", "Close"]]
+    table = detect_patterns_table(df)
+    return list(zip(table["Date"], table["Pattern"].astype(str), table["Rating"].astype(str)))
 
-        body = abs(c - o)
-        range_ = h - l
-        rating = "Weak"
-
-        # Engulfing
-        if c > o and prev_c < prev_o and c > prev_o and o < prev_c:
-            rating = "Strong" if body > 1 else "Moderate"
-            detected.append((df.loc[i, "Date"], "Bullish Engulfing", rating))
-        elif c < o and prev_c > prev_o and c < prev_o and o > prev_c:
-            rating = "Strong" if body > 1 else "Moderate"
-            detected.append((df.loc[i, "Date"], "Bearish Engulfing", rating))
-        # Doji
-        elif body < 0.15 and range_ > 1:
-            rating = "Neutral"
-            detected.append((df.loc[i, "Date"], "Doji", rating))
-        # Hammer
-        elif body < 1 and (o - l > body * 2) and c > o:
-            rating = "Moderate"
-            detected.append((df.loc[i, "Date"], "Hammer", rating))
-        # Shooting Star
-        elif body < 1 and (h - c > body * 2) and c < o:
-            rating = "Moderate"
-            detected.append((df.loc[i, "Date"], "Shooting Star", rating))
-
-    return detected
+# 📚 Full single/two/three-bar library (Harami, Tweezers, Stars, Soldiers/Crows…)
+def detect_library_patterns(df, names=None):
+    table = library_table(df, names=names)
+    return list(zip(table["Date"], table["Pattern"].astype(str), table["Type"]))
 
 # 🎨 Render tab with chart overlay
 def render_pattern_tab():
     st.subheader("📈 Candlestick Pattern Overlay Engine")
 
     df = generate_candle_data()
-    patterns = detect_candlestick_patterns(df)
+    patterns = detect_patterns_table(df)
 
     fig = go.Figure()
     fig.add_trace(go.Candlestick(
@@ -80,9 +50,9 @@ def render_pattern_tab():
 
     label_stack = {}
 
-    for date, label, rating in patterns:
-        idx = df[df['Date'] == date].index[0]
-        base_price = df.loc[idx, 'Close']
+    closes = df['Close'].to_numpy()
+    for idx, date, label, rating in patterns.itertuples(index=False):
+        base_price = closes[idx]
 
         if date not in label_stack:
             label_stack[date] = 0
@@ -101,6 +71,17 @@ def render_pattern_tab():
             name=label
         ))
 
+    library_names = st.multiselect("📚 Library Patterns", list(PATTERN_LIBRARY), default=[])
+    if library_names:
+        hits = library_table(df, names=library_names)
+        for label, group in hits.groupby("Pattern", observed=True):
+            fig.add_trace(go.Scatter(
+                x=group["Date"], y=df['Low'].to_numpy()[group["Index"]] - 1,
+                mode="markers",
+                marker=dict(color=library_type_colors[PATTERN_LIBRARY[label]["type"]], size=9, symbol="diamond"),
+                name=label
+            ))
+
     fig.update_layout(title="📈 Candlestick Signal Overlay", xaxis_rangeslider_visible=False)
     st.plotly_chart(fig, use_container_width=True)
 
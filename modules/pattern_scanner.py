@@ -0,0 +1,167 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from modules.candlestick_engine import evaluate_patterns, BODY_LOOKBACK, TREND_LOOKBACK
+from modules.chart_pattern_engine import scan_structures
+
+# Bars of history every candle rule may look back on (rolling baselines + trend + 3-bar patterns)
+CANDLE_WARMUP = BODY_LOOKBACK + TREND_LOOKBACK + 3
+# Symbols handed to a worker per task — amortises IPC without starving the pool
+CHUNK_SIZE = 100
+
+OHLC_COLUMNS = ("Open", "High", "Low", "Close")
+
+
+# ─────────────────────────────────────────────
+# Simulated universe (placeholder for live feeds)
+# ─────────────────────────────────────────────
+def generate_universe(n_symbols=500, days=2520, seed=42):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=datetime.today(), periods=days, freq="B")
+    universe = {}
+    for i in range(n_symbols):
+        close = (20 + 180 * rng.random()) * np.exp(np.cumsum(rng.normal(0, 0.018, days)))
+        open_ = np.concatenate(([close[0]], close[:-1])) * (1 + rng.normal(0, 0.003, days))
+        wick = np.abs(rng.normal(0, 0.008, (2, days)))
+        universe[f"SYM{i:04d}"] = pd.DataFrame({
+            "Date": dates,
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + wick[0]),
+            "Low": np.minimum(open_, close) * (1 - wick[1]),
+            "Close": close,
+        })
+    return universe
+
+
+# ─────────────────────────────────────────────
+# Shared-memory OHLC block: (4, total_bars) float64 + per-symbol offsets
+# ─────────────────────────────────────────────
+def pack_universe(universe):
+    symbols = list(universe)
+    lengths = np.array([len(universe[s]) for s in symbols], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(int(offsets[-1]) * 4 * 8, 8))
+    block = np.ndarray((4, offsets[-1]), dtype=np.float64, buffer=shm.buf)
+    for i, sym in enumerate(symbols):
+        frame = universe[sym]
+        for row, col in enumerate(OHLC_COLUMNS):
+            block[row, offsets[i]:offsets[i + 1]] = frame[col].to_numpy(dtype=np.float64)
+    return shm, symbols, offsets
+
+
+_worker = {}
+
+
+def _attach(shm_name, total_bars, offsets):
+    # Runs once per worker process: map the block instead of receiving pickled frames
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["block"] = np.ndarray((4, total_bars), dtype=np.float64, buffer=shm.buf)
+    _worker["offsets"] = offsets
+
+
+def _scan_chunk(first, last, recent_bars, candle_names, chart_names):
+    # CPU time, so utilisation is honest even when workers outnumber cores
+    started = time.process_time()
+    block, offsets = _worker["block"], _worker["offsets"]
+    hits = []
+
+    # 🕯️ Candles: gather each symbol's tail (or full series) and evaluate the library once per chunk
+    if candle_names != []:
+        seg_end = offsets[first + 1:last + 1]
+        seg_start = offsets[first:last] if recent_bars is None else \
+            np.maximum(offsets[first:last], seg_end - (recent_bars + CANDLE_WARMUP))
+        seg_len = seg_end - seg_start
+        seg_base = np.concatenate(([0], np.cumsum(seg_len)))
+        gather = np.repeat(seg_start - seg_base[:-1], seg_len) + np.arange(seg_base[-1])
+
+        o, h, l, c = (np.ascontiguousarray(block[row, gather]) for row in range(4))
+        pos = np.arange(len(gather)) - np.repeat(seg_base[:-1], seg_len)
+        report_from = CANDLE_WARMUP if recent_bars is None else np.repeat(seg_len - recent_bars, seg_len)
+        # Bars too close to a segment start would read the neighbouring symbol's history
+        valid = (pos >= CANDLE_WARMUP) & (pos >= report_from)
+
+        owner = np.repeat(np.arange(first, last), seg_len)
+        local = gather - offsets[owner]
+        for name, mask in evaluate_patterns(o, h, l, c, names=candle_names).items():
+            for j in np.flatnonzero(mask & valid):
+                hits.append((int(owner[j]), int(local[j]), name, "Candle"))
+
+    # 📐 Chart structures: pivots need each symbol's full history
+    if chart_names != []:
+        for sym in range(first, last):
+            lo_off, hi_off = offsets[sym], offsets[sym + 1]
+            _, end, pattern = scan_structures(block[1, lo_off:hi_off], block[2, lo_off:hi_off], chart_names)
+            if recent_bars is not None:
+                keep = end >= (hi_off - lo_off) - recent_bars
+                end, pattern = end[keep], pattern[keep]
+            hits.extend((sym, int(e), p, "Chart") for e, p in zip(end, pattern))
+
+    return {"pid": os.getpid(), "first": first, "last": last,
+            "busy": time.process_time() - started, "hits": hits}
+
+
+# ─────────────────────────────────────────────
+# Streaming universe scan
+# ─────────────────────────────────────────────
+# Yields one progress dict per finished chunk: new hits, throughput and per-worker utilisation
+def scan_universe(universe, recent_bars=10, candle_names=None, chart_names=None,
+                  workers=None, chunk_size=CHUNK_SIZE):
+    shm, symbols, offsets = pack_universe(universe)
+    workers = workers or os.cpu_count() or 1
+    busy = {}
+    done = 0
+    started = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(shm.name, int(offsets[-1]), offsets)) as pool:
+            futures = [
+                pool.submit(_scan_chunk, first, min(first + chunk_size, len(symbols)),
+                            recent_bars, candle_names, chart_names)
+                for first in range(0, len(symbols), chunk_size)
+            ]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    done += result["last"] - result["first"]
+                    busy[result["pid"]] = busy.get(result["pid"], 0.0) + result["busy"]
+                    elapsed = time.perf_counter() - started
+
+                    rows = [
+                        {"Symbol": symbols[sym], "Date": universe[symbols[sym]]["Date"].iat[bar],
+                         "Pattern": name, "Source": source}
+                        for sym, bar, name, source in result["hits"]
+                    ]
+                    yield {
+                        "hits": pd.DataFrame(rows, columns=["Symbol", "Date", "Pattern", "Source"]),
+                        "done": done,
+                        "total": len(symbols),
+                        "elapsed": elapsed,
+                        "tickers_per_sec": done / elapsed if elapsed else 0.0,
+                        "utilisation": {pid: round(b / elapsed, 3) for pid, b in busy.items()},
+                    }
+            finally:
+                # Consumer stopped early (e.g. Streamlit rerun) — drop chunks not yet started
+                for future in futures:
+                    future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    universe = generate_universe(n_symbols=5000)
+    total_hits = 0
+    for progress in scan_universe(universe):
+        total_hits += len(progress["hits"])
+    print(f"{progress['done']} symbols in {progress['elapsed']:.2f}s "
+          f"→ {progress['tickers_per_sec']:.0f} tickers/sec, {total_hits} recent patterns")
+    print("Worker utilisation:", progress["utilisation"])
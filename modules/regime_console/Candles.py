@@ -1,9 +1,18 @@
-﻿import streamlit as st
+﻿import os, sys
+import streamlit as st
+import pandas as pd
 from regime_console_core import load_sample_ohlc
-import talib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from candlestick_engine import evaluate_patterns, ohlc_arrays
+from ta_backend import talib
 
 st.title("📈 Candlestick Pattern Recognition")
 df = load_sample_ohlc()
 hammer = talib.CDLHAMMER(df.Open, df.High, df.Low, df.Close)
 df["Hammer"] = hammer
-st.dataframe(df[["Open", "High", "Low", "Close", "Hammer"]].tail(10))
+
+# 📚 Whole pattern library in one pass; only show patterns that fired in the window
+library = pd.DataFrame(evaluate_patterns(*ohlc_arrays(df)), index=df.index).tail(10)
+fired = library.loc[:, library.any()]
+st.dataframe(df[["Open", "High", "Low", "Close", "Hammer"]].tail(10).join(fired, rsuffix=" (library)"))
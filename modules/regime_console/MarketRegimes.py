@@ -0,0 +1,21 @@
+import os, sys
+import streamlit as st
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from market_regime import load_regimes, regime_frame
+
+st.title("🌐 Market Regimes")
+result = load_regimes()
+if result is None:
+    st.warning("No market regime run found yet. Run `python -m modules.market_regime` (nightly job) first.")
+else:
+    latest = regime_frame(result).iloc[-1].replace("", "Unlabelled")
+    st.markdown(f"### Latest regime mix — {latest.name:%Y-%m-%d} ({len(latest)} tickers)")
+    st.bar_chart(latest.value_counts())
+
+    symbol = st.selectbox("Ticker", result["symbols"].tolist())
+    history = regime_frame(result, symbols=[symbol], last=252)[symbol]
+    changes = history[history != history.shift()]
+    st.markdown(f"**Current regime:** `{history.iat[-1] or 'Unlabelled'}`")
+    st.markdown("#### Regime changes (last 252 bars)")
+    st.dataframe(changes.rename("Regime").to_frame().iloc[::-1])
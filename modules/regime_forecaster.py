@@ -1,9 +1,10 @@
 ﻿import streamlit as st
-import os, json
+import os, pickle, hashlib
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from hmmlearn import hmm
+from myth_legacy_store import load_legacy, LEGACY_PATH
 
 # Optional: import broker feed (mocked here)
 def load_broker_data():
@@ -12,33 +13,88 @@ def load_broker_data():
     df = pd.DataFrame({ "Close": prices })
     return df
 
-def load_legacy():
-    path = os.path.join(os.path.expanduser("~"), "CamboStation_QuantumOS", "modules", "myth_legacy.json")
-    if not os.path.exists(path): return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
 
 def extract_moods(logs):
-    moods = []
-    for entry in logs.values():
-        parts = entry.split("'")
-        if len(parts) >= 4:
-            moods.append(parts[3])
-    return moods
-
-def encode_moods(moods):
-    unique = sorted(set(moods))
-    mapping = {m: i for i, m in enumerate(unique)}
+    return list(logs.sessions["mood"])
+
+def encode_moods(moods, mapping=None):
+    # Existing codes keep their index so a warm-started emission matrix still lines up
+    mapping = dict(mapping) if mapping else {m: i for i, m in enumerate(sorted(set(moods)))}
+    for m in moods:
+        mapping.setdefault(m, len(mapping))
     return np.array([mapping[m] for m in moods]), mapping
 
+# ─────────────────────────────────────────────
+# Mood HMM cache: keyed on a hash of the mood sequence, kept in memory and on
+# disk; appended sessions warm-start from the previous parameters
+# ─────────────────────────────────────────────
+MODEL_PATH = os.path.join(os.path.dirname(LEGACY_PATH), "mood_hmm.pkl")
+N_STATES = 3
+FULL_ITER = 100
+WARM_ITER = 10
+
+_model_cache = {}
+
+def _moods_hash(moods):
+    return hashlib.sha1("\n".join(moods).encode("utf-8")).hexdigest()
+
+def _new_model(n_iter):
+    # CategoricalHMM is the integer-symbol model on hmmlearn >= 0.2.8; older releases call it MultinomialHMM
+    model_cls = getattr(hmm, "CategoricalHMM", hmm.MultinomialHMM)
+    return model_cls(n_components=N_STATES, n_iter=n_iter, random_state=42)
+
+def _load_cached_model():
+    if "mood" not in _model_cache and os.path.exists(MODEL_PATH):
+        try:
+            with open(MODEL_PATH, "rb") as f:
+                _model_cache["mood"] = pickle.load(f)
+        except Exception:
+            pass  # unreadable cache → refit
+    return _model_cache.get("mood")
+
+def _save_model(entry):
+    _model_cache["mood"] = entry
+    os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
+    with open(MODEL_PATH + ".tmp", "wb") as f:
+        pickle.dump(entry, f)
+    os.replace(MODEL_PATH + ".tmp", MODEL_PATH)
+
+def _warm_start(previous, n_symbols):
+    model = _new_model(WARM_ITER)
+    model.init_params = ""
+    model.n_features = n_symbols
+    model.startprob_ = previous.startprob_.copy()
+    model.transmat_ = previous.transmat_.copy()
+    emission = previous.emissionprob_
+    if emission.shape[1] < n_symbols:  # new mood word: give it a small share in every state
+        emission = np.hstack([emission, np.full((N_STATES, n_symbols - emission.shape[1]), 1e-3)])
+    model.emissionprob_ = emission / emission.sum(axis=1, keepdims=True)
+    return model
+
+def fit_mood_model(moods):
+    key = _moods_hash(moods)
+    cached = _load_cached_model()
+    if cached and cached["hash"] == key:
+        return cached
+
+    warm = cached is not None and moods[:len(cached["moods"])] == cached["moods"]
+    X, mapping = encode_moods(moods, cached["mapping"] if warm else None)
+    model = _warm_start(cached["model"], len(mapping)) if warm else _new_model(FULL_ITER)
+    model.fit(X.reshape(-1, 1))
+
+    entry = {"hash": key, "moods": list(moods), "mapping": mapping, "model": model}
+    _save_model(entry)
+    return entry
+
 def forecast_mood(moods):
     if len(moods) < 5: return "Insufficient data"
-    X, mapping = encode_moods(moods)
-    model = hmm.MultinomialHMM(n_components=3, n_iter=100)
-    model.fit(X.reshape(-1, 1))
-    next_state = model.predict(X.reshape(-1, 1))[-1]
-    probs = model.transmat_[next_state]
-    forecast = np.argmax(probs)
+    fitted = fit_mood_model(moods)
+    model, mapping = fitted["model"], fitted["mapping"]
+    X, _ = encode_moods(moods, mapping)
+    last_state = model.predict(X.reshape(-1, 1))[-1]
+    # Next state distribution → expected emissions → most likely mood symbol
+    mood_probs = model.transmat_[last_state] @ model.emissionprob_
+    forecast = int(np.argmax(mood_probs))
     inv_map = {v: k for k, v in mapping.items()}
     return f"Next dominant mood likely: {inv_map.get(forecast, 'Unknown')}"
 
@@ -66,4 +122,5 @@ def render_dashboard():
         st.markdown(f"- Unique moods: **{len(set(moods))}**")
         st.markdown(f"- Recent mood: **{moods[-1] if moods else 'N/A'}**")
 
-render_dashboard()
+if __name__ == "__main__":  # streamlit run executes this; importing no longer renders
+    render_dashboard()
@@ -0,0 +1,109 @@
+import threading
+from datetime import datetime
+from collections import Counter
+from myth_legacy_store import load_legacy
+
+# Period key per granularity (week keeps regime_tracker's %U numbering)
+def period_keys(date_str):
+    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    return {
+        "day": date_str,
+        "week": dt.strftime("%Y-W%U"),
+        "month": dt.strftime("%Y-%m"),
+        "quarter": f"{dt.year}-Q{(dt.month - 1) // 3 + 1}",
+    }
+
+MODES = ("day", "week", "month", "quarter")
+
+
+# ──────────────────────────────────────────────────────
+# Per-period label counters with the dominant label kept up to date on
+# every add, so "dominant regime per period" is a read of stored aggregates.
+# Ties go to the label seen first in the period, same as Counter.most_common.
+# ──────────────────────────────────────────────────────
+class RegimeRollup:
+    def __init__(self):
+        self.counts = {mode: {} for mode in MODES}   # mode → period → Counter(label)
+        self.first_seen = {mode: {} for mode in MODES}  # mode → period → {label: order}
+        self.next_order = {mode: {} for mode in MODES}  # mode → period → next order number (never reused)
+        self.dominant = {mode: {} for mode in MODES}  # mode → period → (label, count)
+        self.labels = {}  # date → label currently counted
+        self.synced = None
+
+    def _better(self, mode, period, label):
+        best = self.dominant[mode].get(period)
+        count = self.counts[mode][period][label]
+        if best is None or count > best[1]:
+            return True
+        order = self.first_seen[mode][period]
+        return count == best[1] and order[label] < order[best[0]]
+
+    def add(self, date, label):
+        if self.labels.get(date) == label:
+            return
+        if date in self.labels:
+            self.remove(date)
+        self.labels[date] = label
+        for mode, period in period_keys(date).items():
+            counter = self.counts[mode].setdefault(period, Counter())
+            order = self.first_seen[mode].setdefault(period, {})
+            if label not in order:
+                order[label] = self.next_order[mode].get(period, 0)
+                self.next_order[mode][period] = order[label] + 1
+            counter[label] += 1
+            if self._better(mode, period, label):
+                self.dominant[mode][period] = (label, counter[label])
+
+    # Removals (an overwritten or deleted day) rescan just the affected periods
+    def remove(self, date):
+        label = self.labels.pop(date)
+        for mode, period in period_keys(date).items():
+            counter = self.counts[mode][period]
+            counter[label] -= 1
+            if counter[label] == 0:
+                del counter[label]
+                del self.first_seen[mode][period][label]
+            if not counter:
+                del self.counts[mode][period], self.first_seen[mode][period], self.dominant[mode][period]
+                del self.next_order[mode][period]
+                continue
+            order = self.first_seen[mode][period]
+            top = max(counter.items(), key=lambda kv: (kv[1], -order[kv[0]]))
+            self.dominant[mode][period] = top
+
+    # Fold a LegacyLog in: only new or changed days touch the counters
+    def sync(self, logs):
+        if logs is self.synced:
+            return self
+        sessions = logs.sessions
+        current = {date: f"{arch}:{mood}" for date, arch, mood in
+                   zip(sessions["date"], sessions["archetype"], sessions["mood"])}
+        for date in [d for d in self.labels if d not in current]:
+            self.remove(date)
+        for date, label in current.items():
+            if self.labels.get(date) != label:
+                self.add(date, label)
+        self.synced = logs
+        return self
+
+    # O(periods): [(period, label, count), ...] in period order
+    def dominant_regimes(self, mode="month"):
+        return [(period, label, count) for period, (label, count) in sorted(self.dominant[mode].items())]
+
+
+_rollup = RegimeRollup()
+_rollup_lock = threading.Lock()  # Streamlit reruns share the module-level rollup across threads
+
+
+# Drop-in for the old copies of track_regimes(logs)
+def track_regimes(logs=None, mode="month"):
+    logs = load_legacy() if logs is None else logs
+    with _rollup_lock:
+        return _rollup.sync(logs).dominant_regimes(mode)
+
+
+if __name__ == "__main__":
+    for mode in MODES[1:]:
+        print(f"── {mode}")
+        for period, label, count in track_regimes(mode=mode):
+            print(f"{period} → {label} ({count} sessions)")
@@ -0,0 +1,285 @@
+import threading, time
+from datetime import date
+import numpy as np
+import pandas as pd
+
+try:
+    from modules.market_data_store import has_series, load_ohlc
+except ImportError:
+    from market_data_store import has_series, load_ohlc
+
+# ─────────────────────────────────────────────
+# Pre-trade risk: the book lives in flat arrays (one slot per asset), and a
+# whole basket of proposed orders is checked against every limit with array
+# ops. Orders are taken in basket order: each one sees the book plus the
+# earlier orders of the basket that pass.
+# ─────────────────────────────────────────────
+RULES = ("market_data", "volatility", "daily_loss", "max_position",
+         "gross_exposure", "net_exposure", "sector_concentration")  # first failing rule is reported
+
+LIMITS = {
+    "max_position": 50_000.0,   # |position| notional per asset
+    "max_gross": 250_000.0,     # Σ|position| notional
+    "max_net": 150_000.0,       # |Σ position| notional
+    "max_sector_pct": 0.40,     # per-sector gross, as a share of max_gross
+    "max_daily_loss": 5_000.0,  # today's P&L floor (realised + marked)
+    "max_vol": 0.80,            # annualised realised vol gate
+}
+VOL_WINDOW = 20  # daily bars in the realised-vol estimate
+TRADING_DAYS = 252
+MARK_TTL = 300.0   # seconds before every mark / vol is re-read (and a new day rolls today's counters)
+NAN_RETRY = 30.0   # seconds between retries for an asset that had no usable bars
+
+# The app's asset selector classes have no feed of their own: until one stores bars for them they
+# are priced off the demo chart series, same as scan_patterns. Real tickers still need stored bars
+DEMO_ASSETS = ("stocks", "crypto", "options")
+DEMO_SERIES = "CAMBO"
+
+SECTORS = {
+    "crypto": "crypto", "btc": "crypto", "eth": "crypto", "sol": "crypto",
+    "aapl": "tech", "msft": "tech", "nvda": "tech", "googl": "tech", "meta": "tech",
+    "jpm": "financials", "gs": "financials", "bac": "financials",
+    "xom": "energy", "cvx": "energy",
+    "options": "derivatives", "spy": "index", "qqq": "index",
+}
+
+
+# (mark, previous close, annualised realised vol) from the OHLCV store; no stored bars → NaN (market_data rule)
+def market_snapshot(asset, timeframe="1D"):
+    symbol, demo = asset.upper(), False
+    if asset.lower() in DEMO_ASSETS and not has_series(symbol, timeframe):
+        symbol, demo = DEMO_SERIES, True
+    try:
+        closes = load_ohlc(symbol, timeframe, bars=VOL_WINDOW + 1, simulate=demo)["Close"].to_numpy(dtype=np.float64)
+    except FileNotFoundError:
+        return np.nan, np.nan, np.nan
+    if len(closes) < 2 or (closes <= 0).any():
+        return np.nan, np.nan, np.nan
+    rets = np.diff(np.log(closes))
+    return closes[-1], closes[-2], rets.std(ddof=1) * np.sqrt(TRADING_DAYS)
+
+
+def last_close(asset):
+    return float(market_snapshot(asset)[0])
+
+
+# Running sum within each key group, in the original order
+def _group_cumsum(keys, values):
+    order = np.argsort(keys, kind="stable")
+    k, v = keys[order], values[order]
+    total = np.cumsum(v)
+    starts = np.r_[True, k[1:] != k[:-1]] if len(k) else np.zeros(0, dtype=bool)
+    base = (total - v)[starts][np.cumsum(starts) - 1]
+    out = np.empty_like(total)
+    out[order] = total - base
+    return out
+
+
+class RiskEngine:
+    def __init__(self, limits=None, sectors=None, timeframe="1D"):
+        self.limits = {**LIMITS, **(limits or {})}
+        self.sectors = {**SECTORS, **(sectors or {})}
+        self.timeframe = timeframe
+        self.lock = threading.Lock()
+        self.index, self.sector_names = {}, []
+        self.sector_index = {}
+        self.position = np.zeros(0)    # signed quantity
+        self.today_qty = np.zeros(0)   # signed quantity traded today
+        self.today_cost = np.zeros(0)  # Σ signed qty × fill price today
+        self.mark = np.zeros(0)
+        self.prev_close = np.zeros(0)
+        self.vol = np.zeros(0)
+        self.sector = np.zeros(0, dtype=np.int64)
+        self.loaded_at = np.zeros(0)   # monotonic time each asset's market data was read
+        self.day = date.today().isoformat()
+        self.refreshed_at = time.monotonic()
+
+    # ─────────────────────────────────────────────
+    # Book upkeep
+    # ─────────────────────────────────────────────
+    def _grow(self, n):
+        pad = n - len(self.position)
+        for name in ("position", "today_qty", "today_cost", "mark", "prev_close", "vol", "loaded_at"):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(pad)]))
+        self.sector = np.concatenate([self.sector, np.zeros(pad, dtype=np.int64)])
+
+    def _load(self, asset, i, now):
+        self.mark[i], self.prev_close[i], self.vol[i] = market_snapshot(asset, self.timeframe)
+        self.loaded_at[i] = now
+
+    # Every check / fill passes through here: a new day or MARK_TTL re-reads the whole book,
+    # and assets without a usable mark are retried every NAN_RETRY instead of blocking forever
+    def _ensure(self, assets):
+        now = time.monotonic()
+        if date.today().isoformat() != self.day or now - self.refreshed_at >= MARK_TTL:
+            self._refresh(now)
+        new = [a for a in dict.fromkeys(assets) if a not in self.index]
+        if new:
+            start = len(self.index)
+            self._grow(start + len(new))
+            for i, asset in enumerate(new, start):
+                self.index[asset] = i
+                name = self.sectors.get(asset, "other")
+                self.sector[i] = self.sector_index.setdefault(name, len(self.sector_index))
+                self._load(asset, i, now)
+            self.sector_names = list(self.sector_index)
+        idx = np.fromiter((self.index[a] for a in assets), dtype=np.int64, count=len(assets))
+        retry = np.unique(idx[np.isnan(self.mark[idx]) & (now - self.loaded_at[idx] >= NAN_RETRY)])
+        if len(retry):
+            names = list(self.index)
+            for i in retry:
+                self._load(names[i], i, now)
+        return idx
+
+    def _refresh(self, now):
+        for asset, i in self.index.items():
+            self._load(asset, i, now)
+        today = date.today().isoformat()
+        if today != self.day:
+            self.today_qty[:], self.today_cost[:], self.day = 0.0, 0.0, today
+        self.refreshed_at = now
+
+    # Re-read marks / vol now (e.g. right after the nightly bar lands) and roll today's counters at a new day
+    def refresh_market(self):
+        with self.lock:
+            self._refresh(time.monotonic())
+
+    # Fill dicts / order_router.Fill tuples (timestamp, order_id, asset, side, quantity, price, ...)
+    def apply_fills(self, fills):
+        frame = pd.DataFrame(list(fills), columns=None if fills and isinstance(fills[0], dict) else
+                             ["timestamp", "order_id", "asset", "side", "quantity", "price", "venue", "latency_ms"])
+        if frame.empty:
+            return
+        with self.lock:
+            idx = self._ensure(frame["asset"].str.lower().tolist())
+            signed = np.where(frame["side"].str.lower() == "buy", 1.0, -1.0) * frame["quantity"].to_numpy(dtype=np.float64)
+            np.add.at(self.position, idx, signed)
+            today = (frame["timestamp"].str[:10] == self.day).to_numpy()
+            np.add.at(self.today_qty, idx[today], signed[today])
+            np.add.at(self.today_cost, idx[today], signed[today] * frame["price"].to_numpy(dtype=np.float64)[today])
+
+    def daily_pnl(self):
+        sod = self.position - self.today_qty
+        overnight = np.nansum(sod * (self.mark - self.prev_close))
+        intraday = np.nansum(self.today_qty * self.mark - self.today_cost)
+        return float(overnight + intraday)
+
+    def exposures(self):
+        notional = np.nan_to_num(self.position * self.mark)
+        return {"gross": float(np.abs(notional).sum()), "net": float(notional.sum()), "daily_pnl": self.daily_pnl()}
+
+    # ─────────────────────────────────────────────
+    # Basket check
+    # ─────────────────────────────────────────────
+    # Array fast path: asset names, +1/-1 sides, quantities → dict of per-order arrays
+    def check_arrays(self, assets, sides, quantities):
+        with self.lock:
+            idx = self._ensure(assets)
+            qty = np.asarray(sides, dtype=np.float64) * np.asarray(quantities, dtype=np.float64)
+            price = self.mark[idx]
+            sector = self.sector[idx]
+            book_notional = np.nan_to_num(self.position * self.mark)
+            gross_book = np.abs(book_notional).sum()
+            net_book = book_notional.sum()
+            sector_book = np.bincount(self.sector, weights=np.abs(book_notional), minlength=len(self.sector_names))
+            pnl = self.daily_pnl()
+            vol = self.vol[idx]
+
+            lim = self.limits
+            fails = np.zeros((len(idx), len(RULES)), dtype=bool)
+            approved = np.ones(len(idx), dtype=bool)
+            # Re-evaluate until no decision changes: an order only depends on earlier ones, so
+            # pass k settles the first k orders and the result equals checking them one by one
+            for _ in range(len(idx) + 1):
+                q_eff = qty * approved  # earlier orders only count if they pass
+                pos_before = self.position[idx] + _group_cumsum(idx, q_eff) - q_eff
+                pos_after = pos_before + qty
+                abs_before, abs_after = np.abs(pos_before) * price, np.abs(pos_after) * price
+                d_gross = abs_after - abs_before
+                d_gross_eff = np.nan_to_num(d_gross * approved)
+                gross_after = gross_book + np.cumsum(d_gross_eff) - d_gross_eff + d_gross
+                d_net_eff = np.nan_to_num(q_eff * price)
+                net_before = net_book + np.cumsum(d_net_eff) - d_net_eff
+                net_after = net_before + qty * price
+                sector_after = sector_book[sector] + _group_cumsum(sector, d_gross_eff) - d_gross_eff + d_gross
+                adds_risk = d_gross > 0
+
+                with np.errstate(invalid="ignore"):
+                    fails[:, 0] = ~(price > 0)
+                    fails[:, 1] = adds_risk & ~(vol <= lim["max_vol"])
+                    fails[:, 2] = adds_risk & (pnl < -lim["max_daily_loss"])
+                    fails[:, 3] = adds_risk & (abs_after > lim["max_position"])
+                    fails[:, 4] = adds_risk & (gross_after > lim["max_gross"])
+                    fails[:, 5] = (np.abs(net_after) > lim["max_net"]) & (np.abs(net_after) > np.abs(net_before))
+                    fails[:, 6] = adds_risk & (sector_after > lim["max_sector_pct"] * lim["max_gross"])
+                passed = ~fails.any(axis=1)
+                if np.array_equal(passed, approved):
+                    break
+                approved = passed
+
+        return {
+            "price": price,
+            "approved": approved,
+            "blocked_by": np.where(approved, "", np.asarray(RULES, dtype=object)[fails.argmax(axis=1)]),
+            "failed_rules": fails @ (1 << np.arange(len(RULES))),  # bit i = RULES[i]
+            "position_after": pos_after,
+            "gross_after": gross_after,
+        }
+
+    # Basket of {"asset", "side", "quantity"} dicts (or a frame with those columns) → one row per order
+    def check(self, orders):
+        if isinstance(orders, pd.DataFrame):
+            assets, sides, qty = (orders[c].tolist() for c in ("asset", "side", "quantity"))
+        else:
+            orders = list(orders)
+            assets, sides, qty = ([o[c] for o in orders] for c in ("asset", "side", "quantity"))
+        assets = [a.lower() for a in assets]
+        signs = [1.0 if s.lower() == "buy" else -1.0 for s in sides]
+        return pd.DataFrame({"asset": assets, "side": sides, "quantity": qty,
+                             **self.check_arrays(assets, signs, qty)})
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+# Shared engine, seeded from every fill in the event store; order_router keeps it current
+def risk_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            from modules.trade_log import read_fills
+
+            engine = RiskEngine()
+            engine.apply_fills(read_fills())
+            _engine = engine
+    return _engine
+
+
+if __name__ == "__main__":
+    import tempfile, time
+    import market_data_store as store
+
+    # Demo marks come from simulated bars in a throwaway store, never the real one
+    store.STORE_ROOT = tempfile.mkdtemp()
+    universe = [f"R{i:03d}" for i in range(200)] + ["btc", "eth", "aapl", "msft"]
+    for asset in universe:
+        store.write_bars(asset, "1D", store.simulate_ohlcv(asset, bars=VOL_WINDOW + 1))
+    engine = RiskEngine()
+    engine.check([{"asset": a, "side": "buy", "quantity": 1} for a in universe])  # load marks once
+    rng = np.random.default_rng(3)
+    engine.position[:] = rng.integers(-100, 100, len(engine.position))
+
+    for n in (1, 100, 10_000):
+        basket = pd.DataFrame({"asset": rng.choice(universe, n), "side": rng.choice(["buy", "sell"], n),
+                               "quantity": rng.choice([50, 100, 500], n)})
+        assets, signs, qty = basket["asset"].str.lower().tolist(), np.where(basket["side"] == "buy", 1.0, -1.0), basket["quantity"]
+        engine.check(basket)
+        started = time.perf_counter()
+        engine.check_arrays(assets, signs, qty)
+        fast = time.perf_counter() - started
+        started = time.perf_counter()
+        result = engine.check(basket)
+        elapsed = time.perf_counter() - started
+        print(f"{n:>6} orders: arrays {fast * 1e3:6.2f} ms ({fast / n * 1e6:7.2f} µs/order), "
+              f"frame {elapsed * 1e3:6.2f} ms  blocked: {result.loc[~result['approved'], 'blocked_by'].value_counts().to_dict()}")
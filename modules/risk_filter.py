@@ -1,9 +1,22 @@
 ﻿import streamlit as st
+from modules.risk_engine import risk_engine
 
-def apply_filter(mock_vix=32.1, threshold=35):
-    if mock_vix >= threshold:
-        st.error(f"🛑 VIX = {mock_vix} – Market volatility too high. Execution blocked.")
-        return False
+RULE_MESSAGES = {
+    "market_data": "No usable price history for this asset.",
+    "volatility": "Realised volatility above the gate.",
+    "daily_loss": "Daily loss limit reached — only risk-reducing orders allowed.",
+    "max_position": "Position would exceed the per-asset limit.",
+    "gross_exposure": "Gross exposure limit reached.",
+    "net_exposure": "Net exposure limit reached.",
+    "sector_concentration": "Sector concentration limit reached.",
+}
+
+
+# One proposed order through the pre-trade risk engine; returns its check row (approved, blocked_by, ...)
+def apply_filter(asset, signal, quantity):
+    check = risk_engine().check([{"asset": asset, "side": signal, "quantity": quantity}]).iloc[0].to_dict()
+    if not check["approved"]:
+        st.error(f"🛑 Risk check failed ({check['blocked_by']}): {RULE_MESSAGES[check['blocked_by']]} Execution blocked.")
     else:
-        st.success(f"✅ VIX = {mock_vix} – Safe to execute.")
-        return True
+        st.success(f"✅ Risk checks passed — {asset.upper()} position after order: {check['position_after']:g}.")
+    return check
@@ -1,15 +1,58 @@
 import streamlit as st
+import pandas as pd
+
+from modules.candlestick_engine import PATTERN_LIBRARY
+from modules.chart_pattern_engine import SIX_PIVOT_PATTERNS, FOUR_PIVOT_PATTERNS
+from modules.pattern_scanner import generate_universe, scan_universe
 
 def show_scanner_tab():
     st.header("🔍 Pattern Scanner")
-    
-    st.markdown("### This module will scan for chart patterns.")
-    st.info("Coming soon: Candlestick recognition, pattern overlays, AI confidence meters, and scanner alerts.")
-
-    st.markdown("#### Example preview:")
-    st.write("- 🕯️ Hammer")
-    st.write("- ☁️ Dark Cloud Cover")
-    st.write("- 🐮 Bullish Engulfing")
-    st.write("- 🐻 Bearish Flag")
-    
-    st.warning("Scanner engine is under construction. Check back soon!")
+    st.markdown("### Universe-wide candlestick + chart structure scan")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_symbols = st.slider("Universe Size", 100, 5000, 1000, step=100)
+    with col2:
+        days = st.slider("History (bars)", 250, 2520, 1260, step=10)
+    with col3:
+        recent_bars = st.slider("Report patterns from last N bars", 1, 30, 5)
+
+    candle_names = st.multiselect("🕯️ Candlestick Patterns", list(PATTERN_LIBRARY),
+                                  default=["Bullish Engulfing", "Bearish Engulfing", "Hammer", "Dark Cloud Cover"])
+    chart_names = st.multiselect("📐 Chart Patterns", SIX_PIVOT_PATTERNS + FOUR_PIVOT_PATTERNS,
+                                 default=["Head & Shoulders", "Double Bottom", "Flag"])
+
+    if not st.button("🚀 Run Scan"):
+        st.info("Pick a universe and patterns, then launch the scanner.")
+        return
+
+    universe = generate_universe(n_symbols=n_symbols, days=days)
+
+    progress_bar = st.progress(0.0)
+    stats_slot = st.empty()
+    table_slot = st.empty()
+    found = []
+
+    # 📡 Partial results stream in as each worker chunk finishes
+    for progress in scan_universe(universe, recent_bars=recent_bars,
+                                  candle_names=candle_names, chart_names=chart_names):
+        if len(progress["hits"]):
+            found.append(progress["hits"])
+        progress_bar.progress(progress["done"] / progress["total"])
+        stats_slot.markdown(
+            f"**Scanned:** `{progress['done']}/{progress['total']}` • "
+            f"**Throughput:** `{progress['tickers_per_sec']:.0f} tickers/sec` • "
+            f"**Elapsed:** `{progress['elapsed']:.2f}s`"
+        )
+        if found:
+            table_slot.dataframe(pd.concat(found, ignore_index=True).sort_values(["Date", "Symbol"], ascending=[False, True]),
+                                 use_container_width=True)
+
+    if not found:
+        st.warning("No patterns fired in the selected window.")
+
+    st.markdown("#### ⚙️ Worker Utilisation")
+    st.dataframe(pd.DataFrame(
+        [{"Worker PID": pid, "Utilisation": f"{share:.0%}"} for pid, share in progress["utilisation"].items()]
+    ))
+    st.caption("🧠 Shared-memory OHLC • Process-pool scan engine")
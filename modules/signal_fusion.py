@@ -1,18 +1,21 @@
 ﻿import streamlit as st
+from modules.fusion_engine import fusion_engine, SOURCES
 
-def render():
+def render(asset=None):
     st.subheader("⚛️ Signal Fusion Module")
 
-    voting = "buy"
-    pattern = "bullish_engulfing"
-    sentiment = "positive"
+    view = fusion_engine.snapshot(weights=st.session_state.get("signal_weights"))
+    if view.empty:
+        st.info("No voting, pattern or sentiment updates received yet.")
+        return None
+    asset = asset.lower() if asset and asset.lower() in view.index else st.selectbox("Asset", view.index.tolist())
+    row = view.loc[asset]
 
-    final_signal = "buy" if voting == "buy" and pattern and sentiment == "positive" else "hold"
-    confidence = 0.81 if final_signal == "buy" else 0.55
+    for source in SOURCES:
+        age = row[f"{source}_age"]
+        shown = f"`{row[source]:+.2f}` ({age / 60:.0f} min old)" if age != float("inf") else "`—`"
+        st.markdown(f"**{source.capitalize()} Stream:** {shown}")
+    st.markdown(f"**Fusion Result:** `{row['signal'].upper()}` — score `{row['fused']:+.2f}`, coverage `{row['coverage']:.2f}`")
 
-    st.markdown(f"**Voting Signal:** `{voting}`")
-    st.markdown(f"**Pattern Detected:** `{pattern}`")
-    st.markdown(f"**Sentiment Analysis:** `{sentiment}`")
-    st.markdown(f"**Fusion Result:** `{final_signal.upper()}` with confidence `{confidence}`")
-
-    st.info("This module fuses structural overlays, sentiment signals, and voting consensus. Future upgrades will tie it to execution agents and override filters.")
+    st.caption("Inputs decay by source half-life; weights come from the Signal Weight Configurator.")
+    return row.to_dict()
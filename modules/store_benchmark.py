@@ -0,0 +1,63 @@
+import os
+import time
+import tempfile
+import statistics
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from modules.event_store import insert_strategy_signals, query_strategy_signals
+from modules.pattern_benchmark import best_of
+
+# Single submissions timed at each log size (median reported)
+SUBMIT_SAMPLES = 50
+
+
+def synthetic_signals(n, start):
+    base = datetime(2020, 1, 1) + timedelta(seconds=start)
+    return [((base + timedelta(seconds=i)).isoformat(timespec="seconds"), "VWAP Reversal", "Flag",
+             "Pending", "Medium", "", f"signal {start + i}") for i in range(n)]
+
+
+def _signal_entry():
+    return {"Timestamp": datetime.now().isoformat(timespec="seconds"), "Strategy": "Breakout Pullback",
+            "Pattern": "Flag", "Outcome": "Pending", "Impact": "High", "FollowThrough": "", "Comment": "bench"}
+
+
+# 🐢 What strategy_lab used to do per submission: read the whole CSV, concat, rewrite it
+def csv_rewrite_submit(path):
+    df = pd.read_csv(path)
+    pd.concat([df, pd.DataFrame([_signal_entry()])], ignore_index=True).to_csv(path, index=False)
+
+
+# ⏱️ Submit + tail(10) latency as the strategy log grows (old CSV rewrite alongside, up to csv_limit rows)
+def run_store_benchmark(sizes=(10_000, 100_000, 1_000_000), csv_limit=100_000):
+    rows = []
+    with tempfile.TemporaryDirectory() as folder:
+        db = os.path.join(folder, "bench.db")
+        csv_path = os.path.join(folder, "strategy_log.csv")
+        stored = 0
+        for size in sizes:
+            insert_strategy_signals(synthetic_signals(size - stored, stored), path=db)
+            stored = size
+
+            submits = []
+            for _ in range(SUBMIT_SAMPLES):
+                start = time.perf_counter()
+                insert_strategy_signals([_signal_entry()], path=db)
+                submits.append(time.perf_counter() - start)
+            stored += SUBMIT_SAMPLES
+            tail_secs, _ = best_of(lambda: query_strategy_signals(last=10, path=db))
+
+            row = {"Log Rows": size, "Submit (ms)": round(statistics.median(submits) * 1000, 3),
+                   "Tail 10 (ms)": round(tail_secs * 1000, 3)}
+            if size <= csv_limit:
+                query_strategy_signals(path=db).to_csv(csv_path, index=False)
+                csv_secs, _ = best_of(lambda: csv_rewrite_submit(csv_path), repeat=1)
+                row["Old CSV Submit (ms)"] = round(csv_secs * 1000, 1)
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run_store_benchmark().to_string(index=False))
@@ -2,7 +2,7 @@ import os
 os.makedirs("data", exist_ok=True)  # 🔒 Ensures 'data' folder exists
 import streamlit as st
 from datetime import datetime
-import pandas as pd
+from modules.event_store import insert_strategy_signals, query_strategy_signals
 
 # 🧠 Strategy Lab Entry Form
 def render_strategy_lab():
@@ -28,7 +28,7 @@ def render_strategy_lab():
     # 💾 Save Entry
     if st.button("✅ Submit Signal"):
         signal_entry = {
-            "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Timestamp": datetime.now().isoformat(timespec="seconds"),
             "Strategy": selected_strategy,
             "Pattern": detected_pattern,
             "Outcome": outcome,
@@ -37,21 +37,15 @@ def render_strategy_lab():
             "Comment": user_comment
         }
 
-        try:
-            df_existing = pd.read_csv("data/strategy_log.csv")
-            df_new = pd.DataFrame([signal_entry])
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            df_combined.to_csv("data/strategy_log.csv", index=False)
-        except FileNotFoundError:
-            df_new = pd.DataFrame([signal_entry])
-            df_new.to_csv("data/strategy_log.csv", index=False)
+        insert_strategy_signals([signal_entry])
 
         st.success("📍 Signal Logged Successfully")
 
     # 📊 Display Logged Entries
     if st.checkbox("📂 View Strategy Log"):
-        try:
-            log_df = pd.read_csv("data/strategy_log.csv")
-            st.dataframe(log_df.tail(10))
-        except FileNotFoundError:
+        show_last = st.number_input("Rows to show", min_value=1, max_value=1000, value=10)
+        log_df = query_strategy_signals(last=int(show_last))  # newest N via the timestamp index
+        if log_df.empty:
             st.warning("🛑 No strategy log found yet.")
+        else:
+            st.dataframe(log_df)
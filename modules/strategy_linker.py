@@ -36,6 +36,26 @@ def link_detected_patterns_to_strategy(detected_patterns):
             strategy = "Momentum Reversal (Short)"
             comment = "Bearish divergence building in narrowing trend"
 
+        elif pattern == "Triple Top":
+            strategy = "Short Rejection Setup"
+            comment = "Third failure at resistance — distribution likely"
+
+        elif pattern == "Triple Bottom":
+            strategy = "Long Reversal Entry"
+            comment = "Support held three times — accumulation base"
+
+        elif pattern == "Cup & Handle":
+            strategy = "Breakout Strategy (Long)"
+            comment = "Rounded base with shallow handle — buy the rim breakout"
+
+        elif pattern == "Flag":
+            strategy = "Trend Continuation"
+            comment = "Tight channel against the pole — continuation expected"
+
+        elif pattern == "Rectangle":
+            strategy = "Range Trade / Breakout Watch"
+            comment = "Flat support and resistance — fade edges until a break"
+
         # Add more mapping logic here...
 
         if strategy:
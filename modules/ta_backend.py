@@ -0,0 +1,11 @@
+# TA backend selector — TA-Lib when it is installed, the NumPy port otherwise.
+# Callers import `talib` from here instead of importing the C library directly.
+try:
+    import talib
+    BACKEND = "talib"
+except ImportError:
+    try:
+        from modules import ta_numpy as talib
+    except ImportError:
+        import ta_numpy as talib
+    BACKEND = "numpy"
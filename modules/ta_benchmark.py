@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from modules import ta_numpy
+from modules.pattern_benchmark import synthetic_ohlc, best_of
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+# (function, argument builder) — every call is run through both backends with identical inputs
+CASES = {
+    "SMA": lambda o, h, l, c: ((c,), {"timeperiod": 50}),
+    "EMA": lambda o, h, l, c: ((c,), {"timeperiod": 20}),
+    "RSI": lambda o, h, l, c: ((c,), {"timeperiod": 14}),
+    "BBANDS": lambda o, h, l, c: ((c,), {"timeperiod": 20, "nbdevup": 2, "nbdevdn": 2}),
+    "CDLDOJI": lambda o, h, l, c: ((o, h, l, c), {}),
+    "CDLHAMMER": lambda o, h, l, c: ((o, h, l, c), {}),
+    "CDLSHOOTINGSTAR": lambda o, h, l, c: ((o, h, l, c), {}),
+    "CDLENGULFING": lambda o, h, l, c: ((o, h, l, c), {}),
+}
+
+
+# 📈 Consistent candles (high/low wrap the body) so candle rules see realistic shapes
+def benchmark_arrays(bars):
+    df = synthetic_ohlc(bars)
+    o, c = df["Open"].to_numpy(), df["Close"].to_numpy()
+    h = np.maximum(df["High"].to_numpy(), np.maximum(o, c))
+    l = np.minimum(df["Low"].to_numpy(), np.minimum(o, c))
+    return o, h, l, c
+
+
+def _compare(ref, got):
+    ref, got = (ref if isinstance(ref, tuple) else (ref,)), (got if isinstance(got, tuple) else (got,))
+    max_err, agreement = 0.0, 1.0
+    for r, g in zip(ref, got):
+        if not np.array_equal(np.isnan(r.astype(float)), np.isnan(g.astype(float))):
+            return np.inf, 0.0
+        if r.dtype.kind in "iu":
+            agreement = min(agreement, float((r == g).mean()))
+        else:
+            max_err = max(max_err, float(np.nanmax(np.abs(r - g), initial=0.0)))
+    return max_err, agreement
+
+
+# ⏱️ Accuracy + speed of the NumPy backend, against TA-Lib when it is importable
+def run_ta_benchmark(sizes=(1_000, 100_000, 1_000_000)):
+    rows = []
+    for bars in sizes:
+        o, h, l, c = benchmark_arrays(bars)
+        for name, build in CASES.items():
+            args, kwargs = build(o, h, l, c)
+            np_secs, got = best_of(lambda: getattr(ta_numpy, name)(*args, **kwargs))
+            row = {"Function": name, "Bars": bars, "NumPy (ms)": round(np_secs * 1000, 3)}
+            if talib is not None:
+                ta_secs, ref = best_of(lambda: getattr(talib, name)(*args, **kwargs))
+                max_err, agreement = _compare(ref, got)
+                row.update({
+                    "TA-Lib (ms)": round(ta_secs * 1000, 3),
+                    "NumPy / TA-Lib": round(np_secs / ta_secs, 2),
+                    "Max Abs Error": max_err,
+                    "Signal Agreement": agreement,
+                })
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    if talib is None:
+        print("TA-Lib not installed — timing the NumPy backend only.")
+    print(run_ta_benchmark().to_string(index=False))
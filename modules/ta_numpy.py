@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+# Drop-in NumPy versions of the TA-Lib functions CamboStation uses (pandas' compiled
+# rolling/ewm kernels carry the recurrences). Same names, defaults, lookback
+# (leading NaN / 0) and output conventions as TA-Lib 0.4.
+
+# TA-Lib default candle settings: (range type, averaging period, factor)
+BODY_SHORT = ("body", 10, 1.0)
+BODY_DOJI = ("hl", 10, 0.1)
+SHADOW_LONG = ("body", 0, 1.0)
+SHADOW_VERY_SHORT = ("hl", 10, 0.1)
+NEAR = ("hl", 5, 0.2)
+
+
+# 🔧 Accept Series or arrays like talib; hand back a Series when given one
+def _values(x):
+    return np.asarray(x, dtype=np.float64)
+
+
+def _wrap(like, out):
+    if isinstance(like, pd.Series):
+        return pd.Series(out, index=like.index)
+    return out
+
+
+def _rolling_sum_prior(x, period):
+    # Sum of the `period` values strictly before each index (NaN until available)
+    csum = np.concatenate(([0.0], np.cumsum(x)))
+    out = np.full(len(x), np.nan)
+    if len(x) > period:
+        out[period:] = csum[period:-1] - csum[:-period - 1]
+    return out
+
+
+def _recurrence(seed, x, alpha):
+    # y[0] = seed, y[t] = y[t-1] + alpha * (x[t] - y[t-1]) — the EMA/Wilder carry
+    series = pd.Series(np.concatenate(([seed], x)))
+    return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+# ─────────────────────────────────────────────
+# Overlap / momentum studies
+# ─────────────────────────────────────────────
+def SMA(real, timeperiod=30):
+    out = pd.Series(_values(real)).rolling(timeperiod).mean().to_numpy()
+    return _wrap(real, out)
+
+
+def EMA(real, timeperiod=30):
+    # Seeded with the SMA of the first `timeperiod` values, like TA-Lib's default compatibility mode
+    x = _values(real)
+    out = np.full(len(x), np.nan)
+    if len(x) >= timeperiod:
+        seed = x[:timeperiod].mean()
+        out[timeperiod - 1:] = _recurrence(seed, x[timeperiod:], 2.0 / (timeperiod + 1))
+    return _wrap(real, out)
+
+
+def RSI(real, timeperiod=14):
+    x = _values(real)
+    out = np.full(len(x), np.nan)
+    if len(x) > timeperiod:
+        delta = np.diff(x)
+        gain, loss = np.clip(delta, 0, None), np.clip(-delta, 0, None)
+        avg_gain = _recurrence(gain[:timeperiod].mean(), gain[timeperiod:], 1.0 / timeperiod)
+        avg_loss = _recurrence(loss[:timeperiod].mean(), loss[timeperiod:], 1.0 / timeperiod)
+        total = avg_gain + avg_loss
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[timeperiod:] = np.where(np.abs(total) < 1e-8, 0.0, 100 * avg_gain / total)
+    return _wrap(real, out)
+
+
+def BBANDS(real, timeperiod=5, nbdevup=2, nbdevdn=2, matype=0):
+    # Population standard deviation around an SMA middle band (matype 0 only)
+    rolling = pd.Series(_values(real)).rolling(timeperiod)
+    middle, std = rolling.mean().to_numpy(), rolling.std(ddof=0).to_numpy()
+    return (_wrap(real, middle + nbdevup * std), _wrap(real, middle), _wrap(real, middle - nbdevdn * std))
+
+
+# ─────────────────────────────────────────────
+# Candlestick recognition (100 / -100 / 0, zero through the lookback)
+# ─────────────────────────────────────────────
+def _candle_parts(o, h, l, c):
+    body = np.abs(c - o)
+    return {
+        "body": body,
+        "hl": h - l,
+        "upper": h - np.maximum(o, c),
+        "lower": np.minimum(o, c) - l,
+    }
+
+
+def _candle_average(parts, setting, lag=0):
+    kind, period, factor = setting
+    rng = parts[kind]
+    if period == 0:
+        avg = rng
+    else:
+        avg = _rolling_sum_prior(rng, period) / period
+    avg = factor * avg
+    if lag:
+        avg = np.concatenate((np.full(lag, np.nan), avg[:-lag]))
+    return avg
+
+
+def _to_int(like, mask, value, lookback):
+    out = np.where(mask, value, 0).astype(np.int32)
+    out[:lookback] = 0
+    return _wrap(like, out)
+
+
+def CDLDOJI(open, high, low, close):
+    o, h, l, c = map(_values, (open, high, low, close))
+    parts = _candle_parts(o, h, l, c)
+    with np.errstate(invalid="ignore"):
+        mask = parts["body"] <= _candle_average(parts, BODY_DOJI)
+    return _to_int(open, mask, 100, BODY_DOJI[1])
+
+
+def CDLHAMMER(open, high, low, close):
+    o, h, l, c = map(_values, (open, high, low, close))
+    parts = _candle_parts(o, h, l, c)
+    prev_low = np.concatenate(([np.nan], l[:-1]))
+    with np.errstate(invalid="ignore"):
+        mask = ((parts["body"] < _candle_average(parts, BODY_SHORT))
+                & (parts["lower"] > _candle_average(parts, SHADOW_LONG))
+                & (parts["upper"] < _candle_average(parts, SHADOW_VERY_SHORT))
+                & (np.minimum(o, c) <= prev_low + _candle_average(parts, NEAR, lag=1)))
+    lookback = max(BODY_SHORT[1], SHADOW_LONG[1], SHADOW_VERY_SHORT[1], NEAR[1]) + 1
+    return _to_int(open, mask, 100, lookback)
+
+
+def CDLSHOOTINGSTAR(open, high, low, close):
+    o, h, l, c = map(_values, (open, high, low, close))
+    parts = _candle_parts(o, h, l, c)
+    prev_top = np.concatenate(([np.nan], np.maximum(o, c)[:-1]))
+    with np.errstate(invalid="ignore"):
+        mask = ((parts["body"] < _candle_average(parts, BODY_SHORT))
+                & (parts["upper"] > _candle_average(parts, SHADOW_LONG))
+                & (parts["lower"] < _candle_average(parts, SHADOW_VERY_SHORT))
+                & (np.minimum(o, c) > prev_top))
+    lookback = max(BODY_SHORT[1], SHADOW_LONG[1], SHADOW_VERY_SHORT[1]) + 1
+    return _to_int(open, mask, -100, lookback)
+
+
+def CDLENGULFING(open, high, low, close):
+    o, h, l, c = map(_values, (open, high, low, close))
+    color = np.where(c >= o, 1, -1)
+    prev_o, prev_c = np.concatenate(([np.nan], o[:-1])), np.concatenate(([np.nan], c[:-1]))
+    prev_color = np.concatenate(([0], color[:-1]))
+    with np.errstate(invalid="ignore"):
+        white = (color == 1) & (prev_color == -1) & (c > prev_o) & (o < prev_c)
+        black = (color == -1) & (prev_color == 1) & (o > prev_c) & (c < prev_o)
+    out = np.where(white | black, color * 100, 0).astype(np.int32)
+    out[:2] = 0
+    return _wrap(open, out)
@@ -1,5 +1,8 @@
+try:
+    from modules.consensus_engine import majority_vote
+except ImportError:
+    from consensus_engine import majority_vote
+
+
 def execute_team_signal(agent_votes):
-    votes = {}
-    for agent, signal in agent_votes.items():
-        votes[signal] = votes.get(signal, 0) + 1
-    return max(votes, key=votes.get)
+    return majority_vote(agent_votes)
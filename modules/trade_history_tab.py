@@ -1,16 +1,20 @@
 ﻿import streamlit as st
-import json, os
+from modules.trade_log import read_trades, read_fills
 
 def render():
     st.subheader("📊 Trade History Replay")
 
-    log_file = os.path.join(os.path.dirname(__file__), "..", "logs", "voting_history.json")
-    if not os.path.exists(log_file):
+    history = read_trades(last=25)  # Seeks to the last 25 entries via the index
+    if not history:
         st.info("No trade history found yet.")
         return
 
-    with open(log_file, "r", encoding="utf-8") as f:
-        history = json.load(f)
-
-    for entry in reversed(history[-25:]):  # Show last 25 entries
+    for entry in reversed(history):
         st.markdown(f"**{entry['timestamp']}** — `{entry['asset'].upper()}` → `{entry['signal'].upper()}` ({entry['confidence']}) → `{entry['outcome']}`")
+
+    fills = read_fills(last=25)
+    if fills:
+        st.markdown("#### 📬 Paper Fills")
+        for fill in reversed(fills):
+            st.markdown(f"**{fill['timestamp']}** — `{fill['order_id']}` {fill['side'].upper()} {fill['quantity']:g} "
+                        f"`{fill['asset'].upper()}` @ {fill['price']} on {fill['venue']} ({fill['latency_ms']:.1f} ms from signal)")
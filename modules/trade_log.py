@@ -1,4 +1,9 @@
-﻿import json, os, datetime
+﻿import datetime
+from modules.event_store import insert_trades, query_trades, insert_fills, query_fills
+
+# Trades live in the SQLite event store (data/cambo_events.db); the old
+# logs/voting_history.json(l) files are imported once on first connect.
+# Paper-trading fills from order_router land in the same store, batch by batch.
 
 def log_trade(asset, signal, confidence, outcome):
     log_entry = {
@@ -8,18 +13,19 @@ def log_trade(asset, signal, confidence, outcome):
         "confidence": confidence,
         "outcome": outcome
     }
+    insert_trades([log_entry])
+    return log_entry
+
+
+# Last N / time range / single asset, straight from the (asset, timestamp) indexes
+def read_trades(last=None, start=None, end=None, asset=None):
+    return query_trades(last=last, start=start, end=end, asset=asset).to_dict("records")
 
-    logs_dir = os.path.join(os.path.dirname(__file__), "..", "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    log_file = os.path.join(logs_dir, "voting_history.json")
 
-    if os.path.exists(log_file):
-        with open(log_file, "r", encoding="utf-8") as f:
-            history = json.load(f)
-    else:
-        history = []
+# Fill tuples/dicts in the fills-table column order; one transaction per batch
+def log_fills(fills):
+    return insert_fills(fills)
 
-    history.append(log_entry)
 
-    with open(log_file, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
+def read_fills(last=None, start=None, end=None, asset=None, order_id=None):
+    return query_fills(last=last, start=start, end=end, asset=asset, order_id=order_id).to_dict("records")
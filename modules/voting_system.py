@@ -1,4 +1,6 @@
 ﻿import streamlit as st
+from modules.consensus_engine import tally_votes
+from modules.meta_learning_genome import learner
 
 def render():
     st.subheader("🗳 AI Voting System")
@@ -11,18 +13,12 @@ def render():
         "gemini": {"signal": "buy", "confidence": 0.90}
     }
 
-    # Count votes and confidence
-    vote_count = {}
-    total_conf = 0
-    for engine, vote in signal_votes.items():
-        signal = vote["signal"]
-        conf = vote["confidence"]
-        vote_count[signal] = vote_count.get(signal, 0) + 1
-        total_conf += conf
-
-    majority = max(vote_count, key=vote_count.get)
-    avg_conf = round(total_conf / len(signal_votes), 2)
-    strength = "HIGH" if avg_conf > 0.75 else "MEDIUM" if avg_conf > 0.5 else "LOW"
+    # Count votes and confidence: all four engines sit in the voting block, so the sliders don't
+    # change this tally — the learned voter weights do
+    row = tally_votes({"signal": signal_votes}, scales=learner().voter_multipliers()).iloc[0]
+    majority = row["majority"]
+    avg_conf = round(float(row["confidence"]), 2)
+    strength = row["strength"]
 
     st.markdown(f"**Majority Signal:** `{majority.upper()}`")
     st.markdown(f"**Average Confidence:** `{avg_conf}`")
@@ -11,5 +11,10 @@ def render():
     if total != 100:
         st.warning("Weights must total 100.")
     else:
+        # This session only: picked up by the dispatcher's vote (AI block vs pattern / sentiment streams)
+        # and by the signal fusion view — the shared fusion engine keeps its own defaults
+        st.session_state["signal_weights"] = {
+            "voting": voting_weight / 100, "sentiment": sentiment_weight / 100, "pattern": pattern_weight / 100,
+        }
         st.success(f"✅ Weights Applied: Voting {voting_weight}%, Sentiment {sentiment_weight}%, Pattern {pattern_weight}%")
-        st.markdown("Future version will route these weights to fusion logic.")
+    return st.session_state.get("signal_weights")
@@ -0,0 +1,120 @@
+import asyncio, time
+
+import pytest
+
+from modules import engine_client, engine_stub_server
+from modules.engine_client import EngineClient, EngineError, vote_decided
+from modules.engine_stub_server import serve_stub, stub_vote
+
+FAST = (0.01, 0.0, 0.0)  # (latency s, jitter s, failure rate)
+SLOW = (1.0, 0.0, 0.0)
+BROKEN = (0.01, 0.0, 1.0)
+
+
+# Stub engines on a free port plus a client pointed at them; torn down after the test
+@pytest.fixture
+def stub():
+    started = []
+
+    def make(engines, **kwargs):
+        server = serve_stub(port=0, engines=engines)
+        urls = {e: f"http://127.0.0.1:{server.server_port}/{e}" for e in engines}
+        client = EngineClient(urls, **{"timeout": 0.5, "quorum": len(engines), "pool_size": 8, **kwargs})
+        started.append((server, client))
+        return client
+
+    yield make
+    for server, client in started:
+        client.close()
+        server.shutdown()
+
+
+# An asset the three named engines agree on, so the slow fourth can't change the majority
+def agreed_asset(engines):
+    for i in range(1_000):
+        asset = f"SYM{i:04d}"
+        if len({stub_vote(e, asset)["signal"] for e in engines}) == 1:
+            return asset
+
+
+def wait_idle(client, limit=2.0):
+    until = time.monotonic() + limit
+    while client.inflight and time.monotonic() < until:
+        time.sleep(0.01)
+    return client.inflight
+
+
+def test_vote_decided():
+    buy, sell = {"signal": "buy"}, {"signal": "sell"}
+    assert vote_decided({"grok": buy, "chatgpt": buy, "gemini": buy}, ["tradegpt"])
+    assert not vote_decided({"grok": buy, "chatgpt": buy, "gemini": sell}, ["tradegpt"])
+    assert vote_decided({"grok": buy}, [])
+    # a pattern stream holding most of the weight can settle the vote before the AI engines answer
+    assert vote_decided({}, ["grok", "chatgpt"], weights={"voting": 0.2, "pattern": 0.8}, fixed={"pattern": buy})
+    # learned scales shift weight onto the engine still out
+    assert not vote_decided({"grok": buy, "chatgpt": buy}, ["gemini"], scales={"gemini": 3.0})
+
+
+def test_all_engines_answer(stub):
+    client = stub({"grok": FAST, "chatgpt": FAST, "gemini": FAST})
+    result = asyncio.run(client.gather_votes("AAPL"))
+
+    assert result["quorum"] and not result["failed"] and not result["skipped"]
+    assert result["votes"] == {e: stub_vote(e, "AAPL") for e in ("grok", "chatgpt", "gemini")}
+    assert wait_idle(client) == 0
+
+
+def test_decided_vote_skips_the_slow_engine(stub):
+    fast = ("grok", "chatgpt", "gemini")
+    client = stub({**{e: FAST for e in fast}, "tradegpt": SLOW}, timeout=2.0, quorum=3)
+    asset = agreed_asset(fast)
+    started = time.perf_counter()
+    result = asyncio.run(client.gather_votes(asset))
+
+    assert time.perf_counter() - started < SLOW[0]
+    assert set(result["votes"]) == set(fast) and result["skipped"] == ["tradegpt"] and result["quorum"]
+
+
+def test_timeout_and_missed_quorum(stub):
+    client = stub({"grok": FAST, "tradegpt": SLOW}, timeout=0.2, quorum=2)
+    result = asyncio.run(client.gather_votes("AAPL"))
+
+    assert "no answer" in result["failed"]["tradegpt"]
+    assert not result["quorum"]
+    assert client.stats["timeouts"] == 1
+
+
+def test_hedge_fires_and_inflight_counts_threads(stub, monkeypatch):
+    monkeypatch.setattr(engine_client, "HEDGE_AFTER", 0.05)
+    client = stub({"grok": (0.2, 0.0, 0.0)}, timeout=1.0)
+    vote = asyncio.run(client.query_engine("grok", {"asset": "AAPL"}))
+
+    assert vote == stub_vote("grok", "AAPL")
+    assert client.stats["hedges"] == 1
+    assert client.inflight == 1  # the losing attempt is still running on its thread
+    assert wait_idle(client) == 0
+
+
+def test_breaker_opens_after_repeated_failures(stub):
+    client = stub({"grok": BROKEN})
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(EngineError, match="503"):
+                await client.query_engine("grok", {"asset": "AAPL"})
+        with pytest.raises(EngineError, match="circuit open"):
+            await client.query_engine("grok", {"asset": "AAPL"})
+
+    asyncio.run(run())
+    assert client.breakers["grok"].state == "open"
+    assert client.stats["errors"] == 3 and client.stats["breaker_skips"] == 1
+
+
+def test_non_object_json_is_an_engine_failure(stub, monkeypatch):
+    monkeypatch.setattr(engine_stub_server, "stub_vote", lambda engine, asset: ["buy"])
+    client = stub({"grok": FAST, "chatgpt": FAST})
+    result = asyncio.run(client.gather_votes("AAPL", quorum=1))
+
+    assert set(result["failed"]) == {"grok", "chatgpt"}
+    assert "JSON object" in result["failed"]["grok"]
+    assert not result["votes"] and not result["quorum"]
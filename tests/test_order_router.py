@@ -0,0 +1,88 @@
+import asyncio, random, time
+from collections import Counter
+
+from modules.order_router import Order, OrderRouter, SimulatedBroker
+
+N_ORDERS = 5_000
+
+
+# Submit `n` market orders through a two-venue router and wait for every one to close
+def route(n, sinks=()):
+    async def run():
+        router = OrderRouter(
+            {"equities_sim": SimulatedBroker("equities_sim", latency=0.001, jitter=0.0005, seed=1),
+             "crypto_sim": SimulatedBroker("crypto_sim", latency=0.002, jitter=0.001, partial_rate=0.3, seed=2)},
+            routes={"btc": "crypto_sim", "eth": "crypto_sim"}, sinks=sinks)
+        await router.start()
+        rng = random.Random(3)
+        started = time.perf_counter()
+        orders = []
+        for _ in range(n):
+            order = Order(rng.choice(("aapl", "msft", "btc", "eth")), rng.choice(("buy", "sell")), rng.choice((50, 100)))
+            orders.append(await router.submit(order))
+        await asyncio.gather(*(o.done for o in orders))
+        await router.drain()
+        elapsed = time.perf_counter() - started
+        await router.stop()
+        return router, orders, elapsed
+
+    return asyncio.run(run())
+
+
+def test_every_order_fills_in_full():
+    seen = []
+    router, orders, _ = route(N_ORDERS, sinks=[lambda fills, closed: seen.extend(fills)])
+
+    assert all(o.status == "filled" for o in orders)
+    assert not router.open_orders
+    filled = Counter()
+    for fill in seen:
+        filled[fill.order_id] += fill.quantity
+    assert all(filled[o.id] == o.quantity for o in orders)
+    assert router.stats["fills"] == len(seen) > N_ORDERS  # crypto_sim splits some orders in two
+    assert {o.venue for o in orders if o.asset in ("btc", "eth")} == {"crypto_sim"}
+
+
+def test_throughput_and_latency_stats():
+    router, orders, elapsed = route(N_ORDERS)
+
+    assert N_ORDERS / elapsed > 1_000  # thousands of orders per second
+    lat = router.latency_summary()
+    assert lat["orders"] == N_ORDERS
+    assert 0 < lat["p50_ms"] <= lat["p99_ms"] <= lat["max_ms"]
+    assert router.stats["batches"] < N_ORDERS  # orders are batched per broker call
+
+
+def test_failing_sink_is_counted_and_the_rest_still_run():
+    seen = []
+
+    def broken(fills, closed):
+        raise RuntimeError("disk full")
+
+    router, orders, _ = route(500, sinks=[broken, lambda fills, closed: seen.extend(fills)])
+
+    assert all(o.status == "filled" for o in orders)
+    assert router.stats["sink_errors"] == router.stats["batches"]
+    assert "disk full" in router.last_sink_error
+    assert sum(f.quantity for f in seen) == sum(o.quantity for o in orders)
+
+
+def test_order_cancelled_in_the_queue_never_fills():
+    async def run():
+        seen = []
+        router = OrderRouter({"equities_sim": SimulatedBroker("equities_sim", latency=0.001, seed=1)},
+                             sinks=[lambda fills, closed: seen.extend(fills)])
+        await router.start()
+        orders = [await router.submit(Order("aapl", "buy", 100)) for _ in range(20)]
+        cancelled = orders[::2]
+        assert all(router.cancel(o) for o in cancelled)  # the worker hasn't picked them up yet
+        await asyncio.gather(*(o.done for o in orders))
+        await router.drain()
+        await router.stop()
+        return router, orders, cancelled, seen
+
+    router, orders, cancelled, seen = asyncio.run(run())
+
+    assert all(o.status == "cancelled" and not o.fills for o in cancelled)
+    assert {f.order_id for f in seen} == {o.id for o in orders if o not in cancelled}
+    assert router.stats["cancelled"] == len(cancelled) and not router.open_orders
@@ -0,0 +1,30 @@
+from datetime import date
+
+from modules import market_data_store, risk_engine
+from modules.risk_engine import RiskEngine
+
+
+def buy(asset, quantity=1):
+    return [{"asset": asset, "side": "buy", "quantity": quantity}]
+
+
+def test_missing_marks_are_retried_and_a_new_day_rolls_the_counters(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_data_store, "STORE_ROOT", str(tmp_path))
+    engine = RiskEngine()
+    assert engine.check(buy("aapl"))["blocked_by"].iat[0] == "market_data"
+
+    market_data_store.write_bars("AAPL", "1D", market_data_store.simulate_ohlcv("AAPL", bars=30))
+    engine.loaded_at[:] -= risk_engine.NAN_RETRY
+    assert engine.check(buy("aapl"))["approved"].iat[0]
+
+    engine.today_qty[:], engine.day = 5.0, "2000-01-01"
+    engine.check(buy("aapl"))
+    assert engine.day == date.today().isoformat() and not engine.today_qty.any()
+
+
+def test_app_asset_classes_are_priced_off_the_demo_series(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_data_store, "STORE_ROOT", str(tmp_path))
+    result = RiskEngine().check(buy("stocks") + buy("crypto") + buy("options"))
+
+    assert result["approved"].all() and (result["price"] > 0).all()
+    assert not market_data_store.has_series("STOCKS")  # the demo series is shared, nothing stored per class
@@ -0,0 +1,26 @@
+import math
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from modules import market_data_store, meta_learning_genome, module_dispatcher
+from modules.fusion_engine import FusionEngine
+from modules.meta_learning_genome import FusionWeightLearner
+
+
+def test_pattern_and_voting_streams_share_the_asset_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_data_store, "STORE_ROOT", str(tmp_path / "market"))
+    market_data_store.write_bars("STOCKS", "1D", market_data_store.simulate_ohlcv("STOCKS", bars=600))
+    engine = FusionEngine()
+    monkeypatch.setattr(module_dispatcher, "fusion_engine", engine)
+    monkeypatch.setattr("modules.fusion_engine.fusion_engine", engine)
+    monkeypatch.setattr(meta_learning_genome, "_learner", FusionWeightLearner(path=str(tmp_path / "weights.json")))
+
+    detected = module_dispatcher.scan_patterns("stocks", bars=600)
+    module_dispatcher.render_voting("stocks")
+
+    assert detected
+    row = engine.fused_signal("stocks")
+    assert math.isfinite(row["pattern_age"]) and math.isfinite(row["voting_age"])
+    assert {"voting", "pattern"} <= set(meta_learning_genome.entry_predictions("stocks"))